@@ -20,7 +20,7 @@ from app.models.user import User
 
 # 새로 추가한 협업 기능 모델 임포트
 from app.models.team import Team, TeamMember
-from app.models.tag import PDFFile, PDFTag, PDFTagMention
+from app.models.tag import PDFFile, PDFTag, PDFTagMention, PDFPageText, Hashtag, TagHashtag
 from app.models.notification import Notification
 from app.models.attendance import Attendance 
 from app.models.question import Question
@@ -0,0 +1,36 @@
+"""Add pdf_page_texts table for extracted page text
+
+Revision ID: 3b7e2d91c4a8
+Revises: fb361499556a
+Create Date: 2026-10-16 10:12:31.204118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e2d91c4a8'
+down_revision: Union[str, None] = 'fb361499556a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('pdf_page_texts',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('pdf_id', sa.Integer(), nullable=False),
+    sa.Column('page', sa.Integer(), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.ForeignKeyConstraint(['pdf_id'], ['pdf_files.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('pdf_id', 'page', name='uq_pdf_page_texts_pdf_id_page')
+    )
+    op.create_index(op.f('ix_pdf_page_texts_id'), 'pdf_page_texts', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_pdf_page_texts_id'), table_name='pdf_page_texts')
+    op.drop_table('pdf_page_texts')
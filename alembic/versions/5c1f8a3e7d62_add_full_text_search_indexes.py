@@ -0,0 +1,34 @@
+"""Add full-text search GIN indexes on annotation and page text
+
+Revision ID: 5c1f8a3e7d62
+Revises: 3b7e2d91c4a8
+Create Date: 2026-10-17 09:41:05.518230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1f8a3e7d62'
+down_revision: Union[str, None] = '3b7e2d91c4a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# app/services/search_service.py 의 검색 표현식과 동일해야 인덱스가 사용됨
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX ix_tags_content_fts ON tags "
+        "USING gin (to_tsvector('simple'::regconfig, content))"
+    )
+    op.execute(
+        "CREATE INDEX ix_pdf_page_texts_content_fts ON pdf_page_texts "
+        "USING gin (to_tsvector('simple'::regconfig, content))"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pdf_page_texts_content_fts', table_name='pdf_page_texts')
+    op.drop_index('ix_tags_content_fts', table_name='tags')
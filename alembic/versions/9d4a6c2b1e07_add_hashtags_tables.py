@@ -0,0 +1,75 @@
+"""Add normalized hashtags and tag_hashtags tables with backfill
+
+Revision ID: 9d4a6c2b1e07
+Revises: 5c1f8a3e7d62
+Create Date: 2026-10-17 11:03:48.271942
+
+"""
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4a6c2b1e07'
+down_revision: Union[str, None] = '5c1f8a3e7d62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# PDFProcessor.parse_mentions_and_tags 와 같은 패턴
+HASHTAG_PATTERN = re.compile(r"#(\w+)")
+BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    hashtags = op.create_table('hashtags',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_hashtags_id'), 'hashtags', ['id'], unique=False)
+    op.create_index(op.f('ix_hashtags_name'), 'hashtags', ['name'], unique=True)
+    tag_hashtags = op.create_table('tag_hashtags',
+    sa.Column('hashtag_id', sa.Integer(), nullable=False),
+    sa.Column('tag_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['hashtag_id'], ['hashtags.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('hashtag_id', 'tag_id')
+    )
+    op.create_index('ix_tag_hashtags_tag_id', 'tag_hashtags', ['tag_id'], unique=False)
+
+    # 기존 주석 내용에서 해시태그 추출하여 채우기
+    conn = op.get_bind()
+    tags = sa.table('tags', sa.column('id', sa.Integer), sa.column('content', sa.Text))
+
+    links = {}
+    result = conn.execution_options(stream_results=True).execute(sa.select(tags.c.id, tags.c.content))
+    for tag_id, content in result:
+        names = dict.fromkeys(h.lower()[:100] for h in HASHTAG_PATTERN.findall(content or ""))
+        if names:
+            links[tag_id] = list(names)
+
+    names = sorted({name for tag_names in links.values() for name in tag_names})
+    if not names:
+        return
+
+    op.bulk_insert(hashtags, [{'name': name} for name in names])
+    ids = dict(conn.execute(sa.select(hashtags.c.name, hashtags.c.id)).all())
+
+    rows = [
+        {'hashtag_id': ids[name], 'tag_id': tag_id}
+        for tag_id, tag_names in links.items()
+        for name in tag_names
+    ]
+    for start in range(0, len(rows), BATCH_SIZE):
+        op.bulk_insert(tag_hashtags, rows[start:start + BATCH_SIZE])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tag_hashtags_tag_id', table_name='tag_hashtags')
+    op.drop_table('tag_hashtags')
+    op.drop_index(op.f('ix_hashtags_name'), table_name='hashtags')
+    op.drop_index(op.f('ix_hashtags_id'), table_name='hashtags')
+    op.drop_table('hashtags')
@@ -0,0 +1,29 @@
+"""Add parsed mention_names and hashtag_names columns to tags
+
+Revision ID: a7c3e91d5f24
+Revises: e2b5f7a9c318
+Create Date: 2026-10-17 13:52:40.118375
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e91d5f24'
+down_revision: Union[str, None] = 'e2b5f7a9c318'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 기존 행은 NULL로 두고 `python -m app.db.backfill_tags` 로 채움 (배포 중 테이블 재작성 방지)
+def upgrade() -> None:
+    op.add_column('tags', sa.Column('mention_names', sa.JSON(), nullable=True))
+    op.add_column('tags', sa.Column('hashtag_names', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('tags', 'hashtag_names')
+    op.drop_column('tags', 'mention_names')
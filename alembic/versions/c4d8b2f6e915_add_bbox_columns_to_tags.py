@@ -0,0 +1,55 @@
+"""Add bounding box columns and per-page spatial index to tags
+
+Revision ID: c4d8b2f6e915
+Revises: a7c3e91d5f24
+Create Date: 2026-10-17 15:08:27.903146
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d8b2f6e915'
+down_revision: Union[str, None] = 'a7c3e91d5f24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tags', sa.Column('bbox_x1', sa.Float(), nullable=True))
+    op.add_column('tags', sa.Column('bbox_y1', sa.Float(), nullable=True))
+    op.add_column('tags', sa.Column('bbox_x2', sa.Float(), nullable=True))
+    op.add_column('tags', sa.Column('bbox_y2', sa.Float(), nullable=True))
+
+    # 기존 position(JSON)에서 정규화된 경계 상자 채우기 (좌표가 모두 숫자인 행만)
+    op.execute(
+        """
+        UPDATE tags SET
+            bbox_x1 = LEAST((position->>'x1')::float, (position->>'x2')::float),
+            bbox_y1 = LEAST((position->>'y1')::float, (position->>'y2')::float),
+            bbox_x2 = GREATEST((position->>'x1')::float, (position->>'x2')::float),
+            bbox_y2 = GREATEST((position->>'y1')::float, (position->>'y2')::float)
+        WHERE position IS NOT NULL
+          AND (position->>'x1') ~ '^-?[0-9]+(\\.[0-9]+)?$'
+          AND (position->>'y1') ~ '^-?[0-9]+(\\.[0-9]+)?$'
+          AND (position->>'x2') ~ '^-?[0-9]+(\\.[0-9]+)?$'
+          AND (position->>'y2') ~ '^-?[0-9]+(\\.[0-9]+)?$'
+        """
+    )
+
+    op.create_index(
+        'ix_tags_pdf_id_page_bbox', 'tags',
+        ['pdf_id', 'page', 'bbox_y1', 'bbox_y2', 'bbox_x1', 'bbox_x2'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tags_pdf_id_page_bbox', table_name='tags')
+    op.drop_column('tags', 'bbox_y2')
+    op.drop_column('tags', 'bbox_x2')
+    op.drop_column('tags', 'bbox_y1')
+    op.drop_column('tags', 'bbox_x1')
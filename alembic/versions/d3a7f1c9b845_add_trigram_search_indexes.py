@@ -0,0 +1,54 @@
+"""Replace token full-text indexes with pg_trgm indexes for substring search
+
+Revision ID: d3a7f1c9b845
+Revises: f18c5a7e2d40
+Create Date: 2026-10-18 10:12:37.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a7f1c9b845'
+down_revision: Union[str, None] = 'f18c5a7e2d40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 검색은 ILIKE '%검색어%' 부분 문자열 일치 (조사가 붙은 한국어 단어, 단어 일부 검색 지원)
+# → app/services/search_service.py 의 조건에 gin_trgm_ops 인덱스가 사용됨
+TRIGRAM_INDEXES = [
+    ("ix_tags_content_trgm", "tags"),
+    ("ix_pdf_page_texts_content_trgm", "pdf_page_texts"),
+]
+
+# 단어 단위 일치 전용이라 더 이상 검색 조건에 사용되지 않는 인덱스
+FTS_INDEXES = [
+    ("ix_tags_content_fts", "tags"),
+    ("ix_pdf_page_texts_content_fts", "pdf_page_texts"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        for name, table in TRIGRAM_INDEXES:
+            # 이전에 실패한 CONCURRENTLY 생성이 남긴 INVALID 인덱스가 있으면 제거 후 다시 생성
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+            op.execute(f"CREATE INDEX CONCURRENTLY {name} ON {table} USING gin (content gin_trgm_ops)")
+        for name, _ in FTS_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table in FTS_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY {name} ON {table} "
+                "USING gin (to_tsvector('simple'::regconfig, content))"
+            )
+        for name, _ in reversed(TRIGRAM_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,32 @@
+"""Add composite indexes on mentions for mention lookups
+
+Revision ID: e2b5f7a9c318
+Revises: 9d4a6c2b1e07
+Create Date: 2026-10-17 12:26:19.640537
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b5f7a9c318'
+down_revision: Union[str, None] = '9d4a6c2b1e07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 고유 인덱스 생성 전 같은 주석의 중복 멘션 정리 (가장 먼저 생성된 행 유지)
+    op.execute(
+        "DELETE FROM mentions a USING mentions b "
+        "WHERE a.id > b.id AND a.tag_id = b.tag_id AND a.mentioned_user_id = b.mentioned_user_id"
+    )
+    op.create_index('uq_mentions_mentioned_user_id_tag_id', 'mentions', ['mentioned_user_id', 'tag_id'], unique=True)
+    op.create_index('ix_mentions_tag_id', 'mentions', ['tag_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_mentions_tag_id', table_name='mentions')
+    op.drop_index('uq_mentions_mentioned_user_id_tag_id', table_name='mentions')
@@ -0,0 +1,59 @@
+"""Add composite indexes for hot foreign-key filters (CONCURRENTLY)
+
+Revision ID: f18c5a7e2d40
+Revises: c4d8b2f6e915
+Create Date: 2026-10-17 16:31:55.472810
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f18c5a7e2d40'
+down_revision: Union[str, None] = 'c4d8b2f6e915'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# tags.pdf_id, (tags.pdf_id, tags.page) 는 ix_tags_pdf_id_page_bbox 의 선두 컬럼으로 처리됨
+# team_members.user_id 는 "사용자가 속한 팀" 서브쿼리(검색 권한 필터)용
+INDEXES = [
+    ("ix_tags_user_id", "tags", "user_id"),
+    ("ix_pdf_files_team_id", "pdf_files", "team_id"),
+    ("ix_pdf_files_owner_id", "pdf_files", "owner_id"),
+    ("ix_notifications_user_id_is_read_created_at", "notifications", "user_id, is_read, created_at"),
+    ("ix_notifications_created_at", "notifications", "created_at"),
+    ("ix_team_members_team_id_user_id", "team_members", "team_id, user_id"),
+    ("ix_team_members_user_id", "team_members", "user_id"),
+    ("ix_attendances_user_id_attendance_date", "attendances", "user_id, attendance_date"),
+]
+
+
+def _invalid_indexes(names) -> set:
+    """이전에 실패/중단된 CONCURRENTLY 생성이 남긴 INVALID 인덱스 이름"""
+    rows = op.get_bind().execute(
+        sa.text(
+            "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE NOT i.indisvalid AND c.relname = ANY(:names)"
+        ),
+        {"names": list(names)},
+    )
+    return {row[0] for row in rows}
+
+
+def upgrade() -> None:
+    # CONCURRENTLY 는 트랜잭션 밖에서만 실행 가능 → 운영 중 테이블 쓰기 잠금 없이 생성
+    with op.get_context().autocommit_block():
+        # IF NOT EXISTS 는 INVALID 인덱스도 "존재"로 보고 건너뛰므로 먼저 제거 (유효한 인덱스는 그대로 둠)
+        for name in _invalid_indexes(name for name, _, _ in INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        for name, table, columns in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -9,15 +9,22 @@ from app.schemas.tag import (
     AnnotationCreate, 
     AnnotationUpdate, 
     AnnotationResponse, 
-    AnnotationList
+    AnnotationList,
+    SearchResult,
+    HashtagCount
 )
 from app.services.tag_service import (
     create_pdf_annotation,
     update_pdf_annotation,
     delete_pdf_annotation,
     get_pdf_annotations,
-    search_annotations
+    search_annotations,
+    get_annotations_by_hashtag,
+    get_hashtag_counts,
+    get_annotations_by_mention,
+    get_annotations_by_username_mention
 )
+from app.services.search_service import search_documents
 
 router = APIRouter()
 
@@ -114,10 +121,40 @@ async def get_annotations(
     
     return result
 
+@router.get("/pdf/{pdf_id}/pages/{page}/region", response_model=AnnotationList)
+async def get_annotations_in_region(
+    pdf_id: int,
+    page: int,
+    x1: float = Query(..., ge=0, le=100),
+    y1: float = Query(..., ge=0, le=100),
+    x2: float = Query(..., ge=0, le=100),
+    y2: float = Query(..., ge=0, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """페이지 내 사각형 영역(뷰포트/선택 영역, 백분율 좌표)과 겹치는 주석 조회"""
+    result = await get_pdf_annotations(
+        db=db,
+        pdf_id=pdf_id,
+        user_id=current_user.id,
+        page=page,
+        region={"x1": x1, "y1": y1, "x2": x2, "y2": y2}
+    )
+    
+    if "error" in result:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=result["error"]
+        )
+    
+    return result
+
 @router.get("/search", response_model=List[AnnotationResponse])
 async def search_tags(
     query: str = Query(..., min_length=1),
     team_id: Optional[int] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -126,7 +163,61 @@ async def search_tags(
         db=db,
         user_id=current_user.id,
         query=query,
-        team_id=team_id
+        team_id=team_id,
+        skip=skip,
+        limit=limit
+    )
+    
+    if isinstance(result, dict) and "error" in result:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=result["error"]
+        )
+    
+    return result
+
+@router.get("/search/full-text", response_model=SearchResult)
+async def search_full_text(
+    query: str = Query(..., min_length=1),
+    team_id: Optional[int] = None,
+    scope: str = Query("all", pattern="^(all|annotations|pages)$"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """PDF 본문 및 주석 통합 전문 검색 (관련도 순, 페이지 번호와 스니펫 포함)"""
+    result = await search_documents(
+        db=db,
+        user_id=current_user.id,
+        query=query,
+        team_id=team_id,
+        scope=scope,
+        skip=skip,
+        limit=limit
+    )
+    
+    if "error" in result:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=result["error"]
+        )
+    
+    return result
+
+@router.get("/hashtags", response_model=List[HashtagCount])
+async def list_hashtags(
+    team_id: Optional[int] = None,
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """해시태그별 주석 수 집계 (많이 쓰인 순)"""
+    result = await get_hashtag_counts(
+        db=db,
+        user_id=current_user.id,
+        team_id=team_id,
+        limit=limit
     )
     
     if isinstance(result, dict) and "error" in result:
@@ -141,16 +232,46 @@ async def search_tags(
 async def get_by_hashtag(
     tag: str,
     team_id: Optional[int] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """해시태그별 주석 조회"""
-    # 해시태그는 #을 제외한 텍스트로 검색
-    result = await search_annotations(
+    # 해시태그는 #을 제외한 텍스트로 정확히 일치하는 것만 조회 (대소문자 무시)
+    result = await get_annotations_by_hashtag(
         db=db,
         user_id=current_user.id,
-        query=f"#{tag}",  # 해시태그 형식으로 검색
-        team_id=team_id
+        hashtag=tag,
+        team_id=team_id,
+        skip=skip,
+        limit=limit
+    )
+    
+    if isinstance(result, dict) and "error" in result:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=result["error"]
+        )
+    
+    return result
+
+@router.get("/mentions/me", response_model=List[AnnotationResponse])
+async def get_my_mentions(
+    team_id: Optional[int] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """나를 멘션한 주석 조회"""
+    result = await get_annotations_by_mention(
+        db=db,
+        user_id=current_user.id,
+        mentioned_user_id=current_user.id,
+        team_id=team_id,
+        skip=skip,
+        limit=limit
     )
     
     if isinstance(result, dict) and "error" in result:
@@ -165,16 +286,20 @@ async def get_by_hashtag(
 async def get_by_mention(
     username: str,
     team_id: Optional[int] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """멘션별 주석 조회"""
-    # 멘션은 @를 제외한 사용자명으로 검색
-    result = await search_annotations(
+    # 멘션은 @를 제외한 사용자명으로 정확히 일치하는 사용자만 조회 (mentions 테이블)
+    result = await get_annotations_by_username_mention(
         db=db,
         user_id=current_user.id,
-        query=f"@{username}",  # 멘션 형식으로 검색
-        team_id=team_id
+        username=username,
+        team_id=team_id,
+        skip=skip,
+        limit=limit
     )
     
     if isinstance(result, dict) and "error" in result:
@@ -1,5 +1,14 @@
 # app/api/v1/pdf_manager/__init__.py
 
-from .pdf_routes import router
+from fastapi import APIRouter
+
+from .pdf_routes import router as pdf_routes_router
+from .chunk_routes import router as chunk_routes_router
+from .text_routes import router as text_routes_router
+
+router = APIRouter()
+router.include_router(pdf_routes_router)
+router.include_router(chunk_routes_router)
+router.include_router(text_routes_router)
 
 __all__ = ["router"]
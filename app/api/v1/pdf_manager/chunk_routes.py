@@ -0,0 +1,102 @@
+# app/api/v1/pdf_manager/chunk_routes.py
+
+import asyncio
+from fastapi import APIRouter, HTTPException, Depends, Path, Query, Request
+from app.core.config import settings
+from app.services.file_service import FileOperationError
+from app.services.chunk_upload_service import ChunkUploadManager, UploadSessionResponse, run_chunk_gc
+
+router = APIRouter(prefix="/api/storage", tags=["PDF Manager"])
+
+# 의존성 주입
+def get_chunk_manager() -> ChunkUploadManager:
+    return ChunkUploadManager()
+
+# 백그라운드 작업 참조 유지 (GC로 인한 작업 취소 방지)
+_background_tasks = set()
+
+@router.on_event("startup")
+async def start_chunk_gc():
+    """📌 방치된 업로드 청크 정리 작업 시작"""
+    task = asyncio.create_task(run_chunk_gc(settings.UPLOAD_GC_INTERVAL))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+@router.post("/users/{user_id}/folders/{folder_name}/uploads",
+            response_model=UploadSessionResponse,
+            summary="이어올리기 업로드 세션 생성",
+            description="대용량 PDF를 청크 단위로 업로드하기 위한 세션을 생성합니다.")
+async def init_upload(
+    user_id: int = Path(...),
+    folder_name: str = Path(..., min_length=1, regex="^[a-zA-Z0-9ㄱ-ㅎ가-힣_\-(). ]+$"),
+    filename: str = Query(..., min_length=1, description="업로드할 PDF 파일명"),
+    total_size: int = Query(..., gt=0, description="전체 파일 크기 (bytes)"),
+    chunk_size: int = Query(None, gt=0, description="청크 크기 (bytes), 미지정 시 서버 기본값"),
+    manager: ChunkUploadManager = Depends(get_chunk_manager)
+):
+    """📌 업로드 세션 생성"""
+    try:
+        return await manager.init_session(user_id, folder_name, filename, total_size, chunk_size)
+    except FileOperationError as e:
+        raise HTTPException(status_code=e.code, detail=e.message)
+
+@router.get("/users/{user_id}/uploads/{upload_id}", response_model=UploadSessionResponse)
+async def get_upload_status(
+    user_id: int,
+    upload_id: str,
+    manager: ChunkUploadManager = Depends(get_chunk_manager)
+):
+    """📌 업로드 진행 상태 조회 (누락된 청크 번호 포함)"""
+    try:
+        return await manager.get_status(user_id, upload_id)
+    except FileOperationError as e:
+        raise HTTPException(status_code=e.code, detail=e.message)
+
+@router.put("/users/{user_id}/uploads/{upload_id}/chunks/{index}", response_model=UploadSessionResponse)
+async def upload_chunk(
+    request: Request,
+    user_id: int,
+    upload_id: str,
+    index: int = Path(..., ge=0),
+    manager: ChunkUploadManager = Depends(get_chunk_manager)
+):
+    """📌 청크 업로드 (요청 본문을 그대로 디스크에 스트리밍)"""
+    try:
+        return await manager.write_chunk(user_id, upload_id, index, request.stream())
+    except FileOperationError as e:
+        raise HTTPException(status_code=e.code, detail=e.message)
+
+@router.post("/users/{user_id}/uploads/{upload_id}/complete")
+async def complete_upload(
+    user_id: int,
+    upload_id: str,
+    manager: ChunkUploadManager = Depends(get_chunk_manager)
+):
+    """📌 모든 청크 병합 후 업로드 완료"""
+    try:
+        result = await manager.finalize(user_id, upload_id)
+        return {
+            "operation": "chunked_upload",
+            "user_id": user_id,
+            **result,
+            "status": "success"
+        }
+    except FileOperationError as e:
+        raise HTTPException(status_code=e.code, detail=e.message)
+
+@router.delete("/users/{user_id}/uploads/{upload_id}")
+async def abort_upload(
+    user_id: int,
+    upload_id: str,
+    manager: ChunkUploadManager = Depends(get_chunk_manager)
+):
+    """📌 업로드 취소"""
+    try:
+        await manager.abort(user_id, upload_id)
+        return {
+            "operation": "abort_upload",
+            "upload_id": upload_id,
+            "status": "success"
+        }
+    except FileOperationError as e:
+        raise HTTPException(status_code=e.code, detail=e.message)
@@ -1,23 +1,43 @@
 # app/api/v1/pdf_manager/pdf_routes.py
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Path, Query
-from typing import List
-from app.services.file_service import FileStorageManager, FileOperationError, FolderResponse
+import asyncio
+from fastapi import APIRouter, BackgroundTasks, UploadFile, File, HTTPException, Depends, Path, Query, Request, Response
+from typing import List, Optional
+from uuid import UUID
+from app.core.config import settings
+from app.core.redis_helper import set_upload_progress, get_upload_progress
+from app.core.fs_executor import fs_executor, run_fs
+from app.core.range_response import RangeFileResponse
+from app.services.listing_cache import listing_cache
+from app.services.pdf_text_service import ingest_saved_files
+from app.services.thumbnail_service import MEDIA_TYPES, ThumbnailCache, thumbnail_cache
+from app.services.file_service import AsyncFileStorageManager, FileOperationError, FolderResponse, run_blob_gc
 
 router = APIRouter(prefix="/api/storage", tags=["PDF Manager"])
 
 # 의존성 주입
-def get_storage_manager() -> FileStorageManager:
-    return FileStorageManager()
+def get_storage_manager() -> AsyncFileStorageManager:
+    return AsyncFileStorageManager()
+
+# 백그라운드 작업 참조 유지 (GC로 인한 작업 취소 방지)
+_background_tasks = set()
+
+@router.on_event("startup")
+async def start_blob_gc():
+    """📌 참조되지 않는 blob 정리 작업 시작"""
+    task = asyncio.create_task(run_blob_gc(settings.UPLOAD_GC_INTERVAL))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
 
 @router.post("/users/{user_id}/folders/{folder_name}/files", 
             summary="단일/다중 PDF 파일 업로드",
             description="PDF 파일을 한 개씩 순차적으로 업로드합니다.")
 async def upload_pdf(
+    background_tasks: BackgroundTasks,
     user_id: int = Path(...),
     folder_name: str = Path(..., min_length=1, regex="^[a-zA-Z0-9ㄱ-ㅎ가-힣_\-(). ]+$"),
     files: List[UploadFile] = File(...),
-    storage: FileStorageManager = Depends(get_storage_manager)
+    storage: AsyncFileStorageManager = Depends(get_storage_manager)
 ):
     
     """📌 여러 개의 PDF 파일 업로드 (비동기)"""
@@ -34,6 +54,9 @@ async def upload_pdf(
             "path": file_path
         })
 
+    # 등록된 PDF 문서의 페이지 텍스트 추출 (응답 후 실행)
+    background_tasks.add_task(ingest_saved_files, [f["path"] for f in saved_files])
+
     return {
         "operation": "upload",
         "user_id": user_id,
@@ -45,26 +68,77 @@ async def upload_pdf(
 async def get_files(
     user_id: int,
     folder_name: str = Path(..., regex="^[a-zA-Z0-9ㄱ-ㅎ가-힣_\-(). ]+$"),
-    storage: FileStorageManager = Depends(get_storage_manager)
+    storage: AsyncFileStorageManager = Depends(get_storage_manager)
 ):
     """📌 파일 목록 조회 API"""
     try:
-        file_list = storage.list_files(user_id, folder_name)
+        file_list = await storage.list_files(user_id, folder_name)
         return file_list
     except FileOperationError as e:
         raise HTTPException(status_code=e.code, detail=e.message)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"파일 목록 조회 실패: {str(e)}")
 
+@router.api_route("/users/{user_id}/folders/{folder_name}/files/{file_name}",
+                  methods=["GET", "HEAD"],
+                  summary="PDF 파일 다운로드 (Range 요청 지원)",
+                  description="Range/If-Range 부분 요청과 ETag 기반 조건부 요청(304)을 지원합니다.",
+                  response_class=RangeFileResponse)
+async def download_file(
+    request: Request,
+    user_id: int,
+    folder_name: str = Path(..., regex="^[a-zA-Z0-9ㄱ-ㅎ가-힣_\-(). ]+$"),
+    file_name: str = Path(..., regex="^[a-zA-Z0-9ㄱ-ㅎ가-힣_\-(). ]+$"),
+    storage: AsyncFileStorageManager = Depends(get_storage_manager)
+):
+    """📌 PDF 파일 다운로드 (PDF.js 부분 로딩용)"""
+    try:
+        file_path = await storage.get_file_path(user_id, folder_name, file_name)
+    except FileOperationError as e:
+        raise HTTPException(status_code=e.code, detail=e.message)
+
+    return RangeFileResponse(file_path, request.headers)
+
+@router.get("/users/{user_id}/folders/{folder_name}/files/{file_name}/pages/{page}/thumbnail",
+            summary="PDF 페이지 썸네일 조회",
+            description="서버에서 렌더링한 페이지 이미지를 반환합니다. (내용 해시 기반 강한 ETag, 304 지원)")
+async def get_page_thumbnail(
+    request: Request,
+    user_id: int,
+    folder_name: str = Path(..., regex="^[a-zA-Z0-9ㄱ-ㅎ가-힣_\-(). ]+$"),
+    file_name: str = Path(..., regex="^[a-zA-Z0-9ㄱ-ㅎ가-힣_\-(). ]+$"),
+    page: int = Path(..., ge=1),
+    zoom: float = Query(0.25, ge=0.05, le=4.0, description="렌더링 배율 (1.0 = 72dpi)"),
+    format: str = Query("png", regex="^(png|jpeg)$"),
+    storage: AsyncFileStorageManager = Depends(get_storage_manager)
+):
+    """📌 문서 목록/주석 사이드바용 페이지 썸네일"""
+    # 캐시 키/ETag와 실제 렌더링이 같은 배율을 쓰도록 한 번만 양자화 (0.251과 0.254는 같은 0.25로 렌더링)
+    zoom = round(zoom, 2)
+    try:
+        file_path = await storage.get_file_path(user_id, folder_name, file_name)
+        digest = await run_fs(thumbnail_cache.file_digest, file_path)
+
+        etag = ThumbnailCache.make_etag(digest, page, zoom, format)
+        headers = {"ETag": etag, "Cache-Control": "private, max-age=86400"}
+        if_none_match = request.headers.get("if-none-match", "")
+        if etag in [t.strip() for t in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+
+        image = await thumbnail_cache.get_or_render(file_path, digest, page, zoom, format)
+        return Response(content=image, media_type=MEDIA_TYPES[format], headers=headers)
+    except FileOperationError as e:
+        raise HTTPException(status_code=e.code, detail=e.message)
+
 @router.put("/users/{user_id}/folders/{folder_name}")
 async def create_folder(
     user_id: int,
     folder_name: str = Path(..., regex="^[a-zA-Z0-9ㄱ-ㅎ가-힣_\-(). ]+$"),
-    storage: FileStorageManager = Depends(get_storage_manager)
+    storage: AsyncFileStorageManager = Depends(get_storage_manager)
 ):
     """📌 폴더 생성 (멱등성 보장)"""
     try:
-        folder_path = storage.create_folder(user_id, folder_name)
+        folder_path = await storage.create_folder(user_id, folder_name)
         return {
             "operation": "create_folder",
             "path": str(folder_path),
@@ -78,10 +152,10 @@ async def remove_file(
     user_id: int,
     folder_name: str = Path(..., regex="^[a-zA-Z0-9ㄱ-ㅎ가-힣_\-(). ]+$"),
     file_name: str = Path(..., regex="^[a-zA-Z0-9ㄱ-ㅎ가-힣_\-(). ]+$"),
-    storage: FileStorageManager = Depends(get_storage_manager)
+    storage: AsyncFileStorageManager = Depends(get_storage_manager)
 ):
     """📌 파일 삭제"""
-    storage.delete_file(user_id, folder_name, file_name)
+    await storage.delete_file(user_id, folder_name, file_name)
     return {
         "operation": "delete_file",
         "target": file_name,
@@ -92,10 +166,10 @@ async def remove_file(
 async def remove_folder(
     user_id: int,
     folder_name: str = Path(..., regex="^[a-zA-Z0-9ㄱ-ㅎ가-힣_\-(). ]+$"),
-    storage: FileStorageManager = Depends(get_storage_manager)
+    storage: AsyncFileStorageManager = Depends(get_storage_manager)
 ):
     """📌 폴더 재귀적 삭제"""
-    storage.delete_folder(user_id, folder_name)
+    await storage.delete_folder(user_id, folder_name)
     return {
         "operation": "delete_folder",
         "target": folder_name,
@@ -107,21 +181,33 @@ async def remove_folder(
             summary="다중 PDF 일괄 업로드 (병렬)",
             description="최대 10개의 PDF 파일을 병렬로 일괄 업로드합니다.")
 async def upload_multiple_pdfs(
+    background_tasks: BackgroundTasks,
     user_id: int,
     folder_name: str = Path(..., regex="^[a-zA-Z0-9ㄱ-ㅎ가-힣_\-(). ]+$"),
     files: List[UploadFile] = File(...),
     overwrite: bool = False,
-    storage: FileStorageManager = Depends(get_storage_manager)
+    concurrency: Optional[int] = Query(None, ge=1, le=10, description="동시 처리 파일 수 (서버 메모리 예산 내로 제한)"),
+    batch_id: Optional[UUID] = Query(None, description="진행률 조회용 클라이언트 지정 ID"),
+    storage: AsyncFileStorageManager = Depends(get_storage_manager)
 ):
     """📌 다중 PDF 업로드 (최대 10개/요청)"""
     if len(files) > 10:
         raise HTTPException(400, "최대 10개 파일까지 일괄 업로드 가능")
 
-    results = await storage.save_multiple_pdfs(user_id, folder_name, files, overwrite)
+    progress = None
+    if batch_id:
+        async def progress(filename: str, written: int, total: Optional[int], status: str) -> None:
+            await set_upload_progress(f"{user_id}:{batch_id}", filename, written, total, status, settings.UPLOAD_PROGRESS_TTL)
+
+    results = await storage.save_multiple_pdfs(user_id, folder_name, files, overwrite, concurrency, progress)
+
+    # 등록된 PDF 문서의 페이지 텍스트 추출 (응답 후 실행)
+    background_tasks.add_task(ingest_saved_files, [f["path"] for f in results["success"]])
     
     return {
         "operation": "batch_upload",
         "user_id": user_id,
+        "batch_id": str(batch_id) if batch_id else None,
         "summary": {
             "success_count": len(results["success"]),
             "failed_count": len(results["failed"])
@@ -129,6 +215,18 @@ async def upload_multiple_pdfs(
         "details": results
     }
 
+@router.get("/users/{user_id}/batch-upload/{batch_id}/progress",
+            summary="일괄 업로드 진행률 조회")
+async def get_batch_upload_progress(
+    user_id: int,
+    batch_id: UUID
+):
+    """📌 파일별 업로드 진행률 조회"""
+    return {
+        "batch_id": str(batch_id),
+        "files": await get_upload_progress(f"{user_id}:{batch_id}")
+    }
+
 @router.put("/users/{user_id}/folders/{old_folder}/files/{file_name}/move")
 async def move_file(
     user_id: int,
@@ -136,11 +234,11 @@ async def move_file(
     file_name: str = Path(..., regex="^[a-zA-Z0-9ㄱ-ㅎ가-힣_\-(). ]+$"),
     new_folder: str = Query(..., regex="^[a-zA-Z0-9ㄱ-ㅎ가-힣_\-(). ]+$"),
     create_if_not_exists: bool = Query(False, description="대상 폴더가 없을 경우 생성 여부"),
-    storage: FileStorageManager = Depends(get_storage_manager)
+    storage: AsyncFileStorageManager = Depends(get_storage_manager)
 ):
     """📌 파일 이동 API"""
     try:
-        new_path = storage.move_file(user_id, old_folder, file_name, new_folder, create_if_not_exists)
+        new_path = await storage.move_file(user_id, old_folder, file_name, new_folder, create_if_not_exists)
         return {
             "operation": "move",
             "original_path": f"/storage/{user_id}/{old_folder}/{file_name}",
@@ -159,10 +257,10 @@ async def rename_file(
     folder_name: str = Path(..., min_length=1, regex="^[a-zA-Z0-9ㄱ-ㅎ가-힣_\-(). ]+$"),
     file_name: str = Path(..., min_length=1, regex="^[a-zA-Z0-9ㄱ-ㅎ가-힣_\-(). ]+$"),
     new_name: str = Query(..., min_length=1, regex="^[a-zA-Z0-9ㄱ-ㅎ가-힣_\-(). ]+$"),
-    storage: FileStorageManager = Depends(get_storage_manager)
+    storage: AsyncFileStorageManager = Depends(get_storage_manager)
 ):
     """📌 파일 이름 변경 (확장자 유지, 중복 시 자동 숫자 추가)"""
-    new_path = storage.rename_file(user_id, folder_name, file_name, new_name)
+    new_path = await storage.rename_file(user_id, folder_name, file_name, new_name)
 
     return {
         "operation": "rename",
@@ -179,15 +277,20 @@ async def rename_file(
     response_model=List[FolderResponse]
 )
 async def get_user_folders(
+    response: Response,
     user_id: int = Path(..., description="대상 사용자 ID"),
     include_subfolders: bool = Query(False, description="1단계 하위 폴더 포함 여부"),
     skip: int = Query(0, ge=0, description="페이지네이션 시작 위치"),
-    limit: int = Query(100, le=1000, description="한 번에 가져올 최대 폴더 개수"),
-    storage: FileStorageManager = Depends(get_storage_manager)
+    limit: int = Query(100, ge=1, le=1000, description="한 번에 가져올 최대 폴더 개수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값 (지정 시 skip 무시)"),
+    storage: AsyncFileStorageManager = Depends(get_storage_manager)
 ):
-    """📌 계층적 폴더 구조 조회 (최대 1단계 하위 폴더 포함 가능)"""
+    """📌 계층적 폴더 구조 조회 (최대 1단계 하위 폴더 포함 가능, 다음 페이지 커서는 X-Next-Cursor 헤더로 반환)"""
     try:
-        return storage.list_folders(user_id, include_subfolders, skip, limit)
+        folders, next_cursor = await storage.list_folders_page(user_id, include_subfolders, skip, limit, cursor)
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return folders
     except FileOperationError as e:
         raise HTTPException(status_code=e.code, detail=e.message)
     except Exception as e:
@@ -201,11 +304,11 @@ async def move_folder(
     old_folder: str = Path(..., min_length=1, regex="^[a-zA-Z0-9ㄱ-ㅎ가-힣_\-(). ]+$"),
     new_folder: str = Path(..., min_length=1, regex="^[a-zA-Z0-9ㄱ-ㅎ가-힣_\-(). ]+$"),
     create_if_not_exists: bool = Query(False, description="대상 폴더가 없을 경우 생성 여부"),
-    storage: FileStorageManager = Depends(get_storage_manager)
+    storage: AsyncFileStorageManager = Depends(get_storage_manager)
 ):
     """📌 폴더 이동 API"""
     try:
-        new_path = storage.move_folder(user_id, old_folder, new_folder, create_if_not_exists)
+        new_path = await storage.move_folder(user_id, old_folder, new_folder, create_if_not_exists)
         return {
             "operation": "move_folder",
             "user_id": user_id,
@@ -218,3 +321,27 @@ async def move_folder(
         raise HTTPException(status_code=400, detail=e.message)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"폴더 이동 실패: {str(e)}")
+
+@router.get("/metrics/fs-executor", summary="파일시스템 스레드 풀 지표 조회")
+async def get_fs_executor_metrics():
+    """📌 파일시스템 스레드 풀 대기열 길이 및 처리 지표"""
+    return fs_executor.metrics()
+
+@router.get("/metrics/listing-cache", summary="파일/폴더 목록 캐시 지표 조회")
+async def get_listing_cache_metrics():
+    """📌 목록 캐시 적중/미스 지표"""
+    return listing_cache.stats()
+
+@router.get("/metrics/blob-store", summary="중복 제거 저장소 사용량 조회")
+async def get_blob_store_metrics(
+    storage: AsyncFileStorageManager = Depends(get_storage_manager)
+):
+    """📌 blob 수, 실제 저장 용량, 참조(하드링크) 수"""
+    if storage.storage.blobs is None:
+        return {"enabled": False}
+    return {"enabled": True, **await run_fs(storage.storage.blobs.usage)}
+
+@router.get("/metrics/thumbnail-cache", summary="페이지 썸네일 캐시 사용량 조회")
+async def get_thumbnail_cache_metrics():
+    """📌 캐시 항목 수, 사용 용량, 최대 용량"""
+    return await run_fs(thumbnail_cache.usage)
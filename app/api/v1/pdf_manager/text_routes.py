@@ -0,0 +1,81 @@
+# app/api/v1/pdf_manager/text_routes.py
+
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Path
+from sqlalchemy.orm import Session
+from app.api.deps import get_db, get_current_user
+from app.core.pdf_process_pool import start_process_pool, shutdown_process_pool
+from app.crud.crud_tag import get_pdf_by_id
+from app.crud.crud_team import check_user_in_team
+from app.models.tag import PDFFile
+from app.models.user import User
+from app.services.pdf_text_service import schedule_ingest, get_index_progress, get_page_text
+
+router = APIRouter(prefix="/api/storage", tags=["PDF Manager"])
+
+@router.on_event("startup")
+async def start_pdf_process_pool():
+    """📌 PDF 텍스트 추출/썸네일 렌더링용 프로세스 풀 시작 (요청 처리 전에 spawn)"""
+    start_process_pool()
+
+@router.on_event("shutdown")
+async def stop_pdf_process_pool():
+    """📌 프로세스 풀 종료"""
+    shutdown_process_pool()
+
+def _get_accessible_pdf(db: Session, pdf_id: int, user: User) -> PDFFile:
+    """📌 PDF 조회 및 접근 권한 확인 (소유자 또는 PDF가 속한 팀의 멤버만 허용)"""
+    pdf = get_pdf_by_id(db, pdf_id)
+    if not pdf:
+        raise HTTPException(status_code=404, detail="PDF 파일을 찾을 수 없습니다")
+    if pdf.owner_id != user.id and not (
+        pdf.team_id and check_user_in_team(db=db, team_id=pdf.team_id, user_id=user.id)
+    ):
+        raise HTTPException(status_code=403, detail="이 PDF에 접근할 권한이 없습니다")
+    return pdf
+
+@router.post("/pdfs/{pdf_id}/text-index",
+            summary="PDF 페이지 텍스트 추출 요청",
+            description="PyMuPDF로 페이지별 텍스트를 추출하여 검색 인덱스에 저장합니다. (백그라운드 실행)")
+async def request_text_index(
+    background_tasks: BackgroundTasks,
+    pdf_id: int = Path(...),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """📌 텍스트 추출(재색인) 요청"""
+    _get_accessible_pdf(db, pdf_id, current_user)
+
+    background_tasks.add_task(schedule_ingest, pdf_id)
+    return {
+        "operation": "text_index",
+        "pdf_id": pdf_id,
+        "status": "scheduled"
+    }
+
+@router.get("/pdfs/{pdf_id}/text-index", summary="PDF 텍스트 추출 진행률 조회")
+async def get_text_index_progress(
+    pdf_id: int = Path(...),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """📌 텍스트 추출 진행률 (status, total_pages, done_pages)"""
+    _get_accessible_pdf(db, pdf_id, current_user)
+    return await get_index_progress(pdf_id)
+
+@router.get("/pdfs/{pdf_id}/pages/{page}/text", summary="PDF 페이지 텍스트 조회")
+async def get_pdf_page_text(
+    pdf_id: int = Path(...),
+    page: int = Path(..., ge=1),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """📌 인덱싱된 페이지 텍스트 조회"""
+    _get_accessible_pdf(db, pdf_id, current_user)
+    content = get_page_text(db, pdf_id, page)
+    if content is None:
+        raise HTTPException(status_code=404, detail="인덱싱된 페이지 텍스트가 없습니다")
+    return {
+        "pdf_id": pdf_id,
+        "page": page,
+        "content": content
+    }
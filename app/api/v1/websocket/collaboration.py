@@ -0,0 +1,104 @@
+# app/api/v1/websocket/collaboration.py
+import logging
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
+from app.core.security import get_current_user_ws
+from app.core.redis_helper import get_all_cursor_positions
+from app.core.websocket_manager import cursor_stream, manager, presence
+from app.crud.crud_team import check_user_in_team
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+@router.on_event("shutdown")
+async def close_collaboration_pubsub():
+    """워커 종료 시 Redis PubSub 연결 정리"""
+    await manager.close()
+
+@router.get("/ws/metrics")
+async def get_collaboration_metrics():
+    """이 워커의 WebSocket 연결 수, 전송 대기열 깊이, 느린 클라이언트 종료 횟수"""
+    return {**manager.stats(), "cursor": cursor_stream.stats(), "presence": presence.stats()}
+
+@router.websocket("/ws/teams/{team_id}")
+async def collaboration_socket(websocket: WebSocket, team_id: int):
+    """
+    팀스페이스 실시간 협업 WebSocket
+
+    연결: /ws/teams/{team_id}?token=<access token>
+    클라이언트가 보낸 {"type": ..., ...} 메시지는 보낸 사람 정보를 붙여 같은 팀의 다른 참가자에게 전달됩니다.
+
+    커서 채널:
+    - {"type": "cursor", "pdf_id", "page", "position": {"x", "y"}}: 즉시 전달하지 않고 병합하여
+      tick마다 {"type": "cursors", "pdf_id", "cursors": {user_id: {...}}}로 방 전체에 전송
+      (다른 문서로 이동하면 이전 문서에 {"type": "cursor_leave", "pdf_id", "user_id"} 전송)
+    - {"type": "cursor_sync", "pdf_id"}: 문서의 현재 커서 위치 전체를 요청한 소켓에만 응답
+
+    접속자:
+    - 입장/퇴장/만료 시 {"type": "presence", "event": "join" | "leave" | "sync", "user_ids": [...]}를 방 전체에 전송
+    - {"type": "presence_sync"}: 현재 접속자 목록을 요청한 소켓에만 응답
+    """
+    user = await get_current_user_ws(websocket)
+    if user is None:
+        return
+
+    # 팀 멤버만 입장 가능
+    db = SessionLocal()
+    try:
+        is_member = check_user_in_team(db=db, team_id=team_id, user_id=user.id)
+    finally:
+        db.close()
+    if not is_member:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    room_id = str(team_id)
+    await manager.connect(websocket, room_id, user)
+    try:
+        await presence.join(room_id, str(user.id))
+        while True:
+            data = await websocket.receive_json()
+            if not isinstance(data, dict) or not isinstance(data.get("type"), str):
+                continue
+
+            if data["type"] == "cursor":
+                # 형식이 잘못된 커서(페이지 범위, x/y 외 필드 등)는 저장/전송하지 않고 무시
+                cursor_stream.update(room_id, str(user.id), data.get("pdf_id"), data.get("page"), data.get("position"))
+                continue
+
+            if data["type"] == "cursor_sync":
+                pdf_id = cursor_stream.document_id(data.get("pdf_id"))
+                if pdf_id is not None:
+                    manager.send_local(room_id, str(user.id), {
+                        "type": "cursors",
+                        "pdf_id": pdf_id,
+                        "cursors": await get_all_cursor_positions(room_id, pdf_id)
+                    })
+                continue
+
+            if data["type"] == "presence_sync":
+                manager.send_local(room_id, str(user.id), {
+                    "type": "presence",
+                    "event": "sync",
+                    "user_ids": await presence.online(room_id)
+                })
+                continue
+
+            await manager.broadcast_to_room(
+                room_id,
+                {
+                    **data,
+                    "user_id": str(user.id),
+                    "username": user.username
+                },
+                exclude_user=str(user.id)
+            )
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error(f"협업 WebSocket 오류 - 팀 ID: {team_id}, 사용자 ID: {user.id}, 오류: {str(e)}")
+    finally:
+        if await manager.disconnect(websocket, room_id, user):
+            await cursor_stream.leave(room_id, str(user.id))
+            await presence.leave(room_id, str(user.id))
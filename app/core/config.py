@@ -37,6 +37,42 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
 
+    # ✅ 파일 업로드 스트리밍 설정
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024            # 디스크 기록 단위 (1MB)
+    UPLOAD_MEMORY_LIMIT: int = 8 * 1024 * 1024      # 업로드 1건당 메모리 상한 (8MB)
+    BATCH_UPLOAD_CONCURRENCY: int = 3               # 일괄 업로드 동시 처리 파일 수
+    BATCH_UPLOAD_MEMORY_BUDGET: int = 16 * 1024 * 1024  # 일괄 업로드 요청 1건당 메모리 예산 (16MB)
+    UPLOAD_PROGRESS_TTL: int = 60 * 60              # 업로드 진행률 보관 시간 (초)
+
+    # ✅ 동일 내용 PDF 중복 제거 (SHA-256 콘텐츠 주소 저장소 + 하드링크)
+    STORAGE_DEDUP_ENABLED: bool = True
+
+    # ✅ 파일시스템 작업 전용 스레드 풀 크기
+    FS_THREAD_POOL_SIZE: int = 8
+
+    # ✅ PDF 텍스트 추출 설정 (PyMuPDF, 프로세스 풀)
+    PDF_PROCESS_WORKERS: int = 2                    # PDF 처리 프로세스 수
+    PDF_EXTRACT_BATCH_PAGES: int = 16               # 작업 1건당 추출 페이지 수
+
+    # ✅ 페이지 썸네일 디스크 캐시 최대 크기 (초과 시 오래된 항목부터 삭제)
+    THUMBNAIL_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+
+    # ✅ 이어올리기(청크) 업로드 설정
+    UPLOAD_MIN_CHUNK_SIZE: int = 256 * 1024         # 청크 1개 최소 크기 (256KB, 마지막 청크 제외)
+    UPLOAD_MAX_CHUNK_SIZE: int = 16 * 1024 * 1024   # 청크 1개 최대 크기 (16MB)
+    UPLOAD_MAX_FILE_SIZE: int = 4 * 1024 * 1024 * 1024  # 이어올리기 파일 1개 최대 크기 (4GB)
+    UPLOAD_MAX_CHUNKS: int = 10000                  # 세션 1개 최대 청크 수
+    UPLOAD_SESSION_TTL: int = 24 * 60 * 60          # 마지막 청크 수신 후 세션 유지 시간 (초)
+    UPLOAD_GC_INTERVAL: int = 60 * 60               # 방치된 청크 정리 주기 (초)
+
+    # ✅ 실시간 협업 WebSocket 설정
+    WS_SEND_QUEUE_SIZE: int = 256                   # 연결별 전송 대기열 최대 메시지 수 (초과 시 연결 종료)
+    WS_SEND_TIMEOUT: int = 10                       # 메시지 1건 전송 제한 시간 (초)
+    WS_CURSOR_TICK_HZ: int = 20                     # 커서 위치 일괄 전송 빈도 (초당 횟수)
+    WS_CURSOR_TTL: int = 60                         # 커서 위치 유지 시간 (초)
+    WS_PRESENCE_TTL: int = 60                       # 마지막 heartbeat 이후 접속 상태 유지 시간 (초)
+    WS_PRESENCE_INTERVAL: int = 15                  # 접속자 heartbeat 일괄 기록 및 만료 정리 주기 (초)
+
     # ✅ Kakao OAuth2 설정
     KAKAO_CLIENT_ID: str
     KAKAO_CLIENT_SECRET: str
@@ -88,7 +124,7 @@ class Settings(BaseSettings):
         raise ValueError(v)
 
     # ✅ 환경 변수에서 숫자 값이 문자열로 인식되는 문제 해결 (Pydantic v2 방식)
-    @field_validator("ACCESS_TOKEN_EXPIRE_MINUTES", "REFRESH_TOKEN_EXPIRE_DAYS", "OAUTH_REFRESH_TOKEN_EXPIRE_DAYS", "REDIS_PORT", "REDIS_DB", "REDIS_CACHE_PORT", "REDIS_CACHE_DB", "FILE_LIST_CACHE_TTL", "FOLDER_LIST_CACHE_TTL", mode='before')
+    @field_validator("ACCESS_TOKEN_EXPIRE_MINUTES", "REFRESH_TOKEN_EXPIRE_DAYS", "OAUTH_REFRESH_TOKEN_EXPIRE_DAYS", "REDIS_PORT", "REDIS_DB", "REDIS_CACHE_PORT", "REDIS_CACHE_DB", "FILE_LIST_CACHE_TTL", "FOLDER_LIST_CACHE_TTL", "UPLOAD_CHUNK_SIZE", "UPLOAD_MEMORY_LIMIT", "UPLOAD_MIN_CHUNK_SIZE", "UPLOAD_MAX_CHUNK_SIZE", "UPLOAD_MAX_FILE_SIZE", "UPLOAD_MAX_CHUNKS", "UPLOAD_SESSION_TTL", "UPLOAD_GC_INTERVAL", "BATCH_UPLOAD_CONCURRENCY", "BATCH_UPLOAD_MEMORY_BUDGET", "UPLOAD_PROGRESS_TTL", "FS_THREAD_POOL_SIZE", "PDF_PROCESS_WORKERS", "PDF_EXTRACT_BATCH_PAGES", "THUMBNAIL_CACHE_MAX_BYTES", "WS_SEND_QUEUE_SIZE", "WS_SEND_TIMEOUT", "WS_CURSOR_TICK_HZ", "WS_CURSOR_TTL", "WS_PRESENCE_TTL", "WS_PRESENCE_INTERVAL", mode='before')
     @classmethod
     def parse_int_values(cls, v: Union[str, int]) -> int:
         return int(v) if isinstance(v, str) else v
@@ -0,0 +1,116 @@
+# app/core/fs_executor.py
+
+import time
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, TypeVar
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class FilesystemExecutor:
+    """
+    파일시스템 블로킹 작업 전용 스레드 풀
+
+    rmtree, move, iterdir 등 동기 파일시스템 호출을 이벤트 루프 밖에서 실행하고,
+    대기열 길이 등 모니터링 지표를 수집합니다.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fs")
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._started = 0
+        self._completed = 0
+        self._failed = 0
+        self._max_queue_depth = 0
+        self._total_wait_seconds = 0.0
+
+    def _dequeue(self, state: Dict[str, bool]) -> None:
+        """대기열 카운터를 한 번만 감소 (lock 보유 상태에서 호출)"""
+        if not state["dequeued"]:
+            state["dequeued"] = True
+            self._queued -= 1
+
+    def _wrap(self, func: Callable[..., T], submitted_at: float, state: Dict[str, bool]) -> Callable[[], T]:
+        """대기열 → 실행 상태 전환과 완료 지표를 기록하는 래퍼"""
+        def _runner() -> T:
+            with self._lock:
+                self._dequeue(state)
+                self._running += 1
+                self._started += 1
+                self._total_wait_seconds += time.monotonic() - submitted_at
+            try:
+                result = func()
+            except BaseException:
+                with self._lock:
+                    self._failed += 1
+                raise
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+            return result
+        return _runner
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        동기 함수를 파일시스템 스레드 풀에서 실행
+
+        Args:
+            func: 실행할 동기 함수
+            *args, **kwargs: 함수 인자
+
+        Returns:
+            함수 실행 결과
+        """
+        with self._lock:
+            self._queued += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queued)
+
+        loop = asyncio.get_running_loop()
+        state = {"dequeued": False}
+        runner = self._wrap(partial(func, *args, **kwargs), time.monotonic(), state)
+        try:
+            return await loop.run_in_executor(self._executor, runner)
+        except asyncio.CancelledError:
+            # 실행 전에 취소된 작업은 대기열에서 제거
+            with self._lock:
+                self._dequeue(state)
+            raise
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        스레드 풀 모니터링 지표 조회
+
+        Returns:
+            대기열 길이, 실행 중 작업 수, 누적 완료/실패 수, 평균 대기 시간 등
+        """
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "queue_depth": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "failed": self._failed,
+                "max_queue_depth": self._max_queue_depth,
+                "avg_wait_ms": round(self._total_wait_seconds / self._started * 1000, 3) if self._started else 0.0
+            }
+
+
+# 프로세스당 하나의 풀을 공유
+fs_executor = FilesystemExecutor(max_workers=settings.FS_THREAD_POOL_SIZE)
+
+
+async def run_fs(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """파일시스템 스레드 풀에서 동기 함수 실행 (단축 함수)"""
+    return await fs_executor.run(func, *args, **kwargs)
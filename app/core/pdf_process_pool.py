@@ -0,0 +1,92 @@
+# app/core/pdf_process_pool.py
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+import fitz  # PyMuPDF
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# ------------------------------------------------------
+# 프로세스 풀 (PDF 파싱/렌더링은 GIL을 점유하므로 별도 프로세스에서 실행)
+# ------------------------------------------------------
+# 워커는 fork가 아닌 spawn으로 시작합니다. uvicorn 워커에는 파일시스템 스레드 풀, Redis 연결,
+# 이벤트 루프가 이미 떠 있어 fork 시 잠긴 lock과 소켓이 자식에게 복제될 수 있기 때문입니다.
+# spawn된 자식은 이 모듈만 다시 import하므로 여기에는 fitz와 설정 외의 의존성을 두지 않습니다.
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+def start_process_pool() -> ProcessPoolExecutor:
+    """PDF 처리 전용 프로세스 풀 생성 및 워커 미리 시작 (애플리케이션 시작 시)"""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=settings.PDF_PROCESS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        # 첫 요청이 워커 기동 시간을 기다리지 않도록 미리 시작
+        for _ in range(settings.PDF_PROCESS_WORKERS):
+            _process_pool.submit(_warm_up)
+        logger.info(f"PDF 프로세스 풀 시작 - 워커 {settings.PDF_PROCESS_WORKERS}개 (spawn)")
+    return _process_pool
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """PDF 처리 전용 프로세스 풀 반환 (시작 이벤트 없이 실행된 경우 이 시점에 생성)"""
+    return _process_pool or start_process_pool()
+
+def shutdown_process_pool() -> None:
+    """프로세스 풀 종료 (애플리케이션 종료 시)"""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+# ------------------------------------------------------
+# 워커 프로세스 작업
+# ------------------------------------------------------
+
+def _warm_up() -> None:
+    """[워커 프로세스] 기동 확인용 빈 작업"""
+
+def count_pages(path: str) -> int:
+    """[워커 프로세스] PDF 페이지 수 조회"""
+    with fitz.open(path) as doc:
+        return doc.page_count
+
+def extract_pages(path: str, start: int, end: int) -> List[Tuple[int, str]]:
+    """
+    [워커 프로세스] 지정한 페이지 범위의 텍스트 추출
+
+    Args:
+        path: PDF 파일 경로
+        start: 시작 페이지 (1부터 시작, 포함)
+        end: 끝 페이지 (포함)
+
+    Returns:
+        (페이지 번호, 텍스트) 목록
+    """
+    pages = []
+    with fitz.open(path) as doc:
+        for page_no in range(start, end + 1):
+            text = doc.load_page(page_no - 1).get_text("text")
+            # PostgreSQL TEXT에는 NUL 문자를 저장할 수 없음
+            pages.append((page_no, text.replace("\x00", "")))
+    return pages
+
+def render_page(path: str, page: int, zoom: float, fmt: str) -> bytes:
+    """
+    [워커 프로세스] PDF 페이지를 이미지로 렌더링
+
+    Raises:
+        IndexError: 존재하지 않는 페이지
+    """
+    with fitz.open(path) as doc:
+        if not 1 <= page <= doc.page_count:
+            raise IndexError(f"페이지 범위 초과: {page}/{doc.page_count}")
+        pix = doc.load_page(page - 1).get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+        if fmt == "jpeg":
+            return pix.tobytes("jpg", jpg_quality=80)
+        return pix.tobytes("png")
@@ -0,0 +1,191 @@
+# app/core/range_response.py
+
+import os
+import re
+import stat
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Optional, Tuple
+from urllib.parse import quote
+
+import aiofiles
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def make_etag(st: os.stat_result) -> str:
+    """파일 수정 시각(ns)과 크기로 강한 ETag 생성"""
+    return f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    단일 바이트 범위(Range) 헤더 파싱
+
+    Args:
+        header: Range 헤더 값 (예: "bytes=0-1023", "bytes=1024-", "bytes=-500")
+        size: 파일 크기
+
+    Returns:
+        (시작, 끝) 포함 범위. 다중 범위 등 지원하지 않는 형식이면 None (전체 응답)
+
+    Raises:
+        ValueError: 파일 범위를 벗어난 요청 (416)
+    """
+    match = _RANGE_PATTERN.match(header.strip())
+    if not match:
+        return None
+
+    start_str, end_str = match.groups()
+    if not start_str and not end_str:
+        return None
+
+    if not start_str:
+        # 접미사 범위: 마지막 N 바이트
+        length = int(end_str)
+        if length == 0:
+            raise ValueError("빈 범위")
+        return max(0, size - length), size - 1
+
+    start = int(start_str)
+    end = int(end_str) if end_str else size - 1
+    if start >= size or end < start:
+        raise ValueError("범위 초과")
+    return start, min(end, size - 1)
+
+
+class RangeFileResponse(Response):
+    """
+    HTTP Range 요청을 지원하는 파일 응답
+
+    - ETag(mtime+size) / Last-Modified 기반 조건부 요청(If-None-Match, If-Modified-Since → 304)
+    - Range / If-Range 기반 부분 응답(206), 범위 오류 시 416
+    - 서버가 ASGI `http.response.zerocopysend` 확장을 지원하면 커널 sendfile로 전송,
+      지원하지 않으면 고정 크기 청크로 스트리밍
+    """
+
+    chunk_size = 256 * 1024
+
+    def __init__(
+        self,
+        path: Path,
+        request_headers: Headers,
+        media_type: str = "application/pdf",
+        filename: Optional[str] = None
+    ):
+        self.path = path
+        self.request_headers = request_headers
+        self.media_type = media_type
+        self.filename = filename or path.name
+        self.background = None
+        self.status_code = 200
+        self.raw_headers = []
+
+    def _is_not_modified(self, etag: str, st: os.stat_result) -> bool:
+        """조건부 요청 검사 (If-None-Match 우선)"""
+        if_none_match = self.request_headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = [t.strip() for t in if_none_match.split(",")]
+            return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+        if_modified_since = self.request_headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                return int(st.st_mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def _if_range_matches(self, etag: str, last_modified: str) -> bool:
+        """If-Range 검사: 파일이 바뀌었으면 범위를 무시하고 전체 응답"""
+        if_range = self.request_headers.get("if-range")
+        return if_range is None or if_range.strip() in (etag, last_modified)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        send_body = scope["method"].upper() != "HEAD"
+
+        async with aiofiles.open(self.path, "rb") as f:
+            # 같은 파일 디스크립터로 stat → 응답 도중 파일이 교체되어도 일관된 내용 전송
+            st = os.fstat(f.fileno())
+            if not stat.S_ISREG(st.st_mode):
+                raise RuntimeError(f"File at path {self.path} is not a file.")
+
+            size = st.st_size
+            etag = make_etag(st)
+            last_modified = formatdate(st.st_mtime, usegmt=True)
+
+            headers = MutableHeaders(raw=self.raw_headers)
+            headers["accept-ranges"] = "bytes"
+            headers["etag"] = etag
+            headers["last-modified"] = last_modified
+            headers["cache-control"] = "private, no-cache"
+
+            if self._is_not_modified(etag, st):
+                self.status_code = 304
+                await self._send_empty(send)
+                return
+
+            start, end = 0, size - 1
+            range_header = self.request_headers.get("range")
+            if range_header and self._if_range_matches(etag, last_modified):
+                try:
+                    byte_range = parse_range(range_header, size)
+                except ValueError:
+                    self.status_code = 416
+                    headers["content-range"] = f"bytes */{size}"
+                    headers["content-length"] = "0"
+                    await self._send_empty(send)
+                    return
+                if byte_range is not None:
+                    start, end = byte_range
+                    self.status_code = 206
+                    headers["content-range"] = f"bytes {start}-{end}/{size}"
+
+            length = end - start + 1 if size else 0
+            headers["content-length"] = str(length)
+            headers["content-type"] = self.media_type
+            headers["content-disposition"] = f"inline; filename*=utf-8''{quote(self.filename)}"
+
+            await send({
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers
+            })
+            if not send_body or length == 0:
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+                return
+
+            if "http.response.zerocopysend" in scope.get("extensions", {}):
+                # 커널 sendfile: 페이지 캐시 → 소켓 직접 전송
+                with os.fdopen(os.dup(f.fileno()), "rb") as raw_file:
+                    await send({
+                        "type": "http.response.zerocopysend",
+                        "file": raw_file,
+                        "offset": start,
+                        "count": length,
+                        "more_body": False
+                    })
+                return
+
+            await f.seek(start)
+            remaining = length
+            while remaining > 0:
+                chunk = await f.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+            if remaining > 0:
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def _send_empty(self, send: Send) -> None:
+        """본문 없는 응답 (304, 416)"""
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers
+        })
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
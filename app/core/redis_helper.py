@@ -1,9 +1,10 @@
 # app/core/redis_helper.py
 
 import os
+import time
 import logging
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from functools import lru_cache
 from datetime import datetime, timedelta
 
@@ -140,6 +141,25 @@ def delete_key(key: str):
     except RedisError as e:
         logger.error(f"Redis 키 삭제 실패 - {key}, Error: {str(e)}")
         
+# ------------------------------------------------------
+# 캐시 전용 Redis 클라이언트 (REDIS_CACHE_* 설정 사용)
+# ------------------------------------------------------
+
+@lru_cache()
+def get_cache_redis_client() -> Redis:
+    """
+    캐시 전용 동기 Redis 클라이언트 인스턴스 반환 (싱글톤 패턴)
+    파일/폴더 목록 캐시, 파일명 할당 카운터 등에 사용됨
+    """
+    return Redis(
+        host=os.getenv("REDIS_CACHE_HOST", REDIS_HOST),
+        port=int(os.getenv("REDIS_CACHE_PORT", REDIS_PORT)),
+        db=int(os.getenv("REDIS_CACHE_DB", 1)),
+        decode_responses=True,
+        socket_connect_timeout=1,
+        socket_timeout=1
+    )
+
 # ------------------------------------------------------
 # 비동기 Redis 클라이언트 (실시간 협업용)
 # ------------------------------------------------------
@@ -177,6 +197,29 @@ async def publish_message(channel: str, message: Dict[str, Any]) -> int:
         logger.error(f"Redis 메시지 발행 실패 - 채널: {channel}, 오류: {str(e)}")
         return 0
 
+async def publish_messages(messages: List[Tuple[str, Dict[str, Any]]]) -> int:
+    """
+    여러 채널에 JSON 메시지를 파이프라인으로 한 번에 발행 (왕복 1회)
+    
+    Args:
+        messages: (채널명, 메시지) 목록
+        
+    Returns:
+        메시지를 받은 클라이언트 수 합계
+    """
+    if not messages:
+        return 0
+    
+    redis_client = get_redis_client()
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for channel, message in messages:
+                pipe.publish(channel, json.dumps(message))
+            return sum(await pipe.execute())
+    except Exception as e:
+        logger.error(f"Redis 메시지 일괄 발행 실패 - {len(messages)}건, 오류: {str(e)}")
+        return 0
+
 async def subscribe_channel(channel: str) -> aioredis.client.PubSub:
     """
     Redis 채널 구독
@@ -212,82 +255,199 @@ async def get_channel_messages(pubsub: aioredis.client.PubSub):
             except Exception as e:
                 logger.error(f"⚠️ Redis 메시지 파싱 실패: {str(e)}")
 
-async def get_team_presence(team_id: str) -> list:
+def _presence_key(team_id: str) -> str:
+    """팀 접속자 Sorted Set 키 (멤버: "사용자 ID:워커 ID", 점수: 마지막 heartbeat 시각)"""
+    return f"team_presence:{team_id}"
+
+def _presence_member(user_id: str, node_id: str) -> str:
+    """워커별 접속 멤버 (같은 사용자가 여러 워커에 연결되어도 각 연결을 따로 기록)"""
+    return f"{user_id}:{node_id}"
+
+def _presence_users(members: List[str]) -> List[str]:
+    """접속 멤버 목록을 중복 없는 사용자 ID 목록으로 변환 (순서 유지)"""
+    return list(dict.fromkeys(member.split(":", 1)[0] for member in members))
+
+async def get_team_presence(team_id: str, expiry_seconds: int = 300) -> list:
     """
-    팀스페이스에 현재 접속 중인 사용자 목록 조회
+    팀스페이스에 현재 접속 중인 사용자 목록 조회 (ZRANGEBYSCORE)
     
     Args:
         team_id: 팀 ID
+        expiry_seconds: 마지막 heartbeat 이후 접속 상태 유지 시간(초), 기본 5분
         
     Returns:
         접속 중인 사용자 ID 목록
     """
     redis_client = get_redis_client()
-    key = f"team_presence:{team_id}"
     try:
-        # Set에 저장된 모든 사용자 ID 가져오기
-        members = await redis_client.smembers(key)
-        return list(members)
+        # 만료 시각 이후에 heartbeat를 보낸 멤버만 조회 (정리 전의 만료 멤버 제외)
+        members = await redis_client.zrangebyscore(_presence_key(team_id), time.time() - expiry_seconds, "+inf")
+        return _presence_users(members)
     except Exception as e:
         logger.error(f"팀 접속자 목록 조회 실패 - 팀 ID: {team_id}, 오류: {str(e)}")
         return []
 
-async def add_user_to_team_presence(team_id: str, user_id: str, expiry_seconds: int = 300):
+async def record_presence_heartbeats(heartbeats: Dict[str, List[str]], node_id: str, expiry_seconds: int = 300) -> Dict[str, int]:
+    """
+    여러 팀의 접속자 heartbeat를 파이프라인으로 한 번에 기록 (팀당 ZADD 1회 + EXPIRE 1회)
+    
+    Args:
+        heartbeats: 팀 ID를 키로 하고 이 워커에 접속 중인 사용자 ID 목록을 값으로 하는 딕셔너리
+        node_id: 워커 ID
+        expiry_seconds: 마지막 heartbeat 이후 접속 상태 유지 시간(초), 기본 5분
+        
+    Returns:
+        팀 ID별 새로 추가된 멤버 수
+    """
+    heartbeats = {team_id: user_ids for team_id, user_ids in heartbeats.items() if user_ids}
+    if not heartbeats:
+        return {}
+    
+    redis_client = get_redis_client()
+    now = time.time()
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for team_id, user_ids in heartbeats.items():
+                key = _presence_key(team_id)
+                pipe.zadd(key, {_presence_member(user_id, node_id): now for user_id in user_ids})
+                # 아무도 heartbeat를 보내지 않는 팀의 키는 통째로 만료
+                pipe.expire(key, expiry_seconds * 2)
+            results = await pipe.execute()
+        return dict(zip(heartbeats, results[::2]))
+    except Exception as e:
+        logger.error(f"팀 접속자 heartbeat 기록 실패 - {len(heartbeats)}개 팀, 오류: {str(e)}")
+        return {}
+
+async def add_user_to_team_presence(team_id: str, user_id: str, node_id: str, expiry_seconds: int = 300) -> bool:
     """
-    팀스페이스 접속자 목록에 사용자 추가 (일정 시간 후 자동 만료)
+    팀스페이스 접속자 목록에 이 워커의 연결 추가 (마지막 heartbeat 시각으로 기록, 만료는 정리 작업에서 처리)
+    
+    추가와 접속자 조회를 MULTI 1회로 묶어 여러 워커에 동시에 접속해도 한 곳에서만 새 접속으로 판단합니다.
     
     Args:
         team_id: 팀 ID
         user_id: 사용자 ID
+        node_id: 워커 ID
         expiry_seconds: 만료 시간(초), 기본 5분
+        
+    Returns:
+        새로 접속한 사용자인지 여부 (다른 워커에 연결이 남아 있으면 False)
     """
     redis_client = get_redis_client()
-    key = f"team_presence:{team_id}"
-    
+    key = _presence_key(team_id)
+    member = _presence_member(user_id, node_id)
+    now = time.time()
     try:
-        # Set에 사용자 ID 추가
-        await redis_client.sadd(key, user_id)
-        
-        # 사용자별 만료 시간 설정
-        user_key = f"team_presence:{team_id}:user:{user_id}"
-        await redis_client.set(user_key, "1", ex=expiry_seconds)
-        
-        # 만료 시 자동으로 Set에서 제거하는 스크립트 등록
-        script = """
-        if redis.call('exists', KEYS[2]) == 0 then
-            return redis.call('srem', KEYS[1], ARGV[1])
-        end
-        return 0
-        """
-        await redis_client.eval(
-            script, 
-            2,  # 키 개수
-            key,  # KEYS[1]
-            user_key,  # KEYS[2]
-            user_id  # ARGV[1]
-        )
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.zadd(key, {member: now})
+            pipe.expire(key, expiry_seconds * 2)
+            pipe.zrangebyscore(key, now - expiry_seconds, "+inf")
+            added, _, members = await pipe.execute()
+        others = [m for m in members if m != member and m.split(":", 1)[0] == user_id]
+        return added > 0 and not others
     except Exception as e:
         logger.error(f"팀 접속자 추가 실패 - 팀 ID: {team_id}, 사용자 ID: {user_id}, 오류: {str(e)}")
+        return False
 
-async def remove_user_from_team_presence(team_id: str, user_id: str):
+async def remove_user_from_team_presence(team_id: str, user_id: str, node_id: str, expiry_seconds: int = 300) -> bool:
     """
-    팀스페이스 접속자 목록에서 사용자 제거
+    팀스페이스 접속자 목록에서 이 워커의 연결 제거
+    
+    다른 워커에 같은 사용자의 연결이 남아 있으면 접속 상태를 유지합니다.
+    (비정상 종료된 워커의 멤버는 heartbeat가 끊겨 정리 작업에서 제거됨)
     
     Args:
         team_id: 팀 ID
         user_id: 사용자 ID
+        node_id: 워커 ID
+        expiry_seconds: 마지막 heartbeat 이후 접속 상태 유지 시간(초), 기본 5분
+        
+    Returns:
+        사용자가 완전히 퇴장했는지 여부 (이 연결을 제거했고 남은 연결이 없는 경우)
     """
     redis_client = get_redis_client()
-    key = f"team_presence:{team_id}"
-    user_key = f"team_presence:{team_id}:user:{user_id}"
-    
+    key = _presence_key(team_id)
     try:
-        # Set에서 사용자 ID 제거
-        await redis_client.srem(key, user_id)
-        # 사용자 만료 키도 제거
-        await redis_client.delete(user_key)
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.zrem(key, _presence_member(user_id, node_id))
+            pipe.zrangebyscore(key, time.time() - expiry_seconds, "+inf")
+            removed, members = await pipe.execute()
+        return removed > 0 and user_id not in _presence_users(members)
     except Exception as e:
         logger.error(f"팀 접속자 제거 실패 - 팀 ID: {team_id}, 사용자 ID: {user_id}, 오류: {str(e)}")
+        return False
+
+async def sweep_team_presence(team_ids: List[str], expiry_seconds: int = 300) -> Dict[str, List[str]]:
+    """
+    heartbeat가 끊긴 접속 멤버 정리 (팀별 ZRANGEBYSCORE + ZREMRANGEBYSCORE + 남은 멤버 ZRANGEBYSCORE)
+    
+    모든 팀의 조회와 삭제를 MULTI 1회로 묶어 여러 워커가 동시에 정리해도 같은 사용자가 한 번만 반환됩니다.
+    
+    Args:
+        team_ids: 정리할 팀 ID 목록
+        expiry_seconds: 마지막 heartbeat 이후 접속 상태 유지 시간(초), 기본 5분
+        
+    Returns:
+        팀 ID별 퇴장 처리된 사용자 ID 목록 (만료된 멤버 중 다른 연결이 남지 않은 사용자가 있는 팀만)
+    """
+    if not team_ids:
+        return {}
+    
+    redis_client = get_redis_client()
+    cutoff = time.time() - expiry_seconds
+    try:
+        async with redis_client.pipeline(transaction=True) as pipe:
+            for team_id in team_ids:
+                key = _presence_key(team_id)
+                pipe.zrangebyscore(key, "-inf", f"({cutoff}")
+                pipe.zremrangebyscore(key, "-inf", f"({cutoff}")
+                pipe.zrange(key, 0, -1)
+            results = await pipe.execute()
+        removed = {}
+        for team_id, expired, remaining in zip(team_ids, results[::3], results[2::3]):
+            online = set(_presence_users(remaining))
+            users = [user_id for user_id in _presence_users(expired) if user_id not in online]
+            if users:
+                removed[team_id] = users
+        return removed
+    except Exception as e:
+        logger.error(f"팀 접속자 만료 정리 실패 - {len(team_ids)}개 팀, 오류: {str(e)}")
+        return {}
+
+def _cursor_key(team_id: str, pdf_id: str) -> str:
+    """문서별 커서 위치 Hash 키 (필드: 사용자 ID)"""
+    return f"cursor_positions:{team_id}:{pdf_id}"
+
+async def store_cursor_positions(team_id: str, pdf_id: str, cursors: Dict[str, Dict[str, Any]], expiry_seconds: int = 60):
+    """
+    여러 사용자의 커서 위치를 문서별 Hash에 한 번에 저장 (HSET 1회 + EXPIRE 1회)
+    
+    Hash 필드에는 개별 만료 시간이 없으므로 값에 만료 시각(expires_at)을 함께 저장하고,
+    조회 시 만료된 필드를 걸러내어 삭제합니다. 키 자체도 마지막 갱신 후 expiry_seconds 뒤 만료됩니다.
+    
+    Args:
+        team_id: 팀 ID
+        pdf_id: PDF 문서 ID
+        cursors: 사용자 ID를 키로 하고 커서 정보(page, position, updated_at)를 값으로 하는 딕셔너리
+        expiry_seconds: 만료 시간(초), 기본 1분
+    """
+    if not cursors:
+        return
+    
+    redis_client = get_redis_client()
+    key = _cursor_key(team_id, pdf_id)
+    expires_at = time.time() + expiry_seconds
+    
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.hset(key, mapping={
+                user_id: json.dumps({**data, "expires_at": expires_at})
+                for user_id, data in cursors.items()
+            })
+            pipe.expire(key, expiry_seconds)
+            await pipe.execute()
+    except Exception as e:
+        logger.error(f"커서 위치 저장 실패 - 팀 ID: {team_id}, PDF ID: {pdf_id}, {len(cursors)}건, 오류: {str(e)}")
 
 async def store_cursor_position(team_id: str, user_id: str, pdf_id: str, page: int, position: Dict[str, float], expiry_seconds: int = 60):
     """
@@ -301,23 +461,45 @@ async def store_cursor_position(team_id: str, user_id: str, pdf_id: str, page: i
         position: 커서 위치 좌표 (x, y)
         expiry_seconds: 만료 시간(초), 기본 1분
     """
-    redis_client = get_redis_client()
-    key = f"cursor_position:{team_id}:{pdf_id}:{user_id}"
+    await store_cursor_positions(
+        team_id,
+        pdf_id,
+        {user_id: {"page": page, "position": position, "updated_at": datetime.now().isoformat()}},
+        expiry_seconds
+    )
+
+async def remove_cursor_positions(team_id: str, pdf_id: str, user_ids: List[str]):
+    """
+    문서에서 여러 사용자의 커서 위치를 한 번에 제거 (HDEL 1회)
     
+    Args:
+        team_id: 팀 ID
+        pdf_id: PDF 문서 ID
+        user_ids: 사용자 ID 목록
+    """
+    if not user_ids:
+        return
+    
+    redis_client = get_redis_client()
     try:
-        data = {
-            "page": page,
-            "position": position,
-            "updated_at": datetime.now().isoformat()
-        }
-        # JSON으로 변환하여 저장
-        await redis_client.set(key, json.dumps(data), ex=expiry_seconds)
+        await redis_client.hdel(_cursor_key(team_id, pdf_id), *user_ids)
     except Exception as e:
-        logger.error(f"커서 위치 저장 실패 - 팀 ID: {team_id}, 사용자 ID: {user_id}, 오류: {str(e)}")
+        logger.error(f"커서 위치 제거 실패 - 팀 ID: {team_id}, PDF ID: {pdf_id}, {len(user_ids)}건, 오류: {str(e)}")
+
+async def remove_cursor_position(team_id: str, pdf_id: str, user_id: str):
+    """
+    문서에서 사용자의 커서 위치 제거 (문서를 떠나거나 연결 종료 시)
+    
+    Args:
+        team_id: 팀 ID
+        pdf_id: PDF 문서 ID
+        user_id: 사용자 ID
+    """
+    await remove_cursor_positions(team_id, pdf_id, [user_id])
 
 async def get_all_cursor_positions(team_id: str, pdf_id: str) -> Dict[str, Any]:
     """
-    특정 PDF 문서에 대한 모든 사용자의 커서 위치 조회
+    특정 PDF 문서에 대한 모든 사용자의 커서 위치 조회 (HGETALL 1회)
     
     Args:
         team_id: 팀 ID
@@ -327,28 +509,74 @@ async def get_all_cursor_positions(team_id: str, pdf_id: str) -> Dict[str, Any]:
         사용자 ID를 키로 하고 커서 위치 정보를 값으로 하는 딕셔너리
     """
     redis_client = get_redis_client()
-    pattern = f"cursor_position:{team_id}:{pdf_id}:*"
+    key = _cursor_key(team_id, pdf_id)
     
     try:
-        # 패턴에 일치하는 모든 키 조회
-        cursor = 0
+        entries = await redis_client.hgetall(key)
+        
+        now = time.time()
         result = {}
+        expired = []
+        for user_id, raw in entries.items():
+            data = json.loads(raw)
+            if data.pop("expires_at", 0) <= now:
+                expired.append(user_id)
+            else:
+                result[user_id] = data
         
-        while True:
-            cursor, keys = await redis_client.scan(cursor, match=pattern)
-            
-            for key in keys:
-                # 키에서 사용자 ID 추출
-                user_id = key.split(":")[-1]
-                # 커서 위치 데이터 조회
-                position_data = await redis_client.get(key)
-                if position_data:
-                    result[user_id] = json.loads(position_data)
-            
-            if cursor == 0:
-                break
+        # 만료된 필드 정리
+        if expired:
+            await redis_client.hdel(key, *expired)
         
         return result
     except Exception as e:
         logger.error(f"커서 위치 조회 실패 - 팀 ID: {team_id}, PDF ID: {pdf_id}, 오류: {str(e)}")
-        return {}
\ No newline at end of file
+        return {}
+
+# ------------------------------------------------------
+# 업로드 진행률 관련 함수
+# ------------------------------------------------------
+
+async def set_upload_progress(batch_id: str, filename: str, written: int, total: Optional[int], status: str, expiry_seconds: int = 3600):
+    """
+    일괄 업로드의 파일별 진행률 저장
+    
+    Args:
+        batch_id: 일괄 업로드 ID
+        filename: 원본 파일명
+        written: 기록된 바이트 수
+        total: 전체 파일 크기 (알 수 없으면 None)
+        status: uploading, done, failed
+        expiry_seconds: 만료 시간(초), 기본 1시간
+    """
+    redis_client = get_redis_client()
+    key = f"upload_progress:{batch_id}"
+    
+    try:
+        data = {"written": written, "total": total, "status": status}
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.hset(key, filename, json.dumps(data))
+            pipe.expire(key, expiry_seconds)
+            await pipe.execute()
+    except Exception as e:
+        logger.error(f"업로드 진행률 저장 실패 - 배치 ID: {batch_id}, 오류: {str(e)}")
+
+async def get_upload_progress(batch_id: str) -> Dict[str, Any]:
+    """
+    일괄 업로드의 파일별 진행률 조회
+    
+    Args:
+        batch_id: 일괄 업로드 ID
+        
+    Returns:
+        파일명을 키로 하고 진행률 정보를 값으로 하는 딕셔너리
+    """
+    redis_client = get_redis_client()
+    key = f"upload_progress:{batch_id}"
+    
+    try:
+        entries = await redis_client.hgetall(key)
+        return {filename: json.loads(data) for filename, data in entries.items()}
+    except Exception as e:
+        logger.error(f"업로드 진행률 조회 실패 - 배치 ID: {batch_id}, 오류: {str(e)}")
+        return {}
@@ -1,123 +1,640 @@
 # app/core/websocket_manager.py
 import json
-from typing import Dict, List, Optional, Set
+import math
+import os
+import uuid
+import asyncio
+import logging
+import itertools
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, Optional, Set, Tuple
 import redis.asyncio as redis
-from fastapi import WebSocket, WebSocketDisconnect, Depends
-from app.core.security import get_current_user_ws
+from fastapi import WebSocket, status
+from app.core.config import settings
+from app.core.redis_helper import (
+    add_user_to_team_presence,
+    get_redis_client,
+    get_team_presence,
+    record_presence_heartbeats,
+    remove_cursor_position,
+    remove_cursor_positions,
+    remove_user_from_team_presence,
+    store_cursor_positions,
+    sweep_team_presence,
+)
 from app.schemas.user import User
 
+logger = logging.getLogger(__name__)
+
+ROOM_CHANNEL = "room:{room_id}"
+USER_CHANNEL = "user:{user_id}"
+
+# 워커 프로세스 식별자 (자신이 발행한 메시지를 수신 시 건너뛰기 위함)
+NODE_ID = f"{os.getpid()}-{uuid.uuid4().hex[:12]}"
+
+# 워커별로 기억할 최근 수신 순번 수 (중복 수신 판별용)
+SEEN_WINDOW = 4096
+
+# 커서 메시지 허용 범위 (Redis Hash 값과 브로드캐스트 크기를 제한하기 위함)
+CURSOR_MAX_PAGE = 100000
+CURSOR_MAX_DOCUMENT_ID_LENGTH = 64
+CURSOR_POSITION_FIELDS = ("x", "y")
+
+class ClientConnection:
+    """
+    WebSocket 연결별 전송 대기열
+
+    브로드캐스트는 대기열에 넣기만 하고(대기 없음), 연결마다 하나인 writer 작업이 순서대로 전송합니다.
+    느린 클라이언트는 자기 대기열만 차오르며 다른 참가자에게 영향을 주지 않고,
+    대기열이 가득 차거나 전송이 제한 시간을 넘기면 연결을 종료합니다.
+    """
+    def __init__(self, websocket: WebSocket, max_queue: int, send_timeout: float):
+        self.websocket = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.send_timeout = send_timeout
+        self.sent = 0
+        self.closed = False
+        self._writer = asyncio.create_task(self._drain())
+
+    def offer(self, payload: str) -> bool:
+        """전송 대기열에 추가 (대기열이 가득 차면 False)"""
+        try:
+            self.queue.put_nowait(payload)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    async def _drain(self):
+        """대기열의 메시지를 순서대로 전송하는 writer 작업"""
+        try:
+            # wait_for는 전송 완료와 취소가 겹치면 취소를 삼킬 수 있으므로 closed로도 종료 확인
+            while not self.closed:
+                payload = await self.queue.get()
+                await asyncio.wait_for(self.websocket.send_text(payload), timeout=self.send_timeout)
+                self.sent += 1
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            logger.warning("WebSocket 전송 시간 초과 - 느린 클라이언트 연결 종료")
+            await self.close(status.WS_1013_TRY_AGAIN_LATER)
+        except Exception as e:
+            logger.debug(f"WebSocket 전송 실패: {str(e)}")
+            self.closed = True
+
+    async def close(self, code: int = status.WS_1000_NORMAL_CLOSURE):
+        """writer 작업 중지 및 소켓 종료 (수신 루프가 끊김을 감지하여 disconnect 처리)"""
+        if self.closed:
+            return
+        self.closed = True
+        if self._writer is not asyncio.current_task():
+            self._writer.cancel()
+        try:
+            await self.websocket.close(code=code)
+        except Exception:
+            pass
+
+    async def stop(self):
+        """연결 해제 시 writer 작업 정리"""
+        self.closed = True
+        self._writer.cancel()
+        try:
+            await self._writer
+        except (asyncio.CancelledError, Exception):
+            pass
+
+
 class ConnectionManager:
     """
     WebSocket 연결 및 방(팀스페이스) 관리 클래스
+
+    워커 프로세스마다 Redis PubSub 연결을 하나만 사용합니다.
+    이 워커에 접속자가 있는 방/사용자 채널만 동적으로 구독하고(첫 입장 시 구독, 마지막 퇴장 시 해제),
+    수신한 메시지를 로컬 소켓에 전달하므로 Redis 연결 수는 소켓 수와 무관하게 워커당 1개입니다.
+
+    메시지는 발행 시 한 번만 JSON으로 직렬화되고, 수신한 문자열을 그대로 각 연결의 전송 대기열에 넣습니다.
+
+    발행하는 메시지에는 워커 ID(origin)와 순번(seq)을 붙입니다.
+    자신의 로컬 소켓에는 즉시 전달하고, 수신 시 자신이 발행한 메시지와 이미 받은 순번은 건너뛰며,
+    수신한 메시지는 다시 발행하지 않으므로 각 워커는 메시지를 정확히 한 번만 전달합니다.
     """
-    def __init__(self, redis_client: redis.Redis):
-        self.redis = redis_client
-        self.active_connections: Dict[str, Dict[str, WebSocket]] = {}  # room_id -> {user_id: websocket}
+    def __init__(self, redis_client: Optional[redis.Redis] = None, node_id: str = NODE_ID):
+        self._redis = redis_client
+        self.node_id = node_id
+        self._seq = itertools.count(1)
+        self._seen: Dict[str, Tuple[Deque[int], Set[int]]] = {}  # origin -> 최근 전달한 순번
+        self.active_connections: Dict[str, Dict[str, ClientConnection]] = {}  # room_id -> {user_id: connection}
         self.user_to_rooms: Dict[str, Set[str]] = {}  # user_id -> set of room_ids
+        self._pubsub: Optional[redis.client.PubSub] = None
+        self._listener_task: Optional[asyncio.Task] = None
+        self._subscription_lock = asyncio.Lock()
+        self._evictions = 0
+        self._delivered = 0
+        self._published = 0
+        self._received = 0
+        self._duplicates = 0
+        self._pending_closes: Set[asyncio.Task] = set()
+
+    @property
+    def redis(self) -> redis.Redis:
+        """발행/구독용 비동기 Redis 클라이언트"""
+        if self._redis is None:
+            self._redis = get_redis_client()
+        return self._redis
+
+    # ------------------------------------------------------
+    # Redis 채널 구독 관리 (워커당 PubSub 1개)
+    # ------------------------------------------------------
+
+    async def _subscribe(self, *channels: str):
+        """채널 구독 추가 (수신 작업이 없으면 시작)"""
+        async with self._subscription_lock:
+            if self._pubsub is None:
+                self._pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+            await self._pubsub.subscribe(*channels)
+            if self._listener_task is None or self._listener_task.done():
+                self._listener_task = asyncio.create_task(self.listen_for_redis_messages())
+
+    async def _unsubscribe(self, *channels: str):
+        """채널 구독 해제"""
+        async with self._subscription_lock:
+            if self._pubsub is not None:
+                await self._pubsub.unsubscribe(*channels)
+
+    async def close(self):
+        """수신 작업 중지 및 PubSub 연결 종료 (애플리케이션 종료 시)"""
+        # 읽기 도중의 취소가 시간 초과로 바뀌어 삼켜지더라도 수신 루프가 종료 조건으로 빠져나오도록 먼저 해제
+        pubsub, self._pubsub = self._pubsub, None
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        if pubsub is not None:
+            await pubsub.aclose()
+
+    # ------------------------------------------------------
+    # 연결 관리
+    # ------------------------------------------------------
 
     async def connect(self, websocket: WebSocket, room_id: str, user: User):
         """사용자를 특정 방에 연결"""
         await websocket.accept()
-        
-        # 방이 없으면 초기화
+        user_id = str(user.id)
+
+        # 방이 없으면 초기화 (이 워커의 첫 접속자 → 방 채널 구독)
+        channels = []
         if room_id not in self.active_connections:
             self.active_connections[room_id] = {}
-        
-        # 사용자를 방에 추가
-        self.active_connections[room_id][str(user.id)] = websocket
-        
-        # 사용자가 속한 방 추적
-        if str(user.id) not in self.user_to_rooms:
-            self.user_to_rooms[str(user.id)] = set()
-        self.user_to_rooms[str(user.id)].add(room_id)
-        
-        # Redis 채널 구독
-        await self.redis.subscribe(f"room:{room_id}")
-        
+            channels.append(ROOM_CHANNEL.format(room_id=room_id))
+
+        # 사용자를 방에 추가 (같은 사용자의 이전 연결은 종료)
+        previous = self.active_connections[room_id].get(user_id)
+        if previous is not None:
+            await previous.close()
+        self.active_connections[room_id][user_id] = ClientConnection(
+            websocket, settings.WS_SEND_QUEUE_SIZE, settings.WS_SEND_TIMEOUT
+        )
+
+        # 사용자가 속한 방 추적 (이 워커의 첫 연결 → 개인 채널 구독)
+        if user_id not in self.user_to_rooms:
+            self.user_to_rooms[user_id] = set()
+            channels.append(USER_CHANNEL.format(user_id=user_id))
+        self.user_to_rooms[user_id].add(room_id)
+
+        if channels:
+            await self._subscribe(*channels)
+
         # 사용자 입장 알림
         await self.broadcast_to_room(
-            room_id, 
+            room_id,
             {
-                "type": "system", 
-                "message": f"{user.username} 님이 입장했습니다", 
-                "user_id": str(user.id)
+                "type": "system",
+                "message": f"{user.username} 님이 입장했습니다",
+                "user_id": user_id
             },
             exclude_user=None  # 모든 사용자에게 전송
         )
 
-    async def disconnect(self, websocket: WebSocket, room_id: str, user: User):
-        """사용자 연결 해제"""
+    async def disconnect(self, websocket: WebSocket, room_id: str, user: User) -> bool:
+        """사용자 연결 해제 (이미 새 소켓으로 교체된 연결이면 False)"""
         user_id = str(user.id)
-        
-        # 방에서 사용자 제거
-        if room_id in self.active_connections and user_id in self.active_connections[room_id]:
-            self.active_connections[room_id].pop(user_id)
-            
-            # 방이 비었다면 제거
-            if not self.active_connections[room_id]:
-                self.active_connections.pop(room_id)
-            
-            # 사용자의 방 추적 업데이트
-            if user_id in self.user_to_rooms:
-                self.user_to_rooms[user_id].discard(room_id)
-                if not self.user_to_rooms[user_id]:
-                    self.user_to_rooms.pop(user_id)
-            
-            # 방에 아무도 없다면 구독 해제
-            if room_id not in self.active_connections:
-                await self.redis.unsubscribe(f"room:{room_id}")
-            
-            # 퇴장 알림
-            await self.broadcast_to_room(
-                room_id, 
-                {
-                    "type": "system", 
-                    "message": f"{user.username} 님이 퇴장했습니다", 
-                    "user_id": user_id
-                },
-                exclude_user=user_id
-            )
 
-    async def send_personal_message(self, message: dict, user_id: str):
-        """특정 사용자에게 개인 메시지 전송"""
+        # 방에서 사용자 제거 (다른 소켓으로 재접속한 경우 새 연결은 유지)
+        room = self.active_connections.get(room_id)
+        if not room or user_id not in room or room[user_id].websocket is not websocket:
+            return False
+        await room.pop(user_id).stop()
+
+        channels = []
+        # 방이 비었다면 제거 (이 워커에 접속자가 없으면 구독 해제)
+        if not room:
+            self.active_connections.pop(room_id)
+            channels.append(ROOM_CHANNEL.format(room_id=room_id))
+
+        # 사용자의 방 추적 업데이트
         if user_id in self.user_to_rooms:
-            for room_id in self.user_to_rooms[user_id]:
-                if room_id in self.active_connections and user_id in self.active_connections[room_id]:
-                    await self.active_connections[room_id][user_id].send_json(message)
-        else:
-            # 사용자가 WebSocket으로 연결되어 있지 않은 경우, Redis를 통해 접속 시 전달
-            await self.redis.publish(f"user:{user_id}", json.dumps(message))
+            self.user_to_rooms[user_id].discard(room_id)
+            if not self.user_to_rooms[user_id]:
+                self.user_to_rooms.pop(user_id)
+                channels.append(USER_CHANNEL.format(user_id=user_id))
 
-    async def broadcast_to_room(self, room_id: str, message: dict, exclude_user: Optional[str] = None):
-        """방에 있는 모든 사용자에게 메시지 브로드캐스트"""
-        if room_id in self.active_connections:
-            for user_id, connection in self.active_connections[room_id].items():
-                if exclude_user is None or user_id != exclude_user:
-                    await connection.send_json(message)
-        
-        # 직접 연결되지 않은 클라이언트를 위해 Redis에도 발행
-        await self.redis.publish(f"room:{room_id}", json.dumps({
-            **message,
-            "exclude_user": exclude_user
+        if channels:
+            await self._unsubscribe(*channels)
+
+        # 퇴장 알림
+        await self.broadcast_to_room(
+            room_id,
+            {
+                "type": "system",
+                "message": f"{user.username} 님이 퇴장했습니다",
+                "user_id": user_id
+            },
+            exclude_user=user_id
+        )
+        return True
+
+    # ------------------------------------------------------
+    # 메시지 전송
+    # ------------------------------------------------------
+
+    def _enqueue(self, connection: ClientConnection, payload: str):
+        """연결의 전송 대기열에 추가 (가득 차면 느린 클라이언트로 보고 연결 종료)"""
+        if connection.closed:
+            return
+        if connection.offer(payload):
+            self._delivered += 1
+            return
+
+        self._evictions += 1
+        logger.warning(f"WebSocket 전송 대기열 초과 - 느린 클라이언트 연결 종료 (대기 {connection.queue.qsize()}건)")
+        task = asyncio.create_task(connection.close(status.WS_1013_TRY_AGAIN_LATER))
+        self._pending_closes.add(task)
+        task.add_done_callback(self._pending_closes.discard)
+
+    def _deliver_local(self, room_id: str, payload: str, exclude_user: Optional[str] = None):
+        """이 워커에 연결된 방 참가자의 전송 대기열에 추가 (대기 없음)"""
+        for user_id, connection in self.active_connections.get(room_id, {}).items():
+            if exclude_user is None or user_id != exclude_user:
+                self._enqueue(connection, payload)
+
+    def _deliver_personal(self, payload: str, user_id: str):
+        """이 워커에 연결된 사용자의 모든 소켓 전송 대기열에 추가"""
+        for room_id in self.user_to_rooms.get(user_id, ()):
+            connection = self.active_connections.get(room_id, {}).get(user_id)
+            if connection is not None:
+                self._enqueue(connection, payload)
+
+    async def _publish(self, channel: str, payload: str, **fields):
+        """워커 ID와 순번을 붙여 다른 워커로 발행"""
+        self._published += 1
+        await self.redis.publish(channel, json.dumps({
+            "origin": self.node_id,
+            "seq": next(self._seq),
+            "payload": payload,  # 클라이언트에 그대로 전송할 직렬화된 메시지
+            **fields
         }))
 
+    def _is_new(self, origin: str, seq: int) -> bool:
+        """다른 워커가 보낸 처음 받는 메시지인지 확인 (자신의 메시지, 중복 수신 제외)"""
+        if origin == self.node_id:
+            return False
+
+        # 발행은 여러 Redis 연결에서 동시에 일어날 수 있어 순번이 뒤바뀌어 도착할 수 있으므로
+        # 최대값 비교가 아닌 최근 순번 집합으로 중복을 판별
+        order, seen = self._seen.setdefault(origin, (deque(), set()))
+        if seq in seen:
+            self._duplicates += 1
+            return False
+        order.append(seq)
+        seen.add(seq)
+        if len(order) > SEEN_WINDOW:
+            seen.discard(order.popleft())
+        return True
+
+    def send_local(self, room_id: str, user_id: str, message: dict):
+        """이 워커에 연결된 특정 소켓에만 전송 (요청에 대한 응답 등)"""
+        connection = self.active_connections.get(room_id, {}).get(user_id)
+        if connection is not None:
+            self._enqueue(connection, json.dumps(message))
+
+    async def send_personal_message(self, message: dict, user_id: str):
+        """특정 사용자에게 개인 메시지 전송 (다른 워커에 연결된 경우도 개인 채널로 전달)"""
+        payload = json.dumps(message)
+        self._deliver_personal(payload, user_id)
+        await self._publish(USER_CHANNEL.format(user_id=user_id), payload)
+
+    async def broadcast_to_room(self, room_id: str, message: dict, exclude_user: Optional[str] = None):
+        """
+        방에 있는 모든 사용자에게 메시지 브로드캐스트
+
+        이 워커의 로컬 소켓에 바로 전달한 뒤 Redis 방 채널에 한 번 발행합니다.
+        다른 워커는 수신한 메시지를 각자의 로컬 소켓에만 전달합니다. (다시 발행하지 않음)
+        """
+        payload = json.dumps(message)
+        self._deliver_local(room_id, payload, exclude_user)
+        await self._publish(ROOM_CHANNEL.format(room_id=room_id), payload, exclude_user=exclude_user)
+
     async def listen_for_redis_messages(self):
-        """Redis 메시지를 수신하여 WebSocket 클라이언트에 전달하는 백그라운드 작업"""
-        pubsub = self.redis.pubsub()
-        
-        # 메시지 수신 처리
-        async for message in pubsub.listen():
-            if message["type"] == "message":
-                channel = message["channel"].decode("utf-8")
-                data = json.loads(message["data"].decode("utf-8"))
-                
-                # 방 브로드캐스트 처리
-                if channel.startswith("room:"):
-                    room_id = channel[5:]  # "room:" 접두사 제거
-                    exclude_user = data.pop("exclude_user", None)
-                    await self.broadcast_to_room(room_id, data, exclude_user)
-                
-                # 개인 메시지 처리
-                elif channel.startswith("user:"):
-                    user_id = channel[5:]  # "user:" 접두사 제거
-                    await self.send_personal_message(data, user_id)
\ No newline at end of file
+        """Redis 메시지를 수신하여 WebSocket 클라이언트에 전달하는 백그라운드 작업 (워커당 1개)"""
+        while self._pubsub is not None:
+            try:
+                message = await self._pubsub.get_message(timeout=1.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Redis 구독 메시지 수신 실패: {str(e)}")
+                await asyncio.sleep(1)
+                continue
+
+            if not message or message["type"] != "message":
+                continue
+
+            channel = message["channel"]
+            try:
+                envelope = json.loads(message["data"])
+            except (TypeError, ValueError) as e:
+                logger.error(f"⚠️ Redis 메시지 파싱 실패: {str(e)}")
+                continue
+
+            # 서비스 계층(알림 등)이 개인 채널에 직접 발행한 메시지는 워커 ID/순번이 없으므로
+            # 한 번만 발행되어 구독 중인 워커마다 한 번씩 수신됨 → 그대로 로컬 소켓에 전달
+            if not isinstance(envelope, dict) or "origin" not in envelope:
+                if channel.startswith("user:"):
+                    self._received += 1
+                    self._deliver_personal(message["data"], channel[5:])
+                else:
+                    logger.warning(f"워커 ID 없는 메시지 무시 - 채널: {channel}")
+                continue
+
+            try:
+                origin, seq, payload = envelope["origin"], envelope["seq"], envelope["payload"]
+            except KeyError as e:
+                logger.error(f"⚠️ Redis 메시지 파싱 실패: {str(e)}")
+                continue
+
+            # 자신이 발행한 메시지는 이미 로컬에 전달됨
+            if not self._is_new(origin, seq):
+                continue
+            self._received += 1
+
+            # 방 브로드캐스트 처리
+            if channel.startswith("room:"):
+                room_id = channel[5:]  # "room:" 접두사 제거
+                self._deliver_local(room_id, payload, envelope.get("exclude_user"))
+
+            # 개인 메시지 처리
+            elif channel.startswith("user:"):
+                user_id = channel[5:]  # "user:" 접두사 제거
+                self._deliver_personal(payload, user_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """이 워커의 연결/구독 현황 및 전송 대기열 지표"""
+        depths = [
+            connection.queue.qsize()
+            for room in self.active_connections.values()
+            for connection in room.values()
+        ]
+        return {
+            "node_id": self.node_id,
+            "rooms": len(self.active_connections),
+            "connections": len(depths),
+            "queued_messages": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "queue_capacity": settings.WS_SEND_QUEUE_SIZE,
+            "delivered": self._delivered,
+            "slow_consumer_evictions": self._evictions,
+            "published": self._published,
+            "received_from_other_nodes": self._received,
+            "duplicates_skipped": self._duplicates,
+            "subscribed_channels": len(self._pubsub.channels) if self._pubsub is not None else 0,
+            "listener_running": self._listener_task is not None and not self._listener_task.done()
+        }
+
+
+class CursorStream:
+    """
+    커서 위치 병합 전송
+
+    커서 이동은 즉시 전달하지 않고 문서별로 사용자당 마지막 위치만 모아 두었다가,
+    tick(WS_CURSOR_TICK_HZ)마다 문서당 메시지 1건으로 방에 브로드캐스트하고 Redis Hash에 한 번에 저장합니다.
+    접속자 수나 이동 빈도와 무관하게 문서당 tick당 발행 1회 + HSET/EXPIRE 1회로 제한됩니다.
+    """
+    def __init__(self, connection_manager: ConnectionManager, tick_hz: int, expiry_seconds: int):
+        self.manager = connection_manager
+        self.interval = 1 / tick_hz
+        self.expiry_seconds = expiry_seconds
+        self._pending: Dict[Tuple[str, str], Dict[str, dict]] = {}  # (room_id, pdf_id) -> {user_id: cursor}
+        self._documents: Dict[Tuple[str, str], str] = {}  # (room_id, user_id) -> 마지막 커서 문서 ID
+        self._departed: Dict[Tuple[str, str], Set[str]] = {}  # (room_id, pdf_id) -> 다른 문서로 떠난 사용자
+        self._task: Optional[asyncio.Task] = None
+        self._received = 0
+        self._flushed = 0
+
+    @staticmethod
+    def document_id(value: Any) -> Optional[str]:
+        """클라이언트가 보낸 PDF ID 검증 (정수 또는 숫자 문자열만 허용)"""
+        if isinstance(value, bool):
+            return None
+        if isinstance(value, int):
+            value = str(value)
+        if not isinstance(value, str) or not value.isdigit() or len(value) > CURSOR_MAX_DOCUMENT_ID_LENGTH:
+            return None
+        return value
+
+    @staticmethod
+    def _validate(page: Any, position: Any) -> Optional[Dict[str, float]]:
+        """페이지 번호와 좌표 검증 (x, y 숫자만 허용, 그 외 필드는 거부)"""
+        if isinstance(page, bool) or not isinstance(page, int) or not 1 <= page <= CURSOR_MAX_PAGE:
+            return None
+        if not isinstance(position, dict) or set(position) != set(CURSOR_POSITION_FIELDS):
+            return None
+
+        coordinates = {}
+        for field in CURSOR_POSITION_FIELDS:
+            value = position[field]
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+                return None
+            coordinates[field] = float(value)
+        return coordinates
+
+    def update(self, room_id: str, user_id: str, pdf_id: Any, page: Any, position: Any) -> bool:
+        """커서 이동 기록 (다음 tick까지 사용자당 마지막 위치만 유지, 형식이 잘못되면 False)"""
+        pdf_id = self.document_id(pdf_id)
+        position = self._validate(page, position)
+        if pdf_id is None or position is None:
+            return False
+        self._received += 1
+
+        # 다른 문서로 이동한 경우 이전 문서의 대기 중인 위치를 버리고,
+        # 이미 저장/전송된 위치는 다음 tick에 Redis에서 제거하고 cursor_leave로 알림
+        previous = self._documents.get((room_id, user_id))
+        if previous is not None and previous != pdf_id:
+            self._pending.get((room_id, previous), {}).pop(user_id, None)
+            self._departed.setdefault((room_id, previous), set()).add(user_id)
+        self._departed.get((room_id, pdf_id), set()).discard(user_id)
+        self._documents[(room_id, user_id)] = pdf_id
+
+        self._pending.setdefault((room_id, pdf_id), {})[user_id] = {
+            "page": page,
+            "position": position,
+            "updated_at": datetime.now().isoformat()
+        }
+
+        # 대기 중인 이동이 있을 때만 tick 작업 실행
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return True
+
+    async def _run(self):
+        """tick마다 모아 둔 커서 위치 전송 (보낼 것이 없으면 종료)"""
+        while True:
+            await asyncio.sleep(self.interval)
+            if not self._pending and not self._departed:
+                return
+            await self.flush()
+
+    async def flush(self):
+        """문서를 떠난 사용자의 커서를 제거한 뒤, 문서별로 모아 둔 커서 위치를 브로드캐스트하고 Redis에 저장"""
+        departed, self._departed = self._departed, {}
+        for (room_id, pdf_id), user_ids in departed.items():
+            if not user_ids:
+                continue
+            try:
+                await remove_cursor_positions(room_id, pdf_id, list(user_ids))
+                for user_id in user_ids:
+                    await self.manager.broadcast_to_room(room_id, {
+                        "type": "cursor_leave",
+                        "pdf_id": pdf_id,
+                        "user_id": user_id
+                    })
+            except Exception as e:
+                logger.error(f"커서 위치 제거 실패 - 방 ID: {room_id}, PDF ID: {pdf_id}, 오류: {str(e)}")
+
+        pending, self._pending = self._pending, {}
+        for (room_id, pdf_id), cursors in pending.items():
+            if not cursors:
+                continue
+            try:
+                await self.manager.broadcast_to_room(room_id, {
+                    "type": "cursors",
+                    "pdf_id": pdf_id,
+                    "cursors": cursors
+                })
+                await store_cursor_positions(room_id, pdf_id, cursors, self.expiry_seconds)
+                self._flushed += 1
+            except Exception as e:
+                logger.error(f"커서 위치 전송 실패 - 방 ID: {room_id}, PDF ID: {pdf_id}, 오류: {str(e)}")
+
+    async def leave(self, room_id: str, user_id: str):
+        """연결 종료 시 사용자의 커서 제거"""
+        pdf_id = self._documents.pop((room_id, user_id), None)
+        if pdf_id is None:
+            return
+        self._pending.get((room_id, pdf_id), {}).pop(user_id, None)
+        await remove_cursor_position(room_id, pdf_id, user_id)
+        await self.manager.broadcast_to_room(room_id, {
+            "type": "cursor_leave",
+            "pdf_id": pdf_id,
+            "user_id": user_id
+        })
+
+    def stats(self) -> Dict[str, Any]:
+        """커서 이동 수신 건수 대비 실제 전송 건수"""
+        return {
+            "tick_hz": round(1 / self.interval),
+            "moves_received": self._received,
+            "batches_sent": self._flushed,
+            "pending_documents": len(self._pending)
+        }
+
+
+class PresenceTracker:
+    """
+    팀스페이스 접속자 추적 (Redis Sorted Set, 멤버: "사용자 ID:워커 ID", 점수: 마지막 heartbeat 시각)
+
+    같은 사용자가 여러 워커에 연결될 수 있으므로 워커별 연결을 따로 기록하고,
+    사용자의 첫 연결이 추가될 때 입장을, 마지막 연결이 사라질 때 퇴장을 알립니다.
+    입장/퇴장은 즉시 기록하고, 연결이 유지되는 동안의 heartbeat는 interval마다
+    이 워커의 모든 연결을 파이프라인 1회로 일괄 기록합니다.
+    같은 주기에 heartbeat가 끊긴 접속자(다른 워커의 비정상 종료 등)를 정리하고,
+    접속 상태 변경을 방에 {"type": "presence", ...} 메시지로 알립니다.
+    """
+    def __init__(self, connection_manager: ConnectionManager, interval: int, expiry_seconds: int):
+        self.manager = connection_manager
+        self.interval = interval
+        self.expiry_seconds = expiry_seconds
+        self._task: Optional[asyncio.Task] = None
+        self._swept = 0
+
+    async def online(self, room_id: str) -> list:
+        """방의 현재 접속자 ID 목록"""
+        return await get_team_presence(room_id, self.expiry_seconds)
+
+    async def join(self, room_id: str, user_id: str):
+        """이 워커의 연결 기록 (다른 워커에도 연결이 없던 새 접속자이면 방에 알림)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        if await add_user_to_team_presence(room_id, user_id, self.manager.node_id, self.expiry_seconds):
+            await self._notify(room_id, "join", [user_id])
+
+    async def leave(self, room_id: str, user_id: str):
+        """이 워커의 연결 제거 (다른 워커에 남은 연결이 없을 때만 방에 알림)"""
+        if await remove_user_from_team_presence(room_id, user_id, self.manager.node_id, self.expiry_seconds):
+            await self._notify(room_id, "leave", [user_id])
+
+    async def _notify(self, room_id: str, event: str, user_ids: list):
+        await self.manager.broadcast_to_room(room_id, {
+            "type": "presence",
+            "event": event,
+            "user_ids": user_ids
+        })
+
+    async def _run(self):
+        """이 워커에 연결이 남아 있는 동안 주기적으로 heartbeat 기록 및 만료 정리"""
+        while self.manager.active_connections:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.tick()
+            except Exception as e:
+                logger.error(f"접속자 heartbeat 처리 실패: {str(e)}")
+
+    async def tick(self):
+        """연결된 사용자 heartbeat 일괄 기록 후 만료된 접속자 정리"""
+        heartbeats = {
+            room_id: list(connections)
+            for room_id, connections in self.manager.active_connections.items()
+        }
+        added = await record_presence_heartbeats(heartbeats, self.manager.node_id, self.expiry_seconds)
+
+        # 다른 워커의 퇴장 처리 등으로 빠졌다가 다시 추가된 접속자가 있으면 전체 목록 동기화
+        for room_id, count in added.items():
+            if count:
+                await self.manager.broadcast_to_room(room_id, {
+                    "type": "presence",
+                    "event": "sync",
+                    "user_ids": await self.online(room_id)
+                })
+
+        removed = await sweep_team_presence(list(heartbeats), self.expiry_seconds)
+        for room_id, user_ids in removed.items():
+            self._swept += len(user_ids)
+            await self._notify(room_id, "leave", user_ids)
+
+    def stats(self) -> Dict[str, Any]:
+        """heartbeat 주기와 만료 정리 건수"""
+        return {
+            "interval": self.interval,
+            "expiry_seconds": self.expiry_seconds,
+            "expired_members_swept": self._swept,
+            "running": self._task is not None and not self._task.done()
+        }
+
+
+# 워커 프로세스당 하나의 연결 관리자 (PubSub 연결 1개 공유)
+manager = ConnectionManager()
+cursor_stream = CursorStream(manager, settings.WS_CURSOR_TICK_HZ, settings.WS_CURSOR_TTL)
+presence = PresenceTracker(manager, settings.WS_PRESENCE_INTERVAL, settings.WS_PRESENCE_TTL)
@@ -24,6 +24,31 @@ def create_notification(
     db.refresh(db_notification)
     return db_notification
 
+def create_notifications(
+    db: Session,
+    notifications: List[Dict[str, Any]],
+    commit: bool = True
+) -> List[Notification]:
+    """
+    알림 일괄 생성 (한 번의 flush로 INSERT)
+    
+    Args:
+        notifications: user_id, type, message, link 키를 가진 딕셔너리 목록
+        commit: False면 호출자의 트랜잭션에 포함 (flush만 수행)
+    """
+    db_notifications = [
+        Notification(is_read=False, **notification) for notification in notifications
+    ]
+    if not db_notifications:
+        return []
+    
+    db.add_all(db_notifications)
+    if commit:
+        db.commit()
+    else:
+        db.flush()
+    return db_notifications
+
 def get_notifications_by_user(
     db: Session,
     user_id: int,
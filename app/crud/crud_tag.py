@@ -1,7 +1,8 @@
 # app/crud/crud_tag.py
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from app.models.tag import PDFFile, PDFTag, PDFTagMention
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload
+from app.models.tag import PDFFile, PDFTag, PDFTagMention, Hashtag, TagHashtag
 from app.models.user import User
 from app.core.pdf_processor import PDFProcessor
 
@@ -10,16 +11,64 @@ def get_tag_by_id(db: Session, tag_id: int) -> Optional[PDFTag]:
     return db.query(PDFTag).filter(PDFTag.id == tag_id).first()
 
 def get_tags_by_pdf(db: Session, pdf_id: int) -> List[PDFTag]:
-    """PDF ID로 모든 태그/주석 조회"""
-    return db.query(PDFTag).filter(PDFTag.pdf_id == pdf_id).all()
+    """PDF ID로 모든 태그/주석 조회 (작성자 함께 로드)"""
+    return (
+        db.query(PDFTag)
+        .options(joinedload(PDFTag.user))
+        .filter(PDFTag.pdf_id == pdf_id)
+        .all()
+    )
 
 def get_tags_by_pdf_page(db: Session, pdf_id: int, page: int) -> List[PDFTag]:
-    """PDF의 특정 페이지에 있는 태그/주석 조회"""
-    return db.query(PDFTag).filter(
+    """PDF의 특정 페이지에 있는 태그/주석 조회 (작성자 함께 로드)"""
+    return db.query(PDFTag).options(joinedload(PDFTag.user)).filter(
         PDFTag.pdf_id == pdf_id,
         PDFTag.page == page
     ).all()
 
+def get_parsed_mentions_and_tags(tag: PDFTag) -> Tuple[List[str], List[str]]:
+    """
+    저장된 멘션/해시태그 목록 반환
+    (백필 전 기존 주석은 내용을 파싱하여 반환)
+    """
+    if tag.mention_names is None or tag.hashtag_names is None:
+        return PDFProcessor.parse_mentions_and_tags(tag.content)
+    return tag.mention_names, tag.hashtag_names
+
+def get_tags_in_region(
+    db: Session,
+    pdf_id: int,
+    page: int,
+    x1: float,
+    y1: float,
+    x2: float,
+    y2: float
+) -> List[PDFTag]:
+    """PDF 페이지에서 사각형 영역과 겹치는 태그/주석 조회 (ix_tags_pdf_id_page_bbox 인덱스)"""
+    x1, x2 = min(x1, x2), max(x1, x2)
+    y1, y2 = min(y1, y2), max(y1, y2)
+    return db.query(PDFTag).options(joinedload(PDFTag.user)).filter(
+        PDFTag.pdf_id == pdf_id,
+        PDFTag.page == page,
+        PDFTag.bbox_y1 <= y2,
+        PDFTag.bbox_y2 >= y1,
+        PDFTag.bbox_x1 <= x2,
+        PDFTag.bbox_x2 >= x1
+    ).all()
+
+def position_to_bbox(position: Optional[Dict[str, float]]) -> Dict[str, Optional[float]]:
+    """주석 위치(x1,y1,x2,y2)를 정규화된 경계 상자 컬럼 값으로 변환"""
+    try:
+        x1, y1, x2, y2 = (float(position[k]) for k in ("x1", "y1", "x2", "y2"))
+    except (TypeError, KeyError, ValueError):
+        return {"bbox_x1": None, "bbox_y1": None, "bbox_x2": None, "bbox_y2": None}
+    return {
+        "bbox_x1": min(x1, x2),
+        "bbox_y1": min(y1, y2),
+        "bbox_x2": max(x1, x2),
+        "bbox_y2": max(y1, y2)
+    }
+
 def get_tags_by_user(db: Session, user_id: int) -> List[PDFTag]:
     """사용자가 작성한 모든 태그/주석 조회"""
     return db.query(PDFTag).filter(PDFTag.user_id == user_id).all()
@@ -31,25 +80,39 @@ def create_tag(
     page: int, 
     content: str, 
     position: Dict[str, float],
-    annotation_type: str = "highlight"
+    annotation_type: str = "highlight",
+    commit: bool = True
 ) -> PDFTag:
-    """새 태그/주석 생성"""
+    """
+    새 태그/주석 생성 (해시태그·멘션 포함 한 트랜잭션)
+    
+    commit=False면 flush만 수행하고 커밋은 호출자가 한 번에 처리합니다.
+    """
     db_tag = PDFTag(
         pdf_id=pdf_id,
         user_id=user_id,
         page=page,
         content=content,
         position=position,
-        annotation_type=annotation_type
+        annotation_type=annotation_type,
+        **position_to_bbox(position)
     )
+    
+    # 멘션·해시태그는 작성 시 한 번만 파싱하여 저장 (조회 시 재파싱하지 않음)
+    mentions, hashtags = PDFProcessor.parse_mentions_and_tags(content)
+    db_tag.mention_names = mentions
+    db_tag.hashtag_names = hashtags
     db.add(db_tag)
-    db.commit()
-    db.refresh(db_tag)
+    db.flush()
     
-    # 멘션 처리
-    mentions, _ = PDFProcessor.parse_mentions_and_tags(content)
+    # 해시태그·멘션 저장 (주석과 같은 트랜잭션)
+    sync_hashtags(db, db_tag.id, hashtags)
     if mentions:
-        process_mentions(db, db_tag.id, mentions)
+        process_mentions(db, db_tag.id, mentions, commit=False)
+    
+    if commit:
+        db.commit()
+        db.refresh(db_tag)
     
     return db_tag
 
@@ -58,9 +121,10 @@ def update_tag(
     tag_id: int, 
     user_id: int, 
     content: Optional[str] = None, 
-    position: Optional[Dict[str, float]] = None
+    position: Optional[Dict[str, float]] = None,
+    commit: bool = True
 ) -> Optional[PDFTag]:
-    """태그/주석 업데이트 (작성자만 가능)"""
+    """태그/주석 업데이트 (작성자만 가능, commit=False면 커밋은 호출자가 처리)"""
     db_tag = get_tag_by_id(db, tag_id)
     if not db_tag or db_tag.user_id != user_id:
         return None
@@ -71,15 +135,23 @@ def update_tag(
         
         # 멘션 업데이트
         db.query(PDFTagMention).filter(PDFTagMention.tag_id == tag_id).delete()
-        mentions, _ = PDFProcessor.parse_mentions_and_tags(content)
+        mentions, hashtags = PDFProcessor.parse_mentions_and_tags(content)
+        db_tag.mention_names = mentions
+        db_tag.hashtag_names = hashtags
+        sync_hashtags(db, db_tag.id, hashtags)
         if mentions:
-            process_mentions(db, db_tag.id, mentions)
+            process_mentions(db, db_tag.id, mentions, commit=False)
     
     if position is not None:
         db_tag.position = position
+        for column, value in position_to_bbox(position).items():
+            setattr(db_tag, column, value)
     
-    db.commit()
-    db.refresh(db_tag)
+    if commit:
+        db.commit()
+        db.refresh(db_tag)
+    else:
+        db.flush()
     return db_tag
 
 def delete_tag(db: Session, tag_id: int, user_id: int) -> bool:
@@ -92,20 +164,67 @@ def delete_tag(db: Session, tag_id: int, user_id: int) -> bool:
     db.commit()
     return True
 
-def process_mentions(db: Session, tag_id: int, usernames: List[str]) -> None:
-    """태그/주석 내 멘션된 사용자들 처리"""
-    for username in usernames:
-        # 사용자 조회
-        user = db.query(User).filter(User.username == username).first()
-        if user:
-            # 멘션 생성
-            db_mention = PDFTagMention(
-                tag_id=tag_id,
-                mentioned_user_id=user.id
-            )
-            db.add(db_mention)
+def get_user_ids_by_usernames(db: Session, usernames: List[str]) -> Dict[str, int]:
+    """사용자명 목록 → 사용자 ID 매핑 (IN 쿼리 1회, 존재하지 않는 사용자는 제외)"""
+    names = list(dict.fromkeys(u.lstrip("@") for u in usernames if u))
+    if not names:
+        return {}
+    return dict(db.query(User.username, User.id).filter(User.username.in_(names)).all())
+
+def process_mentions(db: Session, tag_id: int, usernames: List[str], commit: bool = True) -> None:
+    """태그/주석 내 멘션된 사용자들 처리 (사용자 일괄 조회 후 멘션 일괄 저장)"""
+    # 같은 사용자를 여러 번 멘션해도 한 번만 저장
+    user_ids = get_user_ids_by_usernames(db, usernames)
+    if user_ids:
+        db.bulk_insert_mappings(
+            PDFTagMention,
+            [{"tag_id": tag_id, "mentioned_user_id": user_id} for user_id in user_ids.values()]
+        )
     
-    db.commit()
+    if commit:
+        db.commit()
+
+def normalize_hashtags(hashtags: List[str]) -> List[str]:
+    """해시태그 정규화 (소문자, 중복 제거, 순서 유지)"""
+    return list(dict.fromkeys(h.lower()[:100] for h in hashtags if h))
+
+def get_or_create_hashtag_ids(db: Session, names: List[str]) -> Dict[str, int]:
+    """해시태그 이름 → ID 매핑 (없는 해시태그는 생성)"""
+    if not names:
+        return {}
+    
+    ids = dict(db.query(Hashtag.name, Hashtag.id).filter(Hashtag.name.in_(names)).all())
+    for name in names:
+        if name in ids:
+            continue
+        # 동시에 같은 해시태그가 생성되는 경우 고유 제약 위반 → 기존 행 사용
+        try:
+            with db.begin_nested():
+                hashtag = Hashtag(name=name)
+                db.add(hashtag)
+            ids[name] = hashtag.id
+        except IntegrityError:
+            ids[name] = db.query(Hashtag.id).filter(Hashtag.name == name).scalar()
+    return ids
+
+def sync_hashtags(db: Session, tag_id: int, hashtags: List[str]) -> None:
+    """태그/주석의 해시태그 연결 갱신 (커밋은 호출자가 수행)"""
+    db.query(TagHashtag).filter(TagHashtag.tag_id == tag_id).delete(synchronize_session=False)
+    
+    ids = get_or_create_hashtag_ids(db, normalize_hashtags(hashtags))
+    if ids:
+        db.bulk_insert_mappings(
+            TagHashtag,
+            [{"hashtag_id": hashtag_id, "tag_id": tag_id} for hashtag_id in ids.values()]
+        )
+
+def get_hashtag_id(db: Session, name: str) -> Optional[int]:
+    """해시태그 이름으로 ID 조회 (고유 인덱스)"""
+    return db.query(Hashtag.id).filter(Hashtag.name == name.lstrip("#").lower()).scalar()
+
+def get_user_id_by_username(db: Session, username: str) -> Optional[int]:
+    """사용자명으로 사용자 ID 조회 (고유 인덱스)"""
+    return db.query(User.id).filter(User.username == username.lstrip("@")).scalar()
 
 def get_pdf_by_id(db: Session, pdf_id: int) -> Optional[PDFFile]:
     """ID로 PDF 파일 조회"""
@@ -136,6 +136,21 @@ def check_user_in_team(db: Session, team_id: int, user_id: int) -> bool:
     
     return db_member is not None
 
+def filter_team_member_ids(db: Session, team_id: int, user_ids: List[int]) -> set:
+    """주어진 사용자 중 팀 멤버(소유자 포함)인 사용자 ID 집합 (쿼리 1회)"""
+    if not user_ids:
+        return set()
+    
+    members = db.query(TeamMember.user_id).filter(
+        TeamMember.team_id == team_id,
+        TeamMember.user_id.in_(user_ids)
+    )
+    owner = db.query(Team.owner_id).filter(
+        Team.id == team_id,
+        Team.owner_id.in_(user_ids)
+    )
+    return {user_id for (user_id,) in members.union(owner).all()}
+
 def get_team_members(db: Session, team_id: int) -> List[Dict[str, Any]]:
     """팀스페이스 멤버 목록 조회"""
     members = (
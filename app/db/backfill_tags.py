@@ -0,0 +1,63 @@
+# app/db/backfill_tags.py
+"""
+기존 주석의 멘션/해시태그 백필 (일회성)
+
+    python -m app.db.backfill_tags [--batch-size 500]
+
+mention_names / hashtag_names 가 비어 있는 주석을 id 순으로 배치 처리하며,
+배치마다 커밋하므로 중단 후 다시 실행하면 남은 행부터 이어서 처리합니다.
+"""
+import argparse
+import logging
+
+from app.core.pdf_processor import PDFProcessor
+from app.crud.crud_tag import sync_hashtags
+from app.db import base  # noqa: 모든 모델 매퍼 등록
+from app.db.session import SessionLocal
+from app.models.tag import PDFTag
+
+logger = logging.getLogger(__name__)
+
+
+def backfill(batch_size: int = 500) -> int:
+    """멘션/해시태그가 저장되지 않은 주석 채우기 (처리한 주석 수 반환)"""
+    db = SessionLocal()
+    processed = 0
+    last_id = 0
+    try:
+        while True:
+            tags = (
+                db.query(PDFTag)
+                .filter(
+                    PDFTag.id > last_id,
+                    (PDFTag.mention_names.is_(None)) | (PDFTag.hashtag_names.is_(None))
+                )
+                .order_by(PDFTag.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not tags:
+                break
+
+            for tag in tags:
+                mentions, hashtags = PDFProcessor.parse_mentions_and_tags(tag.content)
+                tag.mention_names = mentions
+                tag.hashtag_names = hashtags
+                sync_hashtags(db, tag.id, hashtags)
+
+            db.commit()
+            processed += len(tags)
+            last_id = tags[-1].id
+            logger.info(f"주석 백필 진행 - {processed}건 (마지막 ID: {last_id})")
+
+        return processed
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="기존 주석의 멘션/해시태그 백필")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    print(f"✅ 주석 {backfill(args.batch_size)}건 백필 완료")
@@ -8,5 +8,5 @@ from app.models.attendance import Attendance  # noqa
 from app.models.question import Question  # noqa
 from app.models.notification import Notification  # noqa
 from app.models.payment import Payment  # noqa
-from app.models.tag import PDFTag, PDFTagMention  # noqa (이름은 실제 모델 이름으로 수정)
+from app.models.tag import PDFTag, PDFTagMention, PDFPageText, Hashtag, TagHashtag  # noqa (이름은 실제 모델 이름으로 수정)
 from app.models.team import Team, TeamMember  # noqa
\ No newline at end of file
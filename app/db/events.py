@@ -0,0 +1,64 @@
+# app/db/events.py
+import asyncio
+import logging
+from typing import Awaitable, Callable, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+PostCommitHook = Callable[[], Awaitable[None]]
+
+_POST_COMMIT_KEY = "post_commit_hooks"
+
+# 실행 중인 후처리 작업 참조 유지 (가비지 컬렉션으로 취소되지 않도록)
+_pending_tasks: Set[asyncio.Task] = set()
+
+
+def add_post_commit_hook(db: Session, hook: PostCommitHook) -> None:
+    """
+    트랜잭션 커밋 후 실행할 비동기 작업 등록 (Redis 발행 등)
+
+    커밋이 성공한 경우에만 실행되고, 롤백되면 버려지므로
+    커밋되지 않은 데이터에 대한 이벤트가 발행되지 않습니다.
+    """
+    db.info.setdefault(_POST_COMMIT_KEY, []).append(hook)
+
+
+async def _run_hook(hook: PostCommitHook) -> None:
+    try:
+        await hook()
+    except Exception as e:
+        logger.error(f"커밋 후처리 작업 실패 - {getattr(hook, '__name__', hook)}, 오류: {str(e)}")
+
+
+@event.listens_for(Session, "after_commit")
+def _run_post_commit_hooks(session: Session) -> None:
+    """커밋 완료 시 등록된 작업을 이벤트 루프에서 실행"""
+    # SAVEPOINT 해제(begin_nested 종료)에도 호출되므로 최상위 트랜잭션 커밋만 처리
+    if session.in_nested_transaction():
+        return
+
+    hooks = session.info.pop(_POST_COMMIT_KEY, None)
+    if not hooks:
+        return
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.warning(f"이벤트 루프 밖에서 커밋되어 후처리 작업 {len(hooks)}건을 건너뜁니다")
+        return
+
+    for hook in hooks:
+        task = loop.create_task(_run_hook(hook))
+        _pending_tasks.add(task)
+        task.add_done_callback(_pending_tasks.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_post_commit_hooks(session: Session) -> None:
+    """롤백 시 등록된 작업 폐기 (SAVEPOINT 롤백은 바깥 트랜잭션이 유지되므로 제외)"""
+    if session.in_nested_transaction():
+        return
+    session.info.pop(_POST_COMMIT_KEY, None)
@@ -4,6 +4,7 @@ from app.api.v1 import auth
 from app.core.config import settings
 from app.api.v1.pdf_manager import router as pdf_router
 from app.api.v1.admin import router as admin_router
+from app.api.v1.websocket import ws_router
 from app.db.base import Base  # noqa
 
 # 메인 API 라우터 추가
@@ -53,6 +54,9 @@ app.include_router(
 # 메인 API 라우터 포함 (endpoints 폴더의 모든 API)
 app.include_router(api_router, prefix=settings.API_V1_STR)  # 이 부분 추가
 
+# 실시간 협업 WebSocket 라우터 포함
+app.include_router(ws_router, prefix=settings.API_V1_STR)
+
 # 헬스 체크 엔드포인트
 @app.get("/api/health", tags=["Health Check"])
 def health_check():
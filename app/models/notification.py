@@ -1,6 +1,6 @@
 # app/models/notification.py
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
 
@@ -9,6 +9,12 @@ class Notification(Base):
     사용자 알림 모델
     """
     __tablename__ = "notifications"
+    __table_args__ = (
+        # 사용자별 (읽지 않은) 알림 목록/개수: user_id, is_read 로 찾고 created_at 순 정렬
+        Index("ix_notifications_user_id_is_read_created_at", "user_id", "is_read", "created_at"),
+        # 오래된 알림 정리
+        Index("ix_notifications_created_at", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
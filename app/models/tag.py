@@ -1,6 +1,6 @@
 # app/models/tag.py
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, JSON, UniqueConstraint, Index, Float
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
 
@@ -13,40 +13,74 @@ class PDFFile(Base):
     id = Column(Integer, primary_key=True, index=True)
     filename = Column(String(255), nullable=False)
     file_path = Column(String(255), nullable=False)  # 실제 파일 경로 또는 S3 URL
-    team_id = Column(Integer, ForeignKey("teams.id"), nullable=True)  # 팀스페이스에 속할 수도 있고, 개인 파일일 수도 있음
-    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    team_id = Column(Integer, ForeignKey("teams.id"), nullable=True, index=True)  # 팀스페이스에 속할 수도 있고, 개인 파일일 수도 있음
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # 관계 설정
     team = relationship("Team", back_populates="pdf_files")
     owner = relationship("User", back_populates="pdf_files")
     tags = relationship("PDFTag", back_populates="pdf_file", cascade="all, delete-orphan")
+    pages = relationship("PDFPageText", back_populates="pdf_file", cascade="all, delete-orphan", passive_deletes=True)
+
+class PDFPageText(Base):
+    """
+    PDF 페이지별 추출 텍스트 모델 (서버 측 검색용 인덱스)
+    """
+    __tablename__ = "pdf_page_texts"
+    __table_args__ = (
+        UniqueConstraint("pdf_id", "page", name="uq_pdf_page_texts_pdf_id_page"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    pdf_id = Column(Integer, ForeignKey("pdf_files.id", ondelete="CASCADE"), nullable=False)
+    page = Column(Integer, nullable=False)  # 페이지 번호 (1부터 시작)
+    content = Column(Text, nullable=False, default="")
+    
+    # 관계 설정
+    pdf_file = relationship("PDFFile", back_populates="pages")
 
 class PDFTag(Base):
     """
     PDF 태그/주석 모델
     """
     __tablename__ = "tags"
+    __table_args__ = (
+        # 페이지 내 영역 조회: (pdf_id, page)로 좁힌 뒤 세로 범위(y1, y2)로 스캔, x는 인덱스 내에서 필터
+        Index("ix_tags_pdf_id_page_bbox", "pdf_id", "page", "bbox_y1", "bbox_y2", "bbox_x1", "bbox_x2"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     pdf_id = Column(Integer, ForeignKey("pdf_files.id", ondelete="CASCADE"))
-    user_id = Column(Integer, ForeignKey("users.id"))
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
     page = Column(Integer, nullable=False)
     content = Column(Text, nullable=False)
     position = Column(JSON)  # 페이지 내 좌표 (x1,y1,x2,y2) 백분율로 저장
+    bbox_x1 = Column(Float, nullable=True)  # position의 경계 상자 (정규화: x1 <= x2, y1 <= y2)
+    bbox_y1 = Column(Float, nullable=True)
+    bbox_x2 = Column(Float, nullable=True)
+    bbox_y2 = Column(Float, nullable=True)
     annotation_type = Column(String(20), default="highlight")  # highlight, note, underline 등
+    mention_names = Column(JSON, nullable=True)  # 작성 시 파싱한 멘션(@사용자) 목록
+    hashtag_names = Column(JSON, nullable=True)  # 작성 시 파싱한 해시태그(#태그) 목록
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # 관계 설정
     pdf_file = relationship("PDFFile", back_populates="tags")
     user = relationship("User", back_populates="pdf_tags")
     mentions = relationship("PDFTagMention", back_populates="tag", cascade="all, delete-orphan")
+    hashtags = relationship("Hashtag", secondary="tag_hashtags", back_populates="tags", passive_deletes=True)
 
 class PDFTagMention(Base):
     """
     PDF 태그 내 멘션 모델
     """
     __tablename__ = "mentions"
+    __table_args__ = (
+        # "나를 멘션한 주석" 조회: mentioned_user_id 로 찾고 tag_id 순으로 정렬 (중복 멘션 방지 겸용)
+        Index("uq_mentions_mentioned_user_id_tag_id", "mentioned_user_id", "tag_id", unique=True),
+        Index("ix_mentions_tag_id", "tag_id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     tag_id = Column(Integer, ForeignKey("tags.id", ondelete="CASCADE"))
@@ -55,4 +89,29 @@ class PDFTagMention(Base):
     
     # 관계 설정
     tag = relationship("PDFTag", back_populates="mentions")
-    user = relationship("User", back_populates="pdf_mentions")
\ No newline at end of file
+    user = relationship("User", back_populates="pdf_mentions")
+
+class Hashtag(Base):
+    """
+    해시태그 모델 (정규화된 해시태그 이름, 소문자)
+    """
+    __tablename__ = "hashtags"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(100), nullable=False, unique=True, index=True)
+    
+    # 관계 설정
+    tags = relationship("PDFTag", secondary="tag_hashtags", back_populates="hashtags", passive_deletes=True)
+
+class TagHashtag(Base):
+    """
+    태그/주석-해시태그 연결 모델
+    (hashtag_id, tag_id) 기본 키로 해시태그별 주석 조회/집계를 인덱스만으로 처리
+    """
+    __tablename__ = "tag_hashtags"
+    __table_args__ = (
+        Index("ix_tag_hashtags_tag_id", "tag_id"),
+    )
+    
+    hashtag_id = Column(Integer, ForeignKey("hashtags.id", ondelete="CASCADE"), primary_key=True)
+    tag_id = Column(Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True)
@@ -1,6 +1,6 @@
 # app/models/team.py
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
 
@@ -25,6 +25,10 @@ class TeamMember(Base):
     팀 멤버십 모델
     """
     __tablename__ = "team_members"
+    __table_args__ = (
+        Index("ix_team_members_team_id_user_id", "team_id", "user_id"),
+        Index("ix_team_members_user_id", "user_id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     team_id = Column(Integer, ForeignKey("teams.id", ondelete="CASCADE"))
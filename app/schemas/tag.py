@@ -45,4 +45,26 @@ class AnnotationList(BaseModel):
     annotations: List[AnnotationResponse]
     
     class Config:
-        orm_mode = True
\ No newline at end of file
+        orm_mode = True
+# 전문 검색 결과 스키마
+class SearchHit(BaseModel):
+    type: str  # annotation(주석) 또는 page(PDF 본문)
+    id: int  # 주석 ID 또는 페이지 텍스트 ID
+    pdf_id: int
+    file_name: str
+    team_id: Optional[int] = None
+    page: int
+    rank: float
+    snippet: str  # 일치 단어가 <b></b>로 강조된 본문 일부
+
+class SearchResult(BaseModel):
+    query: str
+    total: int
+    skip: int
+    limit: int
+    hits: List[SearchHit]
+
+# 해시태그 집계 스키마
+class HashtagCount(BaseModel):
+    hashtag: str
+    count: int
@@ -1,5 +1,5 @@
 # app/services/__init__.py
 
-from .file_service import FileStorageManager
+from .file_service import FileStorageManager, AsyncFileStorageManager
 
-__all__ = ["FileStorageManager"]
+__all__ = ["FileStorageManager", "AsyncFileStorageManager"]
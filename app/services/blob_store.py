@@ -0,0 +1,110 @@
+import os
+import hashlib
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class ContentAddressedStore:
+    """📂 SHA-256 기반 콘텐츠 주소 저장소 (중복 제거)
+
+    동일한 내용의 PDF는 `.blobs/<sha256[:2]>/<sha256>` 에 한 번만 저장되고,
+    사용자 폴더의 파일은 해당 blob의 하드링크가 됩니다.
+    하드링크 수(st_nlink)가 참조 카운트 역할을 하므로, 링크 수가 1인 blob은
+    더 이상 어떤 사용자 파일도 참조하지 않는 고아 blob입니다.
+    """
+
+    HASH_READ_SIZE = 1024 * 1024
+
+    def __init__(self, base_dir: Path):
+        """📌 초기화: blob 저장 경로 설정 (하드링크를 위해 사용자 파일과 같은 파일시스템)"""
+        self.BLOB_DIR = base_dir / ".blobs"
+        self.BLOB_DIR.mkdir(parents=True, exist_ok=True)
+
+    # ==================================================
+    # 1. 유틸리티 메서드
+    # ==================================================
+    def blob_path(self, digest: str) -> Path:
+        """📌 해시값에 해당하는 blob 경로"""
+        return self.BLOB_DIR / digest[:2] / digest
+
+    @classmethod
+    def hash_file(cls, path: Path) -> str:
+        """📌 파일 SHA-256 계산 (동기)"""
+        hasher = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(cls.HASH_READ_SIZE), b""):
+                hasher.update(block)
+        return hasher.hexdigest()
+
+    # ==================================================
+    # 2. 저장 메서드
+    # ==================================================
+    def commit(self, tmp_path: Path, target_path: Path, digest: str) -> bool:
+        """
+        📌 임시 파일을 blob으로 등록하고 target_path에 원자적으로 연결 (동기)
+
+        이미 같은 blob이 있으면 임시 파일을 버리고 기존 blob을 하드링크합니다.
+        반환값: 중복 제거 여부
+        """
+        blob = self.blob_path(digest)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+
+        for _ in range(2):
+            try:
+                os.link(tmp_path, blob)  # 새 blob 등록 (tmp와 같은 inode)
+            except FileExistsError:
+                link_tmp = tmp_path.with_name(f"{tmp_path.name}.link")
+                try:
+                    os.link(blob, link_tmp)
+                except FileNotFoundError:
+                    continue  # 고아 blob이 방금 정리된 경우 새 blob으로 다시 등록
+                os.replace(link_tmp, target_path)
+                tmp_path.unlink(missing_ok=True)
+                return True
+
+            os.replace(tmp_path, target_path)
+            return False
+
+        # 정리 작업과 계속 경합하는 예외적인 경우: 중복 제거 없이 저장
+        os.replace(tmp_path, target_path)
+        return False
+
+    # ==================================================
+    # 3. 정리 메서드
+    # ==================================================
+    def purge_orphans(self) -> int:
+        """📌 어떤 사용자 파일도 참조하지 않는 blob 삭제 (삭제한 blob 수 반환)"""
+        removed = 0
+        for shard in self.BLOB_DIR.iterdir():
+            if not shard.is_dir():
+                continue
+            with os.scandir(shard) as it:
+                for entry in it:
+                    try:
+                        if entry.stat().st_nlink == 1:
+                            os.unlink(entry.path)
+                            removed += 1
+                    except FileNotFoundError:
+                        pass
+
+        if removed:
+            logger.info(f"참조되지 않는 blob {removed}개 삭제")
+        return removed
+
+    def usage(self) -> dict:
+        """📌 blob 저장소 사용량 (실제 디스크 사용량과 참조 수)"""
+        blobs = 0
+        stored_bytes = 0
+        references = 0
+        for shard in self.BLOB_DIR.iterdir():
+            if not shard.is_dir():
+                continue
+            with os.scandir(shard) as it:
+                for entry in it:
+                    st = entry.stat()
+                    blobs += 1
+                    stored_bytes += st.st_size
+                    references += st.st_nlink - 1
+        return {"blobs": blobs, "stored_bytes": stored_bytes, "references": references}
@@ -0,0 +1,390 @@
+import os
+import json
+import time
+import shutil
+import asyncio
+import logging
+import aiofiles
+import aiofiles.os
+from uuid import uuid4, UUID
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.core.redis_helper import get_redis_client
+from app.core.fs_executor import run_fs
+from app.services.file_service import FileStorageManager, FileOperationError
+
+logger = logging.getLogger(__name__)
+
+
+# ==================================================
+# 1. 데이터 모델
+# ==================================================
+class UploadSessionResponse(BaseModel):
+    """📌 이어올리기 세션 상태 응답 모델"""
+    upload_id: str
+    filename: str
+    folder_name: str
+    total_size: int
+    chunk_size: int
+    total_chunks: int
+    received_chunks: List[int]
+    received_bytes: int
+    missing_chunks: List[int]
+
+
+# ==================================================
+# 2. 청크 병합 유틸리티
+# ==================================================
+def _append_part(part_path: Path, out_fd: int) -> None:
+    """📌 청크 파일을 커널 내부 복사(copy_file_range → sendfile → 일반 복사)로 이어붙이기"""
+    with open(part_path, "rb") as part:
+        in_fd = part.fileno()
+        remaining = os.fstat(in_fd).st_size
+
+        try:
+            while remaining > 0:
+                if hasattr(os, "copy_file_range"):
+                    copied = os.copy_file_range(in_fd, out_fd, remaining)
+                else:
+                    copied = os.sendfile(out_fd, in_fd, None, remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+            return
+        except (OSError, AttributeError):
+            # 파일시스템이 zero-copy를 지원하지 않는 경우: 남은 부분을 일반 복사
+            pass
+
+        with os.fdopen(os.dup(out_fd), "ab", closefd=True) as out:
+            shutil.copyfileobj(part, out)
+
+
+def _assemble_parts(part_paths: List[Path], target_path: Path) -> None:
+    """📌 청크 파일들을 순서대로 하나의 파일로 병합 (동기, 스레드에서 실행)"""
+    out_fd = os.open(target_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        for part_path in part_paths:
+            _append_part(part_path, out_fd)
+    finally:
+        os.close(out_fd)
+
+
+def _remove_files(paths: List[Path], keep_parts_since: Optional[float] = None) -> int:
+    """📌 파일 일괄 삭제 (동기, 스레드에서 실행) - 삭제한 파일 수 반환
+
+    keep_parts_since가 주어지면 그 시각 이후 수정된 임시 청크(.part)는 기록 중일 수 있으므로 남겨 둡니다.
+    """
+    removed = 0
+    for path in paths:
+        try:
+            if keep_parts_since is not None and path.name.endswith(".part") \
+                    and path.stat().st_mtime >= keep_parts_since:
+                continue
+            path.unlink()
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+# ==================================================
+# 3. 이어올리기(Resumable) 업로드 관리 클래스
+# ==================================================
+class ChunkUploadManager:
+    """📂 청크 단위 이어올리기 업로드 관리 클래스
+
+    세션 정보와 수신된 청크 목록은 Redis에 저장하고,
+    청크 파일은 `storage/chunks/<upload_id>_<index>` 형태로 보관합니다.
+    """
+
+    SESSION_KEY = "upload_session:{upload_id}"
+    PARTS_KEY = "upload_session:{upload_id}:parts"
+    FINALIZE_LOCK_KEY = "upload_session:{upload_id}:finalizing"
+    RESULT_KEY = "upload_session:{upload_id}:result"
+
+    FINALIZE_LOCK_TTL = 15 * 60  # 병합 작업 선점 유지 시간 (초)
+    PART_GRACE_SECONDS = 60 * 60  # 기록 중인 임시 청크(.part) 보호 시간 (초)
+
+    def __init__(self, storage: Optional[FileStorageManager] = None):
+        """📌 초기화: 청크 저장 경로 설정"""
+        self.storage = storage or FileStorageManager()
+        self.CHUNK_DIR = self.storage.BASE_DIR / "chunks"
+        self.CHUNK_DIR.mkdir(parents=True, exist_ok=True)
+        self.redis = get_redis_client()
+        self.session_ttl = settings.UPLOAD_SESSION_TTL
+
+    # ==================================================
+    # 3.1 유틸리티 메서드
+    # ==================================================
+    @staticmethod
+    def _validate_upload_id(upload_id: str) -> str:
+        """📌 업로드 ID 형식 검증 (경로 조작 방지)"""
+        try:
+            return str(UUID(upload_id))
+        except ValueError:
+            raise FileOperationError("잘못된 업로드 ID", 400)
+
+    def _part_path(self, upload_id: str, index: int) -> Path:
+        """📌 청크 파일 경로"""
+        return self.CHUNK_DIR / f"{upload_id}_{index}"
+
+    async def _get_session(self, user_id: int, upload_id: str) -> Dict[str, str]:
+        """📌 세션 조회 및 소유자 검증"""
+        upload_id = self._validate_upload_id(upload_id)
+        session = await self.redis.hgetall(self.SESSION_KEY.format(upload_id=upload_id))
+        if not session:
+            raise FileOperationError("업로드 세션을 찾을 수 없거나 만료되었습니다.", 404)
+        if session["user_id"] != str(user_id):
+            raise FileOperationError("업로드 세션에 접근할 권한이 없습니다.", 403)
+        return session
+
+    async def _touch(self, upload_id: str) -> None:
+        """📌 세션 만료 시간 연장"""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.expire(self.SESSION_KEY.format(upload_id=upload_id), self.session_ttl)
+            pipe.expire(self.PARTS_KEY.format(upload_id=upload_id), self.session_ttl)
+            await pipe.execute()
+
+    def _build_status(self, upload_id: str, session: Dict[str, str], parts: Dict[str, str]) -> UploadSessionResponse:
+        """📌 세션 상태 응답 생성"""
+        total_chunks = int(session["total_chunks"])
+        received = sorted(int(i) for i in parts)
+        received_set = set(received)
+        return UploadSessionResponse(
+            upload_id=upload_id,
+            filename=session["filename"],
+            folder_name=session["folder_name"],
+            total_size=int(session["total_size"]),
+            chunk_size=int(session["chunk_size"]),
+            total_chunks=total_chunks,
+            received_chunks=received,
+            received_bytes=sum(int(size) for size in parts.values()),
+            missing_chunks=[i for i in range(total_chunks) if i not in received_set]
+        )
+
+    # ==================================================
+    # 3.2 세션 관리 메서드
+    # ==================================================
+    async def init_session(
+        self, user_id: int, folder_name: str, filename: str, total_size: int, chunk_size: Optional[int] = None
+    ) -> UploadSessionResponse:
+        """📌 업로드 세션 생성"""
+        if not filename.lower().endswith(".pdf"):
+            raise FileOperationError("PDF 파일만 업로드 가능합니다.", 400)
+
+        filename = self.storage._sanitize_name(filename)
+        if not self.storage._validate_name(filename):
+            raise FileOperationError(f"잘못된 문자가 포함된 파일명: {filename}", 400)
+        if total_size <= 0:
+            raise FileOperationError("파일 크기가 올바르지 않습니다.", 400)
+        if total_size > settings.UPLOAD_MAX_FILE_SIZE:
+            raise FileOperationError(f"파일 크기 제한 초과: 최대 {settings.UPLOAD_MAX_FILE_SIZE} bytes", 400)
+
+        chunk_size = chunk_size or settings.UPLOAD_CHUNK_SIZE
+        if not settings.UPLOAD_MIN_CHUNK_SIZE <= chunk_size <= settings.UPLOAD_MAX_CHUNK_SIZE:
+            raise FileOperationError(
+                f"청크 크기는 {settings.UPLOAD_MIN_CHUNK_SIZE}~{settings.UPLOAD_MAX_CHUNK_SIZE} bytes 범위여야 합니다.", 400
+            )
+        total_chunks = -(-total_size // chunk_size)
+        if total_chunks > settings.UPLOAD_MAX_CHUNKS:
+            raise FileOperationError(f"청크 수 제한 초과: 최대 {settings.UPLOAD_MAX_CHUNKS}개", 400)
+
+        # 폴더 경로 검증 (생성은 병합 시점에)
+        self.storage._sanitize_path(user_id, folder_name)
+
+        upload_id = str(uuid4())
+
+        session = {
+            "user_id": str(user_id),
+            "folder_name": folder_name,
+            "filename": filename,
+            "total_size": str(total_size),
+            "chunk_size": str(chunk_size),
+            "total_chunks": str(total_chunks),
+            "created_at": str(int(time.time()))
+        }
+        key = self.SESSION_KEY.format(upload_id=upload_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=session)
+            pipe.expire(key, self.session_ttl)
+            await pipe.execute()
+
+        return self._build_status(upload_id, session, {})
+
+    async def get_status(self, user_id: int, upload_id: str) -> UploadSessionResponse:
+        """📌 세션 상태 조회 (재개 시 누락된 청크 확인용)"""
+        session = await self._get_session(user_id, upload_id)
+        upload_id = self._validate_upload_id(upload_id)
+        parts = await self.redis.hgetall(self.PARTS_KEY.format(upload_id=upload_id))
+        return self._build_status(upload_id, session, parts)
+
+    async def write_chunk(
+        self, user_id: int, upload_id: str, index: int, body: AsyncIterator[bytes]
+    ) -> UploadSessionResponse:
+        """📌 번호가 지정된 청크 저장 (같은 번호 재전송 시 덮어쓰기)"""
+        session = await self._get_session(user_id, upload_id)
+        upload_id = self._validate_upload_id(upload_id)
+
+        total_chunks = int(session["total_chunks"])
+        chunk_size = int(session["chunk_size"])
+        total_size = int(session["total_size"])
+        if not 0 <= index < total_chunks:
+            raise FileOperationError(f"청크 번호 범위 초과: {index}", 400)
+
+        # 마지막 청크만 chunk_size보다 작을 수 있음
+        expected = chunk_size if index < total_chunks - 1 else total_size - chunk_size * (total_chunks - 1)
+
+        part_path = self._part_path(upload_id, index)
+        tmp_path = part_path.with_name(f"{part_path.name}.{uuid4().hex}.part")
+        written = 0
+        try:
+            async with aiofiles.open(tmp_path, "wb") as buffer:
+                async for data in body:
+                    written += len(data)
+                    if written > expected:
+                        raise FileOperationError(f"청크 크기 초과: {index}", 400)
+                    await buffer.write(data)
+
+            if written != expected:
+                raise FileOperationError(f"청크 크기 불일치: {index} ({written}/{expected} bytes)", 400)
+
+            await aiofiles.os.replace(tmp_path, part_path)
+        except BaseException:
+            await run_fs(tmp_path.unlink, missing_ok=True)
+            raise
+
+        parts_key = self.PARTS_KEY.format(upload_id=upload_id)
+        await self.redis.hset(parts_key, str(index), str(written))
+        await self._touch(upload_id)
+
+        parts = await self.redis.hgetall(parts_key)
+        return self._build_status(upload_id, session, parts)
+
+    async def _get_result(self, user_id: int, upload_id: str) -> Optional[dict]:
+        """📌 이미 완료된 병합 결과 조회 (응답 유실 후 재시도 시 같은 결과 반환)"""
+        stored = await self.redis.get(self.RESULT_KEY.format(upload_id=upload_id))
+        if not stored:
+            return None
+        result = json.loads(stored)
+        if result.pop("user_id") != str(user_id):
+            raise FileOperationError("업로드 세션에 접근할 권한이 없습니다.", 403)
+        return result
+
+    async def finalize(self, user_id: int, upload_id: str) -> dict:
+        """📌 모든 청크 수신 후 최종 파일로 병합 (재시도 시 같은 결과 반환, 동시 호출 시 하나만 병합)"""
+        upload_id = self._validate_upload_id(upload_id)
+        result = await self._get_result(user_id, upload_id)
+        if result is not None:
+            return result
+
+        session = await self._get_session(user_id, upload_id)
+        parts = await self.redis.hgetall(self.PARTS_KEY.format(upload_id=upload_id))
+
+        status = self._build_status(upload_id, session, parts)
+        if status.missing_chunks or status.received_bytes != status.total_size:
+            raise FileOperationError(f"누락된 청크가 있습니다: {status.missing_chunks}", 409)
+
+        # 병합 작업 선점 (동시에 들어온 완료 요청은 하나만 병합)
+        lock_key = self.FINALIZE_LOCK_KEY.format(upload_id=upload_id)
+        token = uuid4().hex
+        if not await self.redis.set(lock_key, token, nx=True, ex=self.FINALIZE_LOCK_TTL):
+            result = await self._get_result(user_id, upload_id)
+            if result is not None:
+                return result
+            raise FileOperationError("이미 병합 중인 업로드입니다. 잠시 후 다시 시도하세요.", 409)
+
+        try:
+            folder_path = self.storage._sanitize_path(user_id, status.folder_name)
+
+            part_paths = [self._part_path(upload_id, i) for i in range(status.total_chunks)]
+            tmp_path = self.storage.TMP_DIR / f"{upload_id}.{uuid4().hex}.part"
+            file_path = None
+            try:
+                await run_fs(_assemble_parts, part_paths, tmp_path)
+                file_path = await run_fs(self.storage._prepare_target, folder_path, status.filename)
+                await self.storage._commit_file(tmp_path, file_path)
+            except BaseException as e:
+                await run_fs(tmp_path.unlink, missing_ok=True)
+                if file_path is not None:
+                    await run_fs(self.storage._release_target, file_path)  # 선점한 빈 파일 정리
+                if isinstance(e, FileNotFoundError):
+                    raise FileOperationError("청크 파일이 만료되어 삭제되었습니다. 업로드를 다시 시작하세요.", 410)
+                raise
+
+            await run_fs(self.storage._invalidate_files, folder_path)
+
+            result = {
+                "upload_id": upload_id,
+                "filename": file_path.name,
+                "size": status.total_size,
+                "path": str(file_path)
+            }
+            # 세션 정리 전에 결과를 저장하여 재시도가 404 대신 같은 결과를 받도록 함
+            await self.redis.set(
+                self.RESULT_KEY.format(upload_id=upload_id),
+                json.dumps({**result, "user_id": str(user_id)}),
+                ex=self.session_ttl
+            )
+            await self._discard(upload_id, status.total_chunks)
+            return result
+        finally:
+            if await self.redis.get(lock_key) == token:
+                await self.redis.delete(lock_key)
+
+    async def abort(self, user_id: int, upload_id: str) -> None:
+        """📌 업로드 세션 취소 및 청크 삭제"""
+        session = await self._get_session(user_id, upload_id)
+        await self._discard(self._validate_upload_id(upload_id), int(session["total_chunks"]))
+
+    async def _discard(self, upload_id: str, total_chunks: int) -> None:
+        """📌 세션 키와 청크 파일 정리"""
+        await self.redis.delete(
+            self.SESSION_KEY.format(upload_id=upload_id),
+            self.PARTS_KEY.format(upload_id=upload_id)
+        )
+        await run_fs(_remove_files, [self._part_path(upload_id, i) for i in range(total_chunks)])
+
+    # ==================================================
+    # 3.3 방치된 세션 정리
+    # ==================================================
+    async def purge_abandoned(self) -> int:
+        """📌 세션이 만료된 업로드의 청크 파일 삭제 (삭제한 파일 수 반환)
+
+        세션이 살아 있는 업로드의 청크는 오래되었어도 유지합니다 (세션 TTL은 청크 수신마다 연장).
+        기록 중일 수 있는 임시 청크(.part)는 마지막 수정 후 PART_GRACE_SECONDS가 지나야 삭제합니다.
+        """
+        part_cutoff = time.time() - self.PART_GRACE_SECONDS
+        by_upload: Dict[str, List[Path]] = {}
+
+        def _scan() -> None:
+            with os.scandir(self.CHUNK_DIR) as it:
+                for entry in it:
+                    if entry.is_file():
+                        by_upload.setdefault(entry.name.split("_", 1)[0], []).append(Path(entry.path))
+
+        await run_fs(_scan)
+
+        abandoned = []
+        for upload_id, paths in by_upload.items():
+            if not await self.redis.exists(self.SESSION_KEY.format(upload_id=upload_id)):
+                abandoned.extend(paths)
+
+        removed = await run_fs(_remove_files, abandoned, part_cutoff)
+
+        if removed:
+            logger.info(f"방치된 업로드 청크 {removed}개 삭제")
+        return removed
+
+
+async def run_chunk_gc(interval_seconds: int) -> None:
+    """📌 주기적으로 방치된 업로드 청크를 정리하는 백그라운드 작업"""
+    manager = ChunkUploadManager()
+    while True:
+        try:
+            await manager.purge_abandoned()
+        except Exception as e:
+            logger.error(f"업로드 청크 정리 실패: {str(e)}")
+        await asyncio.sleep(interval_seconds)
@@ -1,20 +1,37 @@
 import shutil
+import hashlib
 import aiofiles
+import aiofiles.os
 import re
 from uuid import uuid4
 from pathlib import Path
 from fastapi import HTTPException, UploadFile
-from typing import List, Optional
+from typing import Awaitable, Callable, List, Optional, Tuple
 import os
+import json
+import heapq
+import base64
 import asyncio
+import logging
 from datetime import datetime
 from pydantic import BaseModel
 from itertools import islice
+from app.core.config import settings
+from app.core.fs_executor import run_fs
+from app.services.listing_cache import listing_cache
+from app.services.name_allocator import name_allocator
+from app.services.blob_store import ContentAddressedStore
+
+logger = logging.getLogger(__name__)
 
 
 # ==================================================
 # 1. 데이터 모델 및 예외 클래스
 # ==================================================
+# 파일별 진행률 콜백: (원본 파일명, 기록한 바이트 수, 전체 크기, 상태)
+ProgressCallback = Callable[[str, int, Optional[int], str], Awaitable[None]]
+
+
 class FolderResponse(BaseModel):
     """📌 폴더 정보 응답 모델"""
     name: str
@@ -45,11 +62,25 @@ class ApiResponse(BaseModel):
 class FileStorageManager:
     """📂 파일 저장 및 관리 클래스"""
 
-    def __init__(self):
-        """📌 초기화: 기본 저장 경로 설정"""
+    def __init__(self, chunk_size: Optional[int] = None, memory_limit: Optional[int] = None):
+        """📌 초기화: 기본 저장 경로 및 스트리밍 업로드 설정"""
         self.BASE_DIR = Path(os.getenv("STORAGE_PATH", "./storage")).resolve()
         self.BASE_DIR.mkdir(parents=True, exist_ok=True)
 
+        # 업로드 중인 임시 파일 경로 (원자적 rename을 위해 같은 파일시스템에 위치)
+        self.TMP_DIR = self.BASE_DIR / ".tmp"
+        self.TMP_DIR.mkdir(parents=True, exist_ok=True)
+
+        # 청크 크기는 업로드 1건당 메모리 상한을 넘지 않도록 제한
+        self.memory_limit = memory_limit or settings.UPLOAD_MEMORY_LIMIT
+        self.chunk_size = max(1, min(chunk_size or settings.UPLOAD_CHUNK_SIZE, self.memory_limit))
+
+        # 파일/폴더 목록 캐시 (쓰기 작업 시 무효화)
+        self.cache = listing_cache
+
+        # 동일 내용 PDF 중복 제거용 콘텐츠 주소 저장소
+        self.blobs = ContentAddressedStore(self.BASE_DIR) if settings.STORAGE_DEDUP_ENABLED else None
+
     # ==================================================
     # 2.1 유틸리티 메서드
     # ==================================================
@@ -85,14 +116,71 @@ class FileStorageManager:
         return sanitized.rstrip('.')  # 끝에 . 남지 않도록 정리
 
     def generate_unique_name(self, folder: Path, name: str) -> Path:
-        """📌 동일한 이름이 존재하면 (1), (2) 숫자 추가"""
-        new_path = folder / name
-        count = 1
-        while new_path.exists():
-            file_stem, file_ext = os.path.splitext(name)
-            new_path = folder / f"{file_stem}({count}){file_ext}"
-            count += 1
-        return new_path
+        """📌 동일한 이름이 존재하면 (1), (2) 숫자 추가 (경로를 빈 파일로 선점하여 반환)"""
+        return name_allocator.allocate(folder, name)
+
+    def _folder_key(self, folder_path: Path) -> str:
+        """📌 목록 캐시 키로 사용할 폴더 상대 경로 (`<user_id>/<folder>`)"""
+        return folder_path.relative_to(self.BASE_DIR).as_posix()
+
+    def _invalidate_files(self, *folder_paths: Path) -> None:
+        """📌 폴더들의 파일 목록 캐시 무효화"""
+        self.cache.invalidate_files(*(self._folder_key(p) for p in folder_paths))
+
+    def _release_target(self, file_path: Path) -> None:
+        """📌 저장 실패 시 선점한 빈 파일 삭제 및 폴더 목록 캐시 무효화 (동기)"""
+        file_path.unlink(missing_ok=True)
+        self._invalidate_files(file_path.parent)
+
+    def _ensure_folder(self, folder_path: Path) -> None:
+        """📌 폴더가 없으면 생성하고 폴더 목록 캐시 무효화 (동기)"""
+        if not folder_path.is_dir():
+            folder_path.mkdir(parents=True, exist_ok=True)
+            self.cache.invalidate_folders(folder_path.relative_to(self.BASE_DIR).parts[0])
+
+    def _prepare_target(self, folder_path: Path, filename: str) -> Path:
+        """📌 저장 폴더 생성 후 중복되지 않는 파일 경로 반환 (동기)"""
+        self._ensure_folder(folder_path)
+        return self.generate_unique_name(folder_path, filename)
+
+    async def _commit_file(self, tmp_path: Path, file_path: Path, digest: Optional[str] = None) -> None:
+        """📌 완성된 임시 파일을 최종 경로로 이동 (중복 제거 활성화 시 blob 저장소 경유)"""
+        if self.blobs is None:
+            await aiofiles.os.replace(tmp_path, file_path)
+            return
+
+        if digest is None:
+            digest = await run_fs(self.blobs.hash_file, tmp_path)
+        await run_fs(self.blobs.commit, tmp_path, file_path, digest)
+
+    async def _stream_to_disk(
+        self, file: UploadFile, file_path: Path, progress: Optional[ProgressCallback] = None
+    ) -> int:
+        """📌 업로드 파일을 청크 단위로 임시 파일에 기록 후 원자적으로 rename (기록한 바이트 수 반환)
+
+        기록과 동시에 SHA-256을 계산하여, 이미 저장된 내용이면 기존 blob을 하드링크합니다.
+        """
+        tmp_path = self.TMP_DIR / f"{uuid4().hex}.part"
+        hasher = hashlib.sha256()
+        written = 0
+        try:
+            async with aiofiles.open(tmp_path, "wb") as buffer:
+                while True:
+                    chunk = await file.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    await buffer.write(chunk)
+                    hasher.update(chunk)
+                    written += len(chunk)
+                    if progress:
+                        await progress(file.filename, written, file.size, "uploading")
+
+            # 완성된 파일만 최종 경로에 노출
+            await self._commit_file(tmp_path, file_path, hasher.hexdigest())
+            return written
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
     # ==================================================
     # 2.2 파일 업로드 관련 메서드
@@ -108,45 +196,70 @@ class FileStorageManager:
             if not self._validate_name(filename):
                 raise FileOperationError(f"잘못된 문자가 포함된 파일명: {filename}")
 
-            # ✅ 경로 생성
+            # ✅ 경로 생성 및 중복 파일명 방지 (파일시스템 스레드 풀에서 실행)
             folder_path = self._sanitize_path(user_id, folder_name)
-            folder_path.mkdir(parents=True, exist_ok=True)
-
-            # ✅ 중복 파일명 방지
-            file_path = self.generate_unique_name(folder_path, filename)
+            file_path = await run_fs(self._prepare_target, folder_path, filename)
 
-            async with aiofiles.open(file_path, "wb") as buffer:
-                await buffer.write(await file.read())
+            # ✅ 전체 파일을 메모리에 올리지 않고 청크 단위로 스트리밍 저장
+            try:
+                await self._stream_to_disk(file, file_path)
+            except BaseException:
+                await run_fs(self._release_target, file_path)  # 선점한 빈 파일 정리
+                raise
+            await run_fs(self._invalidate_files, folder_path)
 
             return str(file_path)
 
         except Exception as e:
             raise FileOperationError(f"파일 저장 실패: {str(e)}")
 
+    def _batch_workers(self, concurrency: Optional[int] = None) -> int:
+        """📌 일괄 업로드 동시 처리 수 (요청당 메모리 예산 ÷ 청크 크기로 제한)"""
+        budget_workers = max(1, settings.BATCH_UPLOAD_MEMORY_BUDGET // self.chunk_size)
+        return max(1, min(concurrency or settings.BATCH_UPLOAD_CONCURRENCY, budget_workers))
+
     async def save_multiple_pdfs(
         self,
         user_id: int,
         folder_name: str,
         files: List[UploadFile],
-        overwrite: bool = False
+        overwrite: bool = False,
+        concurrency: Optional[int] = None,
+        progress: Optional[ProgressCallback] = None
     ) -> dict:
-        """📌 여러 PDF 파일 일괄 저장 (병렬 처리)"""
+        """📌 여러 PDF 파일 일괄 저장 (동시 처리 수 제한 병렬 처리)"""
         try:
             user_id_str = str(user_id)
             if not all(self._validate_name(n) for n in [user_id_str, folder_name]):
                 raise FileOperationError("잘못된 문자가 포함된 이름")
 
             folder_path = self._sanitize_path(user_id, folder_name)
-            folder_path.mkdir(parents=True, exist_ok=True)
+            await run_fs(self._ensure_folder, folder_path)
 
+            workers = self._batch_workers(concurrency)
             results = {
                 "total": len(files),
+                "concurrency": workers,
                 "success": [],
                 "failed": []
             }
 
-            # 병렬 처리 코루틴 생성
-            tasks = [self._process_single_file(f, folder_path, overwrite) for f in files]
+            # 세마포어로 동시에 디스크에 기록하는 파일 수 제한 (메모리 사용량 = workers × chunk_size)
+            semaphore = asyncio.Semaphore(workers)
+
+            async def _bounded(file: UploadFile) -> dict:
+                async with semaphore:
+                    try:
+                        result = await self._process_single_file(file, folder_path, overwrite, progress)
+                    except Exception:
+                        if progress:
+                            await progress(file.filename, 0, file.size, "failed")
+                        raise
+                    if progress:
+                        await progress(file.filename, result["size"], result["size"], "done")
+                    return result
+
+            tasks = [_bounded(f) for f in files]
             file_results = await asyncio.gather(*tasks, return_exceptions=True)
 
             for result in file_results:
@@ -155,6 +268,9 @@ class FileStorageManager:
                 else:
                     results["success"].append(result)
 
+            if results["success"]:
+                await run_fs(self._invalidate_files, folder_path)
+
             return results
 
         except FileOperationError as e:
@@ -166,7 +282,8 @@ class FileStorageManager:
         self,
         file: UploadFile,
         folder_path: Path,
-        overwrite: bool
+        overwrite: bool,
+        progress: Optional[ProgressCallback] = None
     ) -> dict:
         """📌 개별 파일 처리 코루틴"""
         try:
@@ -182,17 +299,16 @@ class FileStorageManager:
             file_path = folder_path / filename
 
             # 덮어쓰기 방지
-            if file_path.exists() and not overwrite:
+            if not overwrite and await run_fs(file_path.exists):
                 raise ValueError(f"'{file.filename}': 동일한 파일명 존재")
 
-            # 비동기 저장
-            async with aiofiles.open(file_path, "wb") as buffer:
-                await buffer.write(await file.read())
+            # 비동기 스트리밍 저장
+            size = await self._stream_to_disk(file, file_path, progress)
 
             return {
                 "original_name": file.filename,
                 "saved_name": filename,
-                "size": file_path.stat().st_size,
+                "size": size,
                 "path": str(file_path)
             }
 
@@ -215,11 +331,19 @@ class FileStorageManager:
             if not folder_path.is_dir():
                 raise FileOperationError(f"'{folder_name}'은 폴더가 아닙니다.", 400)
 
+            # ✅ 캐시 적중 시 디렉터리 조회 생략
+            folder_key = self._folder_key(folder_path)
+            cached = self.cache.get_files(folder_key)
+            if cached is not None:
+                return cached[:limit]
+
+            all_files = [f.name for f in folder_path.iterdir() if f.is_file()]
+            self.cache.set_files(folder_key, all_files)
+
             # ✅ 최대 100개의 파일만 반환 (과부하 방지)
-            files = [f.name for f in folder_path.iterdir() if f.is_file()][:limit]
+            files = all_files[:limit]
 
-            # ✅ 디버깅 로그 추가
-            print(f"[DEBUG] '{folder_name}' 폴더 내 파일 개수: {len(files)}")
+            logger.debug(f"'{folder_name}' 폴더 내 파일 개수: {len(files)}")
 
             return files
 
@@ -229,12 +353,20 @@ class FileStorageManager:
             raise FileOperationError(f"파일 목록 조회 실패: {str(e)}", 500)    
 
 
+    def get_file_path(self, user_id: int, folder_name: str, filename: str) -> Path:
+        """📌 다운로드할 파일 경로 조회"""
+        file_path = self._sanitize_path(user_id, folder_name, filename)
+        if not file_path.is_file():
+            raise FileOperationError("파일을 찾을 수 없습니다.", 404)
+        return file_path
+
     def delete_file(self, user_id: int, folder_name: str, filename: str) -> None:
         """📌 파일 삭제"""
         try:
             file_path = self._sanitize_path(user_id, folder_name, filename)
             if file_path.exists():
                 file_path.unlink()
+                self._invalidate_files(file_path.parent)
             else:
                 raise FileOperationError("파일을 찾을 수 없습니다.", 404)
         except FileOperationError as e:
@@ -258,10 +390,15 @@ class FileStorageManager:
             new_name_with_ext = f"{new_name}{file_ext}"
 
             # 중복 처리
-            new_path = self.generate_unique_filename(old_path.parent, new_name_with_ext)
+            new_path = self.generate_unique_name(old_path.parent, new_name_with_ext)
 
-            # 파일명 변경
-            old_path.rename(new_path)
+            # 파일명 변경 (선점된 빈 파일을 덮어씀)
+            try:
+                old_path.rename(new_path)
+            except OSError:
+                new_path.unlink(missing_ok=True)
+                raise
+            self._invalidate_files(old_path.parent)
 
             return new_path
 
@@ -270,6 +407,39 @@ class FileStorageManager:
         except Exception as e:
             raise FileOperationError(f"파일 이름 변경 실패: {str(e)}")
 
+    def move_file(
+        self, user_id: int, old_folder: str, file_name: str, new_folder: str, create_if_not_exists: bool = False
+    ) -> Path:
+        """📌 파일을 다른 폴더로 이동 (중복 시 자동 숫자 추가)"""
+        try:
+            old_path = self._sanitize_path(user_id, old_folder, file_name)
+            if not old_path.is_file():
+                raise FileOperationError("파일을 찾을 수 없습니다.", 404)
+
+            # 대상 폴더 확인
+            new_folder_path = self._sanitize_path(user_id, new_folder)
+            if not new_folder_path.exists():
+                if create_if_not_exists:
+                    self._ensure_folder(new_folder_path)
+                else:
+                    raise FileOperationError("대상 폴더가 존재하지 않습니다.", 404)
+
+            # 중복 처리 후 이동
+            new_path = self.generate_unique_name(new_folder_path, old_path.name)
+            try:
+                old_path.rename(new_path)
+            except OSError:
+                new_path.unlink(missing_ok=True)
+                raise
+            self._invalidate_files(old_path.parent, new_folder_path)
+
+            return Path(f"/{user_id}/{new_folder}/{new_path.name}")  # ✅ 상대 경로 반환
+
+        except FileOperationError as e:
+            raise e
+        except Exception as e:
+            raise FileOperationError(f"파일 이동 실패: {str(e)}")
+
     # ==================================================
     # 2.4 폴더 관리 메서드
     # ==================================================
@@ -277,7 +447,7 @@ class FileStorageManager:
         """📌 폴더 생성 (멱등성 유지)"""
         try:
             folder_path = self._sanitize_path(user_id, folder_name)
-            folder_path.mkdir(parents=True, exist_ok=True)
+            self._ensure_folder(folder_path)
             return folder_path
         except Exception as e:
             raise FileOperationError(f"폴더 생성 실패: {str(e)}", 400)
@@ -288,57 +458,122 @@ class FileStorageManager:
             folder_path = self._sanitize_path(user_id, folder_name)
             if folder_path.exists():
                 shutil.rmtree(folder_path)
+                self._invalidate_files(folder_path)
+                self.cache.invalidate_folders(user_id)
         except FileNotFoundError:
             pass  # 이미 삭제된 경우 무시
         except Exception as e:
             raise FileOperationError(str(e), 500)
 
-    def list_folders(
-        self, user_id: int, include_subfolders: bool = False, skip: int = 0, limit: int = 100
-    ) -> List[FolderResponse]:
-        """📌 사용자 폴더 목록 조회"""
+    @staticmethod
+    def _encode_cursor(created_at: float, name: str) -> str:
+        """📌 페이지네이션 커서 인코딩 (마지막 항목의 생성 시각 + 이름)"""
+        raw = json.dumps([created_at, name], ensure_ascii=False).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[float, str]:
+        """📌 페이지네이션 커서 디코딩"""
+        try:
+            created_at, name = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            return float(created_at), str(name)
+        except Exception:
+            raise FileOperationError("잘못된 커서 값입니다.", 400)
+
+    def _scan_folder_index(self, user_path: Path) -> List[Tuple[float, str]]:
+        """📌 사용자 폴더 인덱스 [(생성 시각, 폴더명)] 조회 (캐시 → os.scandir)"""
+        user_id = user_path.name
+        cached = self.cache.get_folders(user_id)
+        if cached is not None:
+            return [(created_at, name) for created_at, name in cached]
+
+        index = []
+        with os.scandir(user_path) as it:
+            for entry in it:
+                if entry.is_dir() and self._validate_name(entry.name, is_file=False):
+                    index.append((entry.stat().st_ctime, entry.name))
+
+        self.cache.set_folders(user_id, index)
+        return index
+
+    def _list_subfolders(self, folder_path: Path, limit: int = 100) -> List[str]:
+        """📌 1단계 하위 폴더명 조회 (최대 limit개까지만 스캔)"""
+        with os.scandir(folder_path) as it:
+            return list(islice(
+                (e.name for e in it if e.is_dir() and self._validate_name(e.name, is_file=False)),
+                limit
+            ))
+
+    def list_folders_page(
+        self,
+        user_id: int,
+        include_subfolders: bool = False,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[FolderResponse], Optional[str]]:
+        """📌 사용자 폴더 목록 조회 (생성일 내림차순, 커서 기반 페이지네이션)
+
+        전체 폴더를 정렬하지 않고 heap으로 요청한 페이지만 선택하며,
+        응답 객체와 하위 폴더 조회는 페이지에 포함된 폴더에 대해서만 수행합니다.
+        반환값: (폴더 목록, 다음 페이지 커서 또는 None)
+        """
         try:
             user_path = self._sanitize_path(user_id)
-            print(f"[DEBUG] User path: {user_path}")  # 실제 환경에선 logging 사용
 
             if not user_path.exists():
-                print(f"[DEBUG] User folder does not exist: {user_path}")
-                return []
+                return [], None
+
+            index = self._scan_folder_index(user_path)
+
+            # 정렬 키: 생성일 내림차순, 같은 생성일은 이름 오름차순
+            sort_key = lambda item: (-item[0], item[1])
+
+            # 커서 이후 항목만 후보로 사용 (커서 사용 시 skip 무시)
+            if cursor:
+                after = sort_key(self._decode_cursor(cursor))
+                candidates = [item for item in index if sort_key(item) > after]
+                skip = 0
+            else:
+                candidates = index
+
+            # top-k 선택: O(n log k)
+            page = heapq.nsmallest(skip + limit, candidates, key=sort_key)[skip:]
 
             folders = []
-            for folder in user_path.iterdir():
-                print(f"[DEBUG] Processing folder: {folder}")
-                if folder.is_dir() and self._validate_name(folder.name, is_file=False):
-                    folder_info = FolderResponse(
-                        name=folder.name,
-                        relative_path=f"/{user_id}/{folder.name}",
-                        created_at=datetime.fromtimestamp(folder.stat().st_ctime),
-                        subfolders=[]
-                    )
-
-                    if include_subfolders:
-                        subfolders = [
-                            sub.name for sub in folder.iterdir()
-                            if sub.is_dir() and self._validate_name(sub.name, is_file=False)
-                        ][:100]
-                        folder_info.subfolders = subfolders
-
-                    folders.append(folder_info)
-
-            return sorted(folders, key=lambda x: x.created_at, reverse=True)[skip:skip + limit]
+            for created_at, name in page:
+                folder_info = FolderResponse(
+                    name=name,
+                    relative_path=f"/{user_id}/{name}",
+                    created_at=datetime.fromtimestamp(created_at),
+                    subfolders=[]
+                )
+                if include_subfolders:
+                    folder_info.subfolders = self._list_subfolders(user_path / name)
+                folders.append(folder_info)
+
+            next_cursor = None
+            if page and len(candidates) > skip + len(page):
+                next_cursor = self._encode_cursor(*page[-1])
+
+            return folders, next_cursor
 
+        except FileOperationError as e:
+            raise e
         except Exception as e:
             print(f"[ERROR] Failed to list folders: {str(e)}")
             raise FileOperationError(f"폴더 목록 조회 실패: {str(e)}", 500)
-        
-    def generate_unique_foldername(self, folder: Path) -> Path:   
-        """📌 중복 폴더 처리: `(1)`, `(2)` 추가"""
-        new_path = folder
-        count = 1
-        while new_path.exists():
-            new_path = folder.parent / f"{folder.name}({count})"
-            count += 1
-        return new_path    
+
+    def list_folders(
+        self, user_id: int, include_subfolders: bool = False, skip: int = 0, limit: int = 100
+    ) -> List[FolderResponse]:
+        """📌 사용자 폴더 목록 조회"""
+        folders, _ = self.list_folders_page(user_id, include_subfolders, skip, limit)
+        return folders
+
+    def generate_unique_foldername(self, folder: Path) -> Path:
+        """📌 중복 폴더 처리: `(1)`, `(2)` 추가 (빈 폴더로 선점하여 반환)"""
+        return name_allocator.allocate(folder.parent, folder.name, is_dir=True)
 
     def move_folder(
         self, user_id: int, old_folder: str, new_folder: str, create_if_not_exists: bool = False
@@ -348,7 +583,7 @@ class FileStorageManager:
             old_folder = self._sanitize_name(old_folder, is_file=False)
             new_folder = self._sanitize_name(new_folder, is_file=False)
 
-            if not self._validate_foldername(old_folder) or not self._validate_foldername(new_folder):
+            if not self._validate_name(old_folder, is_file=False) or not self._validate_name(new_folder, is_file=False):
                 raise FileOperationError("유효하지 않은 폴더명")
 
             # 기존 폴더 확인
@@ -362,19 +597,110 @@ class FileStorageManager:
             # 폴더 자동 생성 여부 체크
             if not new_folder_path.exists():
                 if create_if_not_exists:
-                    new_folder_path.mkdir(parents=True, exist_ok=True)
+                    self._ensure_folder(new_folder_path)
                 else:
                     raise FileOperationError("대상 폴더가 존재하지 않습니다.")
 
             # 같은 폴더명이 존재하는 경우 `(1)`, `(2)` 숫자 붙이기
-            new_path = self.generate_unique_name(new_folder_path, old_path.name)
+            new_path = self.generate_unique_foldername(new_folder_path / old_path.name)
 
-            # 폴더 이동
-            shutil.move(str(old_path), str(new_path))
+            # 폴더 이동 (선점된 빈 폴더를 원자적으로 교체)
+            try:
+                os.replace(old_path, new_path)
+            except OSError:
+                new_path.rmdir()
+                raise
+            self._invalidate_files(old_path)
+            self.cache.invalidate_folders(user_id)
 
             return Path(f"/{user_id}/{new_path.name}")  # ✅ 상대 경로 반환
 
         except FileOperationError as e:
             raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
-            raise HTTPException(status_code=500, detail=f"폴더 이동 실패: {str(e)}")   
\ No newline at end of file
+            raise HTTPException(status_code=500, detail=f"폴더 이동 실패: {str(e)}")
+
+
+async def run_blob_gc(interval_seconds: int) -> None:
+    """📌 주기적으로 참조되지 않는 blob을 정리하는 백그라운드 작업"""
+    storage = FileStorageManager()
+    if storage.blobs is None:
+        return
+    while True:
+        try:
+            await run_fs(storage.blobs.purge_orphans)
+        except Exception:
+            logger.exception("Failed to purge orphan blobs")
+        await asyncio.sleep(interval_seconds)
+
+
+# ==================================================
+# 3. 비동기 파사드
+# ==================================================
+class AsyncFileStorageManager:
+    """📂 FileStorageManager 비동기 파사드
+
+    블로킹 파일시스템 작업(iterdir, rmtree, move, rename 등)을
+    전용 스레드 풀에서 실행하여 이벤트 루프(및 WebSocket)가 멈추지 않도록 합니다.
+    """
+
+    def __init__(self, storage: Optional[FileStorageManager] = None):
+        self.storage = storage or FileStorageManager()
+
+    # 업로드는 이미 비동기로 구현되어 있으므로 그대로 위임
+    async def save_pdf(self, user_id: int, folder_name: str, file: UploadFile) -> str:
+        return await self.storage.save_pdf(user_id, folder_name, file)
+
+    async def save_multiple_pdfs(
+        self,
+        user_id: int,
+        folder_name: str,
+        files: List[UploadFile],
+        overwrite: bool = False,
+        concurrency: Optional[int] = None,
+        progress: Optional[ProgressCallback] = None
+    ) -> dict:
+        return await self.storage.save_multiple_pdfs(user_id, folder_name, files, overwrite, concurrency, progress)
+
+    async def list_files(self, user_id: int, folder_name: str, limit: int = 100) -> List[str]:
+        return await run_fs(self.storage.list_files, user_id, folder_name, limit)
+
+    async def get_file_path(self, user_id: int, folder_name: str, filename: str) -> Path:
+        return await run_fs(self.storage.get_file_path, user_id, folder_name, filename)
+
+    async def delete_file(self, user_id: int, folder_name: str, filename: str) -> None:
+        return await run_fs(self.storage.delete_file, user_id, folder_name, filename)
+
+    async def rename_file(self, user_id: int, folder_name: str, file_name: str, new_name: str) -> Path:
+        return await run_fs(self.storage.rename_file, user_id, folder_name, file_name, new_name)
+
+    async def move_file(
+        self, user_id: int, old_folder: str, file_name: str, new_folder: str, create_if_not_exists: bool = False
+    ) -> Path:
+        return await run_fs(self.storage.move_file, user_id, old_folder, file_name, new_folder, create_if_not_exists)
+
+    async def create_folder(self, user_id: int, folder_name: str) -> Path:
+        return await run_fs(self.storage.create_folder, user_id, folder_name)
+
+    async def delete_folder(self, user_id: int, folder_name: str) -> None:
+        return await run_fs(self.storage.delete_folder, user_id, folder_name)
+
+    async def list_folders(
+        self, user_id: int, include_subfolders: bool = False, skip: int = 0, limit: int = 100
+    ) -> List[FolderResponse]:
+        return await run_fs(self.storage.list_folders, user_id, include_subfolders, skip, limit)
+
+    async def list_folders_page(
+        self,
+        user_id: int,
+        include_subfolders: bool = False,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[FolderResponse], Optional[str]]:
+        return await run_fs(self.storage.list_folders_page, user_id, include_subfolders, skip, limit, cursor)
+
+    async def move_folder(
+        self, user_id: int, old_folder: str, new_folder: str, create_if_not_exists: bool = False
+    ) -> Path:
+        return await run_fs(self.storage.move_folder, user_id, old_folder, new_folder, create_if_not_exists)
@@ -0,0 +1,123 @@
+import json
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from redis import Redis, RedisError
+
+from app.core.config import settings
+from app.core.redis_helper import get_cache_redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class DirectoryListingCache:
+    """📂 파일/폴더 목록 Redis 캐시 (쓰기 시점 무효화)
+
+    - 파일 목록: `file_list:<user_id>/<folder>` → 파일명 JSON 배열
+    - 폴더 목록: `folder_list:<user_id>` → [생성 시각, 폴더명] JSON 배열
+
+    Redis 장애 시에는 캐시 미스로 처리하여 파일시스템 조회로 대체합니다.
+    """
+
+    FILE_LIST_KEY = "file_list:{folder}"
+    FOLDER_LIST_KEY = "folder_list:{user_id}"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._errors = 0
+
+    # ==================================================
+    # 1. 내부 유틸리티
+    # ==================================================
+    @property
+    def client(self) -> Redis:
+        """📌 캐시 전용 Redis 클라이언트"""
+        return get_cache_redis_client()
+
+    def _count(self, field: str) -> None:
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def _get(self, key: str) -> Optional[Any]:
+        try:
+            cached = self.client.get(key)
+        except RedisError as e:
+            self._count("_errors")
+            logger.warning(f"목록 캐시 조회 실패 - {key}, Error: {str(e)}")
+            cached = None
+
+        if cached is None:
+            self._count("_misses")
+            return None
+
+        self._count("_hits")
+        return json.loads(cached)
+
+    def _set(self, key: str, value: Any, ttl: int) -> None:
+        try:
+            self.client.set(key, json.dumps(value, default=str), ex=ttl)
+        except RedisError as e:
+            self._count("_errors")
+            logger.warning(f"목록 캐시 저장 실패 - {key}, Error: {str(e)}")
+
+    def _delete(self, *keys: str) -> None:
+        try:
+            self.client.delete(*keys)
+            self._count("_invalidations")
+        except RedisError as e:
+            self._count("_errors")
+            logger.warning(f"목록 캐시 무효화 실패 - {keys}, Error: {str(e)}")
+
+    # ==================================================
+    # 2. 파일 목록
+    # ==================================================
+    def get_files(self, folder: str) -> Optional[List[str]]:
+        """📌 폴더(`<user_id>/<folder>`)의 캐시된 파일 목록 조회"""
+        return self._get(self.FILE_LIST_KEY.format(folder=folder))
+
+    def set_files(self, folder: str, files: List[str]) -> None:
+        """📌 폴더의 파일 목록 캐시 저장"""
+        self._set(self.FILE_LIST_KEY.format(folder=folder), files, settings.FILE_LIST_CACHE_TTL)
+
+    def invalidate_files(self, *folders: str) -> None:
+        """📌 폴더들의 파일 목록 캐시 무효화"""
+        if folders:
+            self._delete(*(self.FILE_LIST_KEY.format(folder=f) for f in folders))
+
+    # ==================================================
+    # 3. 폴더 목록
+    # ==================================================
+    def get_folders(self, user_id: int) -> Optional[List[List[Any]]]:
+        """📌 사용자의 캐시된 폴더 인덱스 [(생성 시각, 폴더명)] 조회"""
+        return self._get(self.FOLDER_LIST_KEY.format(user_id=user_id))
+
+    def set_folders(self, user_id: int, folders: List[Tuple[float, str]]) -> None:
+        """📌 사용자의 폴더 인덱스 캐시 저장"""
+        self._set(self.FOLDER_LIST_KEY.format(user_id=user_id), folders, settings.FOLDER_LIST_CACHE_TTL)
+
+    def invalidate_folders(self, user_id: int) -> None:
+        """📌 사용자의 폴더 인덱스 캐시 무효화"""
+        self._delete(self.FOLDER_LIST_KEY.format(user_id=user_id))
+
+    # ==================================================
+    # 4. 모니터링
+    # ==================================================
+    def stats(self) -> Dict[str, Any]:
+        """📌 캐시 적중/미스 지표 조회"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+                "invalidations": self._invalidations,
+                "errors": self._errors
+            }
+
+
+# 프로세스당 하나의 캐시 인스턴스를 공유 (적중률 지표 누적)
+listing_cache = DirectoryListingCache()
@@ -0,0 +1,98 @@
+import os
+import re
+import logging
+from pathlib import Path
+from typing import Tuple
+
+from redis import RedisError
+
+from app.core.redis_helper import get_cache_redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class UniqueNameAllocator:
+    """📂 중복 없는 파일/폴더명 할당기
+
+    `이름(1)`, `이름(2)` ... 접미사를 Redis INCR 카운터로 발급하고,
+    `O_EXCL` 생성(폴더는 `mkdir`)으로 경로를 선점하여 동시 업로드에서도 충돌하지 않습니다.
+    카운터가 없거나 Redis 장애 시에는 디렉터리를 한 번만 스캔하여 최대 접미사를 구합니다.
+    """
+
+    COUNTER_KEY = "name_seq:{folder}:{name}"
+    COUNTER_TTL = 24 * 60 * 60
+    MAX_ATTEMPTS = 100
+
+    # ==================================================
+    # 1. 내부 유틸리티
+    # ==================================================
+    @staticmethod
+    def _split(name: str, is_dir: bool) -> Tuple[str, str]:
+        """📌 이름을 (stem, 확장자)로 분리 (폴더는 확장자 없음)"""
+        return (name, "") if is_dir else os.path.splitext(name)
+
+    @staticmethod
+    def _claim(path: Path, is_dir: bool) -> bool:
+        """📌 경로 원자적 선점 (이미 존재하면 False)"""
+        try:
+            if is_dir:
+                os.mkdir(path)
+            else:
+                os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+            return True
+        except FileExistsError:
+            return False
+
+    @staticmethod
+    def _max_suffix(folder: Path, stem: str, ext: str) -> int:
+        """📌 폴더에 존재하는 `stem(n)ext` 중 최대 n (디렉터리 1회 스캔)"""
+        pattern = re.compile(rf"^{re.escape(stem)}\((\d+)\){re.escape(ext)}$")
+        max_n = 0
+        with os.scandir(folder) as it:
+            for entry in it:
+                match = pattern.match(entry.name)
+                if match:
+                    max_n = max(max_n, int(match.group(1)))
+        return max_n
+
+    def _next_suffix(self, folder: Path, name: str, stem: str, ext: str) -> int:
+        """📌 다음 접미사 발급 (Redis INCR, 최초 발급 시 기존 최대값으로 보정)"""
+        key = self.COUNTER_KEY.format(folder=folder, name=name)
+        try:
+            client = get_cache_redis_client()
+            n = client.incr(key)
+            if n == 1:
+                existing = self._max_suffix(folder, stem, ext)
+                if existing:
+                    n = client.incrby(key, existing)
+            client.expire(key, self.COUNTER_TTL)
+            return n
+        except RedisError as e:
+            logger.warning(f"파일명 카운터 조회 실패 - {key}, Error: {str(e)}")
+            return self._max_suffix(folder, stem, ext) + 1
+
+    # ==================================================
+    # 2. 할당
+    # ==================================================
+    def allocate(self, folder: Path, name: str, is_dir: bool = False) -> Path:
+        """
+        📌 중복되지 않는 경로를 선점하여 반환
+
+        파일은 빈 파일, 폴더는 빈 폴더가 생성된 상태로 반환되며
+        호출자는 os.replace / os.rename 으로 해당 경로를 덮어씁니다.
+        """
+        path = folder / name
+        if self._claim(path, is_dir):
+            return path
+
+        stem, ext = self._split(name, is_dir)
+        for _ in range(self.MAX_ATTEMPTS):
+            n = self._next_suffix(folder, name, stem, ext)
+            path = folder / f"{stem}({n}){ext}"
+            if self._claim(path, is_dir):
+                return path
+
+        raise FileExistsError(f"고유한 이름을 할당할 수 없습니다: {name}")
+
+
+name_allocator = UniqueNameAllocator()
@@ -1,69 +1,94 @@
 # app/services/notification_service.py
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
-from app.crud.crud_notification import create_notification
-from app.crud.crud_team import check_user_in_team
+from app.crud.crud_notification import create_notification, create_notifications
+from app.crud.crud_tag import get_user_ids_by_usernames
+from app.crud.crud_team import filter_team_member_ids
+from app.models.tag import PDFTagMention
 from app.models.user import User
-from app.core.redis_helper import get_redis_client
+from app.core.redis_helper import publish_message, publish_messages
+from app.db.events import add_post_commit_hook
 
 async def create_mention_notifications(
     db: Session,
     tag_id: int,
     team_id: Optional[int],
     mentioned_usernames: List[str],
-    mentioner_id: int
+    mentioner_id: int,
+    commit: bool = True
 ) -> List[int]:
-    """멘션된 사용자들에게 알림 생성"""
+    """
+    멘션된 사용자들에게 알림 생성
+    
+    사용자 조회(IN 1회), 팀 멤버 확인(1회), 알림 일괄 INSERT,
+    실시간 알림 파이프라인 발행(Redis 왕복 1회)으로 멘션 인원과 무관하게 처리합니다.
+    실시간 알림은 커밋 후처리로 등록되므로, commit=False면 호출자의 커밋이 성공한 뒤 발행됩니다.
+    """
     # 멘션한 사용자 조회
     mentioner = db.query(User).filter(User.id == mentioner_id).first()
     if not mentioner:
         return []
     
-    # 알림 생성된 사용자 ID 목록
-    notified_user_ids = []
-    
-    for username in mentioned_usernames:
-        # 멘션된 사용자 조회
-        mentioned_user = db.query(User).filter(User.username == username).first()
-        if not mentioned_user:
-            continue
-        
-        # 팀스페이스가 있는 경우, 해당 팀의 멤버인지 확인
-        if team_id and not check_user_in_team(db, team_id, mentioned_user.id):
-            continue
-        
-        # 자기 자신을 멘션한 경우는 알림 생성하지 않음
-        if mentioned_user.id == mentioner_id:
-            continue
-        
-        # 알림 메시지 생성
-        message = f"{mentioner.username}님이 문서에서 회원님을 멘션했습니다: @{username}"
-        link = f"/pdf/{team_id}/tag/{tag_id}" if team_id else f"/tag/{tag_id}"
-        
-        # 알림 생성
-        notification = create_notification(
-            db=db,
-            user_id=mentioned_user.id,
-            type="mention",
-            message=message,
-            link=link
-        )
-        
-        # 실시간 알림 발송
-        redis_client = get_redis_client()
-        await redis_client.publish(
-            f"user:{mentioned_user.id}",
+    # 멘션된 사용자 일괄 조회 (자기 자신을 멘션한 경우는 알림 생성하지 않음)
+    user_ids = {
+        username: user_id
+        for username, user_id in get_user_ids_by_usernames(db, mentioned_usernames).items()
+        if user_id != mentioner_id
+    }
+    
+    # 팀스페이스가 있는 경우, 해당 팀의 멤버만 알림 대상
+    if team_id and user_ids:
+        members = filter_team_member_ids(db, team_id, list(user_ids.values()))
+        user_ids = {username: user_id for username, user_id in user_ids.items() if user_id in members}
+    
+    if not user_ids:
+        return []
+    
+    link = f"/pdf/{team_id}/tag/{tag_id}" if team_id else f"/tag/{tag_id}"
+    notifications = create_notifications(
+        db=db,
+        notifications=[
+            {
+                "user_id": user_id,
+                "type": "mention",
+                "message": f"{mentioner.username}님이 문서에서 회원님을 멘션했습니다: @{username}",
+                "link": link
+            }
+            for username, user_id in user_ids.items()
+        ],
+        commit=False
+    )
+    
+    # 커밋 시 객체가 만료되므로 flush 직후 발행할 메시지 구성 (추가 SELECT 방지)
+    messages = [
+        (
+            f"user:{notification.user_id}",
             {
                 "type": "notification",
                 "notification_id": notification.id,
-                "message": message,
+                "message": notification.message,
                 "notification_type": "mention",
                 "link": link,
                 "created_at": notification.created_at.isoformat()
             }
         )
-        
-        notified_user_ids.append(mentioned_user.id)
+        for notification in notifications
+    ]
+    notified_user_ids = [notification.user_id for notification in notifications]
+    
+    # 멘션 알림 발송 여부 기록 (같은 트랜잭션)
+    db.query(PDFTagMention).filter(
+        PDFTagMention.tag_id == tag_id,
+        PDFTagMention.mentioned_user_id.in_(notified_user_ids)
+    ).update({PDFTagMention.notification_sent: True}, synchronize_session=False)
+    
+    # 실시간 알림 발송 (커밋 후 파이프라인으로 일괄 발행)
+    async def _publish() -> None:
+        await publish_messages(messages)
+    
+    add_post_commit_hook(db, _publish)
+    if commit:
+        db.commit()
     
     return notified_user_ids
 
@@ -103,8 +128,7 @@ async def create_chat_notification(
     )
     
     # 실시간 알림 발송
-    redis_client = get_redis_client()
-    await redis_client.publish(
+    await publish_message(
         f"user:{receiver_id}",
         {
             "type": "notification",
@@ -148,8 +172,7 @@ async def create_team_invitation_notification(
     )
     
     # 실시간 알림 발송
-    redis_client = get_redis_client()
-    await redis_client.publish(
+    await publish_message(
         f"user:{invitee_id}",
         {
             "type": "notification",
@@ -184,8 +207,7 @@ async def create_system_notification(
     )
     
     # 실시간 알림 발송
-    redis_client = get_redis_client()
-    await redis_client.publish(
+    await publish_message(
         f"user:{user_id}",
         {
             "type": "notification",
@@ -0,0 +1,154 @@
+# app/services/pdf_text_service.py
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.pdf_process_pool import count_pages, extract_pages, get_process_pool
+from app.core.redis_helper import get_redis_client
+from app.db.session import SessionLocal
+from app.models.tag import PDFFile, PDFPageText
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_KEY = "pdf_text_index:{pdf_id}"
+
+# ------------------------------------------------------
+# 진행률 관리
+# ------------------------------------------------------
+
+async def _set_progress(pdf_id: int, status: str, total_pages: int = 0, done_pages: int = 0, error: Optional[str] = None):
+    """텍스트 추출 진행률 저장 (Redis 해시)"""
+    redis_client = get_redis_client()
+    data = {
+        "status": status,
+        "total_pages": total_pages,
+        "done_pages": done_pages,
+        "updated_at": datetime.utcnow().isoformat()
+    }
+    if error:
+        data["error"] = error
+    try:
+        await redis_client.hset(PROGRESS_KEY.format(pdf_id=pdf_id), mapping=data)
+    except Exception as e:
+        logger.error(f"텍스트 추출 진행률 저장 실패 - PDF ID: {pdf_id}, 오류: {str(e)}")
+
+async def get_index_progress(pdf_id: int) -> Dict[str, Any]:
+    """
+    텍스트 추출 진행률 조회
+
+    Returns:
+        status(pending/running/done/failed), total_pages, done_pages 등
+    """
+    redis_client = get_redis_client()
+    try:
+        data = await redis_client.hgetall(PROGRESS_KEY.format(pdf_id=pdf_id))
+    except Exception as e:
+        logger.error(f"텍스트 추출 진행률 조회 실패 - PDF ID: {pdf_id}, 오류: {str(e)}")
+        data = {}
+
+    if not data:
+        return {"pdf_id": pdf_id, "status": "unknown", "total_pages": 0, "done_pages": 0}
+
+    return {
+        "pdf_id": pdf_id,
+        **data,
+        "total_pages": int(data.get("total_pages", 0)),
+        "done_pages": int(data.get("done_pages", 0))
+    }
+
+# ------------------------------------------------------
+# 인덱싱
+# ------------------------------------------------------
+
+async def ingest_pdf(pdf_id: int) -> int:
+    """
+    PDF의 페이지별 텍스트를 추출하여 pdf_page_texts 테이블에 저장
+
+    페이지를 일정 크기 배치로 나누어 프로세스 풀에서 병렬 추출하고,
+    모든 페이지가 저장된 후 한 번에 커밋하여 부분 인덱스가 노출되지 않도록 합니다.
+
+    Returns:
+        저장된 페이지 수
+    """
+    db: Session = SessionLocal()
+    loop = asyncio.get_running_loop()
+    pool = get_process_pool()
+    try:
+        pdf_file = db.query(PDFFile).filter(PDFFile.id == pdf_id).first()
+        if not pdf_file:
+            return 0
+
+        await _set_progress(pdf_id, "running")
+        total = await loop.run_in_executor(pool, count_pages, pdf_file.file_path)
+        await _set_progress(pdf_id, "running", total, 0)
+
+        # 기존 인덱스 교체
+        db.query(PDFPageText).filter(PDFPageText.pdf_id == pdf_id).delete(synchronize_session=False)
+
+        batch_size = settings.PDF_EXTRACT_BATCH_PAGES
+        futures = [
+            loop.run_in_executor(pool, extract_pages, pdf_file.file_path, start, min(start + batch_size - 1, total))
+            for start in range(1, total + 1, batch_size)
+        ]
+
+        done = 0
+        for future in asyncio.as_completed(futures):
+            pages = await future
+            db.bulk_insert_mappings(
+                PDFPageText,
+                [{"pdf_id": pdf_id, "page": page_no, "content": text} for page_no, text in pages]
+            )
+            done += len(pages)
+            await _set_progress(pdf_id, "running", total, done)
+
+        db.commit()
+        await _set_progress(pdf_id, "done", total, done)
+        return done
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"PDF 텍스트 추출 실패 - PDF ID: {pdf_id}, 오류: {str(e)}")
+        await _set_progress(pdf_id, "failed", error=str(e))
+        return 0
+    finally:
+        db.close()
+
+async def schedule_ingest(pdf_id: int) -> None:
+    """텍스트 추출 작업 예약 (대기 상태 기록 후 실행)"""
+    await _set_progress(pdf_id, "pending")
+    await ingest_pdf(pdf_id)
+
+async def ingest_saved_files(file_paths: List[str]) -> None:
+    """
+    업로드 직후 호출: 저장된 경로에 등록된 PDF 문서가 있으면 텍스트 추출
+
+    Args:
+        file_paths: save_pdf / save_multiple_pdfs 가 반환한 파일 경로 목록
+    """
+    if not file_paths:
+        return
+
+    db: Session = SessionLocal()
+    try:
+        pdf_ids = [
+            pdf_id for (pdf_id,) in
+            db.query(PDFFile.id).filter(PDFFile.file_path.in_(file_paths)).all()
+        ]
+    finally:
+        db.close()
+
+    for pdf_id in pdf_ids:
+        await schedule_ingest(pdf_id)
+
+def get_page_text(db: Session, pdf_id: int, page: int) -> Optional[str]:
+    """인덱싱된 페이지 텍스트 조회"""
+    row = (
+        db.query(PDFPageText.content)
+        .filter(PDFPageText.pdf_id == pdf_id, PDFPageText.page == page)
+        .first()
+    )
+    return row[0] if row else None
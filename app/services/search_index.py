@@ -0,0 +1,137 @@
+# app/services/search_index.py
+import html
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Hashable, Iterable, List, Set, Tuple
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    검색용 토큰 분리 (PostgreSQL 'simple' 설정과 동일하게 소문자 단어 단위)
+    """
+    return [t.lower() for t in _TOKEN_PATTERN.findall(text or "")]
+
+
+def _matches(word: str, terms: Set[str]) -> bool:
+    """단어가 검색어 중 하나를 부분 문자열로 포함하는지 (ILIKE '%검색어%'와 동일)"""
+    word = word.lower()
+    return any(term in word for term in terms)
+
+
+def make_snippet(text: str, terms: Iterable[str], width: int = 120) -> str:
+    """
+    첫 번째 일치 위치를 중심으로 본문 일부를 잘라 반환 (일치 단어는 <b></b>로 강조)
+
+    원문은 HTML 이스케이프한 뒤 강조 태그를 붙이므로 반환값에는 <b></b> 외의 태그가 없습니다.
+
+    Args:
+        text: 원문
+        terms: 검색어 토큰
+        width: 스니펫 최대 길이 (문자 수)
+    """
+    text = text or ""
+    terms = {t.lower() for t in terms}
+    match = next(
+        (m for m in _TOKEN_PATTERN.finditer(text) if _matches(m.group(), terms)),
+        None
+    )
+
+    start = max(0, match.start() - width // 3) if match else 0
+    end = min(len(text), start + width)
+    piece = text[start:end]
+
+    parts = []
+    pos = 0
+    for m in _TOKEN_PATTERN.finditer(piece):
+        parts.append(html.escape(piece[pos:m.start()]))
+        word = html.escape(m.group())
+        parts.append(f"<b>{word}</b>" if _matches(m.group(), terms) else word)
+        pos = m.end()
+    parts.append(html.escape(piece[pos:]))
+
+    return ("..." if start > 0 else "") + "".join(parts) + ("..." if end < len(text) else "")
+
+
+class InvertedIndex:
+    """
+    순수 Python 역색인 (PostgreSQL 전문 검색을 사용할 수 없는 환경용 대체 구현)
+
+    문서별 단어 빈도를 posting 목록으로 저장하고, BM25 점수로 순위를 매깁니다.
+    검색어는 단어의 부분 문자열로 일치시키고("데이터베이스" → "데이터베이스를"),
+    모든 검색어를 포함하는 문서만 반환하여 PostgreSQL의 ILIKE AND 조건과 같은 의미를 가집니다.
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[Hashable, int]] = defaultdict(dict)
+        self._lengths: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def add(self, key: Hashable, text: str) -> None:
+        """문서 추가 (같은 키가 있으면 교체)"""
+        if key in self._lengths:
+            self.remove(key)
+        tokens = tokenize(text)
+        for token, tf in Counter(tokens).items():
+            self._postings[token][key] = tf
+        self._lengths[key] = len(tokens)
+
+    def remove(self, key: Hashable) -> None:
+        """문서 제거"""
+        if self._lengths.pop(key, None) is None:
+            return
+        for token in [t for t, docs in self._postings.items() if key in docs]:
+            del self._postings[token][key]
+            if not self._postings[token]:
+                del self._postings[token]
+
+    def _term_postings(self, term: str) -> Dict[Hashable, int]:
+        """검색어를 부분 문자열로 포함하는 모든 단어의 posting을 합친 문서별 빈도"""
+        merged: Dict[Hashable, int] = defaultdict(int)
+        for token, docs in self._postings.items():
+            if term in token:
+                for key, tf in docs.items():
+                    merged[key] += tf
+        return merged
+
+    def search(self, query: str) -> List[Tuple[Hashable, float]]:
+        """
+        검색어를 모두 포함하는 문서를 점수 내림차순으로 반환
+
+        Returns:
+            (문서 키, BM25 점수) 목록
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self._lengths:
+            return []
+
+        postings = [self._term_postings(t) for t in terms]
+        if not all(postings):
+            return []
+
+        # 가장 짧은 posting 목록부터 교집합 계산
+        candidates = set(min(postings, key=len))
+        for docs in postings:
+            candidates &= docs.keys()
+
+        n = len(self._lengths)
+        avg_len = sum(self._lengths.values()) / n
+        scores = []
+        for key in candidates:
+            length_norm = self.K1 * (1 - self.B + self.B * self._lengths[key] / avg_len)
+            score = 0.0
+            for docs in postings:
+                idf = math.log(1 + (n - len(docs) + 0.5) / (len(docs) + 0.5))
+                tf = docs[key]
+                score += idf * tf * (self.K1 + 1) / (tf + length_norm)
+            scores.append((key, score))
+
+        scores.sort(key=lambda item: item[1], reverse=True)
+        return scores
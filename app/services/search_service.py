@@ -0,0 +1,227 @@
+# app/services/search_service.py
+import html
+from typing import List, Dict, Any, Optional, Tuple
+from sqlalchemy import and_, func, literal_column, or_
+from sqlalchemy.orm import Session, Query
+from app.crud.crud_team import check_user_in_team
+from app.models.tag import PDFTag, PDFFile, PDFPageText
+from app.models.team import TeamMember
+from app.services.search_index import InvertedIndex, make_snippet, tokenize
+
+# 검색 조건은 검색어별 ILIKE '%검색어%' (pg_trgm GIN 인덱스 사용)
+# → 조사가 붙은 한국어 단어("데이터베이스를")와 단어 일부도 일치
+# 순위와 스니펫은 접두어 tsquery('검색어':*)로 계산 (한국어 형태소 사전이 없으므로 'simple')
+TS_CONFIG = literal_column("'simple'::regconfig")
+
+# ts_headline은 원문을 이스케이프하지 않으므로 제어 문자로 강조 위치만 표시하고,
+# 이스케이프한 뒤 <b></b>로 치환
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_STOP = "\x03"
+HEADLINE_OPTIONS = (
+    f'StartSel="{HIGHLIGHT_START}", StopSel="{HIGHLIGHT_STOP}", '
+    "MaxWords=25, MinWords=10, MaxFragments=1"
+)
+
+def _is_postgres(db: Session) -> bool:
+    """PostgreSQL 전문 검색 사용 가능 여부"""
+    return db.get_bind().dialect.name == "postgresql"
+
+def _ts_vector(column):
+    return func.to_tsvector(TS_CONFIG, column)
+
+def _ts_query(terms: List[str]):
+    """검색어 토큰별 접두어 일치 tsquery ('a':* & 'b':*) - 토큰은 \\w+ 이므로 따옴표 처리로 충분"""
+    return func.to_tsquery(TS_CONFIG, " & ".join(f"'{term}':*" for term in terms))
+
+def _contains_all(column, terms: List[str]):
+    """모든 검색어를 부분 문자열로 포함 (대소문자 무시, LIKE 특수문자 이스케이프)"""
+    return and_(*(
+        column.ilike(
+            "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%",
+            escape="\\"
+        )
+        for term in terms
+    ))
+
+def _highlight(snippet: str) -> str:
+    """ts_headline 결과를 HTML 이스케이프한 뒤 강조 표시를 <b></b>로 변환"""
+    return (
+        html.escape(snippet or "")
+        .replace(HIGHLIGHT_START, "<b>")
+        .replace(HIGHLIGHT_STOP, "</b>")
+    )
+
+def accessible_pdfs(db: Session, query: Query, user_id: int, team_id: Optional[int] = None) -> Query:
+    """PDFFile이 조인된 쿼리를 사용자가 접근 가능한 PDF로 제한"""
+    if team_id:
+        return query.filter(PDFFile.team_id == team_id)
+
+    team_ids = (
+        db.query(TeamMember.team_id)
+        .filter(TeamMember.user_id == user_id)
+    )
+    return query.filter(
+        or_(
+            PDFFile.owner_id == user_id,  # 개인 소유 PDF
+            PDFFile.team_id.in_(team_ids)  # 속한 팀의 PDF
+        )
+    )
+
+def match_annotations(db: Session, base_query: Query, query: str, skip: int = 0, limit: int = 50) -> List[PDFTag]:
+    """
+    주석 쿼리에 전문 검색 조건을 적용하여 관련도 순으로 반환
+
+    Args:
+        base_query: PDFTag 조회 쿼리 (권한 필터 적용 상태)
+        query: 검색어
+    """
+    terms = list(dict.fromkeys(tokenize(query)))
+    if not terms:
+        return []
+
+    if _is_postgres(db):
+        vector = _ts_vector(PDFTag.content)
+        ts_query = _ts_query(terms)
+        return (
+            base_query
+            .filter(_contains_all(PDFTag.content, terms))
+            .order_by(func.ts_rank_cd(vector, ts_query).desc(), PDFTag.id.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
+    # 대체 구현: 후보 주석을 메모리 역색인으로 검색
+    tags = {tag.id: tag for tag in base_query.all()}
+    index = InvertedIndex()
+    for tag in tags.values():
+        index.add(tag.id, tag.content)
+    return [tags[tag_id] for tag_id, _ in index.search(query)[skip:skip + limit]]
+
+def _search_postgres(
+    db: Session, user_id: int, query: str, team_id: Optional[int], scope: str, window: int
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """PostgreSQL 부분 문자열(pg_trgm GIN) 검색: 소스별 상위 window건과 전체 건수"""
+    terms = list(dict.fromkeys(tokenize(query)))
+    ts_query = _ts_query(terms)
+    total = 0
+    hits = []
+
+    sources = []
+    if scope in ("all", "annotations"):
+        sources.append(("annotation", PDFTag, PDFTag.pdf_id))
+    if scope in ("all", "pages"):
+        sources.append(("page", PDFPageText, PDFPageText.pdf_id))
+
+    for hit_type, model, pdf_column in sources:
+        vector = _ts_vector(model.content)
+        matched = accessible_pdfs(
+            db,
+            db.query(model).join(PDFFile, pdf_column == PDFFile.id).filter(_contains_all(model.content, terms)),
+            user_id,
+            team_id
+        )
+        total += matched.with_entities(func.count(model.id)).scalar()
+
+        rank = func.ts_rank_cd(vector, ts_query).label("rank")
+        snippet = func.ts_headline(TS_CONFIG, model.content, ts_query, HEADLINE_OPTIONS).label("snippet")
+        rows = (
+            matched
+            .with_entities(model.id, model.pdf_id, model.page, PDFFile.filename, PDFFile.team_id, rank, snippet)
+            .order_by(rank.desc(), model.id.desc())
+            .limit(window)
+            .all()
+        )
+        hits.extend(
+            {
+                "type": hit_type,
+                "id": row.id,
+                "pdf_id": row.pdf_id,
+                "file_name": row.filename,
+                "team_id": row.team_id,
+                "page": row.page,
+                "rank": float(row.rank),
+                "snippet": _highlight(row.snippet)
+            }
+            for row in rows
+        )
+
+    return total, hits
+
+def _search_fallback(
+    db: Session, user_id: int, query: str, team_id: Optional[int], scope: str
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """PostgreSQL 이외 환경(테스트 등): 순수 Python 역색인 검색"""
+    docs = {}
+    if scope in ("all", "annotations"):
+        for tag, pdf_file in accessible_pdfs(
+            db, db.query(PDFTag, PDFFile).join(PDFFile, PDFTag.pdf_id == PDFFile.id), user_id, team_id
+        ):
+            docs[("annotation", tag.id)] = (tag, pdf_file)
+    if scope in ("all", "pages"):
+        for page_text, pdf_file in accessible_pdfs(
+            db, db.query(PDFPageText, PDFFile).join(PDFFile, PDFPageText.pdf_id == PDFFile.id), user_id, team_id
+        ):
+            docs[("page", page_text.id)] = (page_text, pdf_file)
+
+    index = InvertedIndex()
+    for key, (row, _) in docs.items():
+        index.add(key, row.content)
+
+    terms = tokenize(query)
+    hits = []
+    for (hit_type, row_id), score in index.search(query):
+        row, pdf_file = docs[(hit_type, row_id)]
+        hits.append({
+            "type": hit_type,
+            "id": row_id,
+            "pdf_id": pdf_file.id,
+            "file_name": pdf_file.filename,
+            "team_id": pdf_file.team_id,
+            "page": row.page,
+            "rank": score,
+            "snippet": make_snippet(row.content, terms)
+        })
+    return len(hits), hits
+
+async def search_documents(
+    db: Session,
+    user_id: int,
+    query: str,
+    team_id: Optional[int] = None,
+    scope: str = "all",
+    skip: int = 0,
+    limit: int = 20
+) -> Dict[str, Any]:
+    """
+    PDF 본문(페이지 텍스트)과 주석 내용 통합 전문 검색
+
+    Args:
+        scope: all(전체), annotations(주석), pages(PDF 본문)
+        skip: 건너뛸 결과 수
+        limit: 반환할 최대 결과 수
+
+    Returns:
+        전체 건수와 관련도 순 검색 결과 (페이지 번호, 강조된 스니펫 포함)
+    """
+    # 팀 지정된 경우 팀 멤버인지 확인
+    if team_id:
+        if not check_user_in_team(db=db, team_id=team_id, user_id=user_id):
+            return {"error": "이 팀의 문서를 검색할 권한이 없습니다"}
+
+    if not tokenize(query):
+        total, hits = 0, []
+    elif _is_postgres(db):
+        total, hits = _search_postgres(db, user_id, query, team_id, scope, skip + limit)
+        # 소스별 상위 결과를 관련도 순으로 병합
+        hits.sort(key=lambda hit: hit["rank"], reverse=True)
+    else:
+        total, hits = _search_fallback(db, user_id, query, team_id, scope)
+
+    return {
+        "query": query,
+        "total": total,
+        "skip": skip,
+        "limit": limit,
+        "hits": hits[skip:skip + limit]
+    }
@@ -1,6 +1,6 @@
 # app/services/tag_service.py
 from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager, joinedload
 from app.crud.crud_tag import (
     get_tag_by_id,
     get_tags_by_pdf,
@@ -8,11 +8,17 @@ from app.crud.crud_tag import (
     create_tag,
     update_tag,
     delete_tag,
-    get_pdf_by_id
+    get_pdf_by_id,
+    get_hashtag_id,
+    get_user_id_by_username,
+    get_parsed_mentions_and_tags,
+    get_tags_in_region
 )
 from app.crud.crud_team import check_user_in_team
 from app.services.notification_service import create_mention_notifications
-from app.core.pdf_processor import PDFProcessor
+from sqlalchemy import func
+from app.models.tag import PDFTag, PDFFile, PDFTagMention, Hashtag, TagHashtag
+from app.services.search_service import accessible_pdfs, match_annotations
 
 async def create_pdf_annotation(
     db: Session,
@@ -37,7 +43,7 @@ async def create_pdf_annotation(
     elif pdf_file.owner_id != user_id:
         return {"error": "이 PDF에 주석을 작성할 권한이 없습니다"}
     
-    # 주석 생성
+    # 주석 생성 (해시태그·멘션·알림까지 한 트랜잭션, 커밋 1회)
     tag = create_tag(
         db=db,
         pdf_id=pdf_id,
@@ -45,20 +51,24 @@ async def create_pdf_annotation(
         page=page,
         content=content,
         position=position,
-        annotation_type=annotation_type
+        annotation_type=annotation_type,
+        commit=False
     )
     
-    # 멘션 처리 및 알림 생성
-    mentions, hashtags = PDFProcessor.parse_mentions_and_tags(content)
+    # 멘션 처리 및 알림 생성 (실시간 알림은 커밋 후 발행)
+    mentions, hashtags = get_parsed_mentions_and_tags(tag)
     if mentions:
         await create_mention_notifications(
             db=db,
             tag_id=tag.id,
             team_id=pdf_file.team_id,
             mentioned_usernames=mentions,
-            mentioner_id=user_id
+            mentioner_id=user_id,
+            commit=False
         )
     
+    _commit(db)
+    
     # 응답 데이터 구성
     return {
         "id": tag.id,
@@ -91,32 +101,36 @@ async def update_pdf_annotation(
     if tag.user_id != user_id:
         return {"error": "이 주석을 수정할 권한이 없습니다"}
     
-    # 업데이트 실행
+    # 업데이트 실행 (해시태그·멘션·알림까지 한 트랜잭션, 커밋 1회)
     updated_tag = update_tag(
         db=db,
         tag_id=tag_id,
         user_id=user_id,
         content=content,
-        position=position
+        position=position,
+        commit=False
     )
     
     if not updated_tag:
         return {"error": "주석 업데이트에 실패했습니다"}
     
-    # 멘션 처리 및 알림 생성 (내용이 변경된 경우만)
+    # 멘션 처리 및 알림 생성 (내용이 변경된 경우만, 실시간 알림은 커밋 후 발행)
     if content:
-        mentions, hashtags = PDFProcessor.parse_mentions_and_tags(content)
+        mentions, hashtags = get_parsed_mentions_and_tags(updated_tag)
         if mentions:
             await create_mention_notifications(
                 db=db,
                 tag_id=tag.id,
                 team_id=tag.pdf_file.team_id,
                 mentioned_usernames=mentions,
-                mentioner_id=user_id
+                mentioner_id=user_id,
+                commit=False
             )
     else:
         mentions, hashtags = [], []
     
+    _commit(db)
+    
     # 응답 데이터 구성
     return {
         "id": updated_tag.id,
@@ -151,8 +165,14 @@ async def delete_pdf_annotation(db: Session, tag_id: int, user_id: int) -> Dict[
     
     return {"success": True, "message": "주석이 삭제되었습니다"}
 
-async def get_pdf_annotations(db: Session, pdf_id: int, user_id: int, page: Optional[int] = None) -> Dict[str, Any]:
-    """PDF 주석 목록 조회"""
+async def get_pdf_annotations(
+    db: Session,
+    pdf_id: int,
+    user_id: int,
+    page: Optional[int] = None,
+    region: Optional[Dict[str, float]] = None
+) -> Dict[str, Any]:
+    """PDF 주석 목록 조회 (page와 region(x1,y1,x2,y2)을 함께 지정하면 영역과 겹치는 주석만)"""
     # PDF 파일 존재 여부 및 접근 권한 확인
     pdf_file = get_pdf_by_id(db=db, pdf_id=pdf_id)
     if not pdf_file:
@@ -167,7 +187,9 @@ async def get_pdf_annotations(db: Session, pdf_id: int, user_id: int, page: Opti
         return {"error": "이 PDF의 주석을 조회할 권한이 없습니다"}
     
     # 주석 조회
-    if page is not None:
+    if page is not None and region is not None:
+        tags = get_tags_in_region(db=db, pdf_id=pdf_id, page=page, **region)
+    elif page is not None:
         tags = get_tags_by_pdf_page(db=db, pdf_id=pdf_id, page=page)
     else:
         tags = get_tags_by_pdf(db=db, pdf_id=pdf_id)
@@ -175,7 +197,7 @@ async def get_pdf_annotations(db: Session, pdf_id: int, user_id: int, page: Opti
     # 응답 데이터 구성
     annotations = []
     for tag in tags:
-        mentions, hashtags = PDFProcessor.parse_mentions_and_tags(tag.content)
+        mentions, hashtags = get_parsed_mentions_and_tags(tag)
         annotations.append({
             "id": tag.id,
             "pdf_id": pdf_id,
@@ -201,70 +223,166 @@ async def search_annotations(
     db: Session, 
     user_id: int, 
     query: str, 
-    team_id: Optional[int] = None
+    team_id: Optional[int] = None,
+    skip: int = 0,
+    limit: int = 50
 ) -> List[Dict[str, Any]]:
-    """주석 검색 (내용, 해시태그, 멘션 등)"""
+    """주석 검색 (내용, 해시태그, 멘션 등) - 전문 검색 인덱스 사용, 관련도 순"""
     # 팀 지정된 경우 팀 멤버인지 확인
     if team_id:
         if not check_user_in_team(db=db, team_id=team_id, user_id=user_id):
             return {"error": "이 팀의 주석을 검색할 권한이 없습니다"}
     
-    # 주석 조회 쿼리 구성
-    from sqlalchemy import or_
-    from app.models.tag import PDFTag, PDFFile
-    
-    base_query = (
-        db.query(PDFTag)
-        .join(PDFFile, PDFTag.pdf_id == PDFFile.id)
+    # 주석 조회 쿼리 구성 (사용자가 접근 가능한 PDF만)
+    base_query = accessible_pdfs(
+        db,
+        _annotation_query(db),
+        user_id,
+        team_id
     )
     
-    # 팀 지정된 경우 해당 팀의 PDF만 조회
+    # 검색어로 필터링 (부분 문자열 일치, pg_trgm GIN 인덱스, '#'/'@' 기호는 토큰화 시 제거됨)
+    search_results = match_annotations(db, base_query, query, skip, limit)
+    
+    # 응답 데이터 구성
+    return [_search_result(tag) for tag in search_results]
+
+async def get_annotations_by_hashtag(
+    db: Session,
+    user_id: int,
+    hashtag: str,
+    team_id: Optional[int] = None,
+    skip: int = 0,
+    limit: int = 50
+) -> List[Dict[str, Any]]:
+    """해시태그별 주석 조회 (정확히 일치하는 해시태그만, tag_hashtags 인덱스 사용)"""
+    # 팀 지정된 경우 팀 멤버인지 확인
     if team_id:
-        base_query = base_query.filter(PDFFile.team_id == team_id)
-    else:
-        # 팀 지정 안된 경우 사용자가 접근 가능한 PDF만 조회
-        from app.models.team import TeamMember
-        
-        team_ids = (
-            db.query(TeamMember.team_id)
-            .filter(TeamMember.user_id == user_id)
-        )
-        
-        base_query = base_query.filter(
-            or_(
-                PDFFile.owner_id == user_id,  # 개인 소유 PDF
-                PDFFile.team_id.in_(team_ids)  # 속한 팀의 PDF
-            )
-        )
+        if not check_user_in_team(db=db, team_id=team_id, user_id=user_id):
+            return {"error": "이 팀의 주석을 검색할 권한이 없습니다"}
     
-    # 검색어로 필터링
-    search_results = base_query.filter(
-        or_(
-            PDFTag.content.ilike(f"%{query}%"),  # 내용 검색
-            PDFTag.content.ilike(f"%#{query}%"),  # 해시태그 검색
-            PDFTag.content.ilike(f"%@{query}%")   # 멘션 검색
-        )
-    ).all()
+    hashtag_id = get_hashtag_id(db=db, name=hashtag)
+    if hashtag_id is None:
+        return []
     
-    # 응답 데이터 구성
-    results = []
-    for tag in search_results:
-        mentions, hashtags = PDFProcessor.parse_mentions_and_tags(tag.content)
-        results.append({
-            "id": tag.id,
-            "pdf_id": tag.pdf_id,
-            "file_name": tag.pdf_file.filename,
-            "team_id": tag.pdf_file.team_id,
-            "user_id": tag.user_id,
-            "username": tag.user.username,
-            "page": tag.page,
-            "content": tag.content,
-            "snippet": tag.content[:100] + "..." if len(tag.content) > 100 else tag.content,
-            "position": tag.position,
-            "annotation_type": tag.annotation_type,
-            "created_at": tag.created_at.isoformat(),
-            "mentions": mentions,
-            "hashtags": hashtags
-        })
+    tags = accessible_pdfs(
+        db,
+        _annotation_query(db)
+        .join(TagHashtag, TagHashtag.tag_id == PDFTag.id)
+        .filter(TagHashtag.hashtag_id == hashtag_id),
+        user_id,
+        team_id
+    ).order_by(PDFTag.id.desc()).offset(skip).limit(limit).all()
     
-    return results
\ No newline at end of file
+    return [_search_result(tag) for tag in tags]
+
+async def get_annotations_by_mention(
+    db: Session,
+    user_id: int,
+    mentioned_user_id: int,
+    team_id: Optional[int] = None,
+    skip: int = 0,
+    limit: int = 50
+) -> List[Dict[str, Any]]:
+    """특정 사용자를 멘션한 주석 조회 (mentions 테이블의 (mentioned_user_id, tag_id) 인덱스 사용)"""
+    # 팀 지정된 경우 팀 멤버인지 확인
+    if team_id:
+        if not check_user_in_team(db=db, team_id=team_id, user_id=user_id):
+            return {"error": "이 팀의 주석을 검색할 권한이 없습니다"}
+    
+    tags = accessible_pdfs(
+        db,
+        _annotation_query(db)
+        .join(PDFTagMention, PDFTagMention.tag_id == PDFTag.id)
+        .filter(PDFTagMention.mentioned_user_id == mentioned_user_id),
+        user_id,
+        team_id
+    ).order_by(PDFTagMention.tag_id.desc()).offset(skip).limit(limit).all()
+    
+    return [_search_result(tag) for tag in tags]
+
+async def get_annotations_by_username_mention(
+    db: Session,
+    user_id: int,
+    username: str,
+    team_id: Optional[int] = None,
+    skip: int = 0,
+    limit: int = 50
+) -> List[Dict[str, Any]]:
+    """사용자명으로 멘션된 주석 조회"""
+    mentioned_user_id = get_user_id_by_username(db=db, username=username)
+    if mentioned_user_id is None:
+        return []
+    
+    return await get_annotations_by_mention(
+        db=db,
+        user_id=user_id,
+        mentioned_user_id=mentioned_user_id,
+        team_id=team_id,
+        skip=skip,
+        limit=limit
+    )
+
+async def get_hashtag_counts(
+    db: Session,
+    user_id: int,
+    team_id: Optional[int] = None,
+    limit: int = 50
+) -> List[Dict[str, Any]]:
+    """접근 가능한 주석의 해시태그별 사용 횟수 (많이 쓰인 순)"""
+    # 팀 지정된 경우 팀 멤버인지 확인
+    if team_id:
+        if not check_user_in_team(db=db, team_id=team_id, user_id=user_id):
+            return {"error": "이 팀의 주석을 조회할 권한이 없습니다"}
+    
+    count = func.count(TagHashtag.tag_id).label("count")
+    rows = accessible_pdfs(
+        db,
+        db.query(Hashtag.name, count)
+        .join(TagHashtag, TagHashtag.hashtag_id == Hashtag.id)
+        .join(PDFTag, PDFTag.id == TagHashtag.tag_id)
+        .join(PDFFile, PDFTag.pdf_id == PDFFile.id),
+        user_id,
+        team_id
+    ).group_by(Hashtag.name).order_by(count.desc(), Hashtag.name).limit(limit).all()
+    
+    return [{"hashtag": name, "count": total} for name, total in rows]
+
+def _commit(db: Session) -> None:
+    """주석 쓰기 작업 단위 커밋 (실패 시 롤백 → 등록된 커밋 후처리도 폐기)"""
+    try:
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+def _annotation_query(db: Session):
+    """
+    검색 결과용 주석 쿼리: PDF 파일은 조인 결과로, 작성자는 같은 쿼리에서 함께 로드
+    (주석마다 tag.pdf_file / tag.user 지연 로딩 쿼리가 발생하지 않도록 함)
+    """
+    return (
+        db.query(PDFTag)
+        .join(PDFFile, PDFTag.pdf_id == PDFFile.id)
+        .options(contains_eager(PDFTag.pdf_file), joinedload(PDFTag.user))
+    )
+
+def _search_result(tag: PDFTag) -> Dict[str, Any]:
+    """검색 결과용 주석 응답 데이터"""
+    mentions, hashtags = get_parsed_mentions_and_tags(tag)
+    return {
+        "id": tag.id,
+        "pdf_id": tag.pdf_id,
+        "file_name": tag.pdf_file.filename,
+        "team_id": tag.pdf_file.team_id,
+        "user_id": tag.user_id,
+        "username": tag.user.username,
+        "page": tag.page,
+        "content": tag.content,
+        "snippet": tag.content[:100] + "..." if len(tag.content) > 100 else tag.content,
+        "position": tag.position,
+        "annotation_type": tag.annotation_type,
+        "created_at": tag.created_at.isoformat(),
+        "mentions": mentions,
+        "hashtags": hashtags
+    }
\ No newline at end of file
@@ -0,0 +1,202 @@
+import os
+import asyncio
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+from uuid import uuid4
+
+from redis import RedisError
+
+from app.core.config import settings
+from app.core.fs_executor import run_fs
+from app.core.pdf_process_pool import get_process_pool, render_page
+from app.core.redis_helper import get_cache_redis_client
+from app.services.blob_store import ContentAddressedStore
+from app.services.file_service import FileOperationError
+
+logger = logging.getLogger(__name__)
+
+MEDIA_TYPES = {"png": "image/png", "jpeg": "image/jpeg"}
+
+
+# ==================================================
+# 1. 썸네일 캐시
+# ==================================================
+class ThumbnailCache:
+    """📂 페이지 썸네일/타일 디스크 캐시 (크기 제한 LRU)
+
+    렌더링 결과는 `.thumbs/<sha256[:2]>/<sha256>-p<page>-z<zoom>.<ext>` 에 저장됩니다.
+    키가 파일 내용 해시이므로 같은 PDF(중복 제거된 사본 포함)는 한 번만 렌더링되고,
+    파일이 바뀌면 자연히 새 키가 됩니다. 적중 시 mtime을 갱신하여 최근 사용 순서로 삼고,
+    전체 크기가 THUMBNAIL_CACHE_MAX_BYTES를 넘으면 오래된 항목부터 삭제합니다.
+    """
+
+    DIGEST_KEY = "file_digest:{dev}:{ino}:{mtime_ns}:{size}"
+    DIGEST_TTL = 7 * 24 * 60 * 60
+    EVICT_RATIO = 0.9
+
+    def __init__(self, base_dir: Path, max_bytes: int):
+        """📌 초기화: 캐시 경로 설정 (사용자 폴더와 같은 저장소 하위)"""
+        self.CACHE_DIR = base_dir / ".thumbs"
+        self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+        self._inflight: Dict[Path, asyncio.Future] = {}
+
+    # ==================================================
+    # 2-1. 유틸리티 메서드
+    # ==================================================
+    @staticmethod
+    def make_etag(digest: str, page: int, zoom: float, fmt: str) -> str:
+        """📌 렌더링 결과의 강한 ETag (내용 해시 + 렌더링 파라미터)"""
+        return f'"{digest[:32]}-p{page}-z{round(zoom * 100)}-{fmt}"'
+
+    def entry_path(self, digest: str, page: int, zoom: float, fmt: str) -> Path:
+        """📌 캐시 항목 경로"""
+        return self.CACHE_DIR / digest[:2] / f"{digest}-p{page}-z{round(zoom * 100)}.{fmt}"
+
+    def file_digest(self, path: Path) -> str:
+        """
+        📌 PDF 파일의 SHA-256 조회 (동기)
+
+        (inode, mtime, 크기)를 키로 Redis에 캐시하여 같은 파일을 반복 해시하지 않습니다.
+        """
+        st = path.stat()
+        key = self.DIGEST_KEY.format(dev=st.st_dev, ino=st.st_ino, mtime_ns=st.st_mtime_ns, size=st.st_size)
+        try:
+            cached = get_cache_redis_client().get(key)
+            if cached:
+                return cached.decode() if isinstance(cached, bytes) else cached
+        except RedisError as e:
+            logger.warning(f"파일 해시 캐시 조회 실패 - {key}, Error: {str(e)}")
+
+        digest = ContentAddressedStore.hash_file(path)
+        try:
+            get_cache_redis_client().set(key, digest, ex=self.DIGEST_TTL)
+        except RedisError as e:
+            logger.warning(f"파일 해시 캐시 저장 실패 - {key}, Error: {str(e)}")
+        return digest
+
+    # ==================================================
+    # 2-2. 캐시 읽기/쓰기 (동기, 파일시스템 스레드 풀에서 실행)
+    # ==================================================
+    def read(self, entry: Path) -> Optional[bytes]:
+        """📌 캐시 항목 읽기 (적중 시 최근 사용 시각 갱신)"""
+        try:
+            data = entry.read_bytes()
+            os.utime(entry)
+            return data
+        except FileNotFoundError:
+            return None
+
+    def write(self, entry: Path, data: bytes) -> None:
+        """📌 캐시 항목 원자적 저장 후 용량 초과 시 정리"""
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        tmp = entry.with_name(f".{entry.name}.{uuid4().hex}")
+        tmp.write_bytes(data)
+
+        with self._lock:
+            # 같은 항목을 덮어쓰는 경우(동시 미스 등) 기존 크기를 빼서 사용량이 부풀지 않도록 함
+            try:
+                previous = entry.stat().st_size
+            except FileNotFoundError:
+                previous = 0
+            os.replace(tmp, entry)
+
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_usage()
+            else:
+                self._total_bytes += len(data) - previous
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        """📌 모든 캐시 항목 (경로, stat) 순회"""
+        for shard in self.CACHE_DIR.iterdir():
+            if not shard.is_dir():
+                continue
+            with os.scandir(shard) as it:
+                for entry in it:
+                    try:
+                        yield entry.path, entry.stat()
+                    except FileNotFoundError:
+                        continue
+
+    def _scan_usage(self) -> int:
+        return sum(st.st_size for _, st in self._entries())
+
+    def _evict(self) -> None:
+        """📌 최근에 사용되지 않은 항목부터 삭제 (lock 보유 상태에서 호출)"""
+        entries = sorted(self._entries(), key=lambda e: e[1].st_mtime_ns)
+        total = sum(st.st_size for _, st in entries)
+        target = int(self.max_bytes * self.EVICT_RATIO)
+
+        removed = 0
+        for path, st in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+                total -= st.st_size
+                removed += 1
+            except FileNotFoundError:
+                pass
+
+        self._total_bytes = total
+        logger.info(f"썸네일 캐시 {removed}개 정리 (사용량 {total} bytes)")
+
+    def usage(self) -> dict:
+        """📌 캐시 사용량"""
+        entries = 0
+        stored_bytes = 0
+        for _, st in self._entries():
+            entries += 1
+            stored_bytes += st.st_size
+        return {"entries": entries, "stored_bytes": stored_bytes, "max_bytes": self.max_bytes}
+
+    # ==================================================
+    # 2-3. 썸네일 조회
+    # ==================================================
+    async def get_or_render(self, path: Path, digest: str, page: int, zoom: float, fmt: str) -> bytes:
+        """
+        📌 캐시된 썸네일 반환, 없으면 프로세스 풀에서 렌더링 후 저장
+
+        같은 항목에 대한 동시 요청은 하나의 렌더링 결과를 공유합니다.
+        """
+        entry = self.entry_path(digest, page, zoom, fmt)
+        data = await run_fs(self.read, entry)
+        if data is not None:
+            return data
+
+        pending = self._inflight.get(entry)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._inflight[entry] = future
+        try:
+            try:
+                data = await loop.run_in_executor(get_process_pool(), render_page, str(path), page, zoom, fmt)
+            except IndexError as e:
+                raise FileOperationError(str(e), 404)
+            await run_fs(self.write, entry, data)
+            future.set_result(data)
+            return data
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # 대기 중인 요청이 없어도 경고가 남지 않도록 조회 처리
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+            self._inflight.pop(entry, None)
+
+
+thumbnail_cache = ThumbnailCache(
+    Path(os.getenv("STORAGE_PATH", "./storage")).resolve(),
+    settings.THUMBNAIL_CACHE_MAX_BYTES
+)
+
@@ -0,0 +1,63 @@
+# tests/conftest.py
+from contextlib import contextmanager
+
+import pytest
+import fakeredis
+from sqlalchemy import event
+
+
+@pytest.fixture
+def fake_redis():
+    """비동기 Redis 대체 (decode_responses=True로 실제 클라이언트와 동일하게 문자열 반환)"""
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def storage_dir(tmp_path, monkeypatch):
+    """파일 저장소 경로를 테스트별 임시 디렉터리로 지정"""
+    monkeypatch.setenv("STORAGE_PATH", str(tmp_path / "storage"))
+    return tmp_path / "storage"
+
+
+@pytest.fixture
+def db():
+    """모델 스키마를 생성한 인메모리 SQLite 세션"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+    from app.db.base import Base
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, autoflush=False)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def count_queries(db):
+    """
+    블록 안에서 실행된 SQL 문 수를 세는 컨텍스트 관리자
+
+        with count_queries() as queries:
+            ...
+        assert len(queries) == 2
+    """
+    @contextmanager
+    def _count():
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+    return _count
@@ -0,0 +1,132 @@
+# tests/test_annotation_commits.py
+"""주석 작성 경로의 커밋 횟수 벤치마크 (주석 1건 = 커밋 1회, 실시간 알림은 커밋 후 발행)"""
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import event
+
+from app.db.events import add_post_commit_hook
+from app.models.notification import Notification
+from app.models.tag import PDFFile, PDFTagMention
+from app.models.user import User
+from app.services import notification_service, tag_service
+
+ANNOTATIONS = 50
+MENTIONED = ["user2", "user3", "user4", "user5", "user6"]
+
+
+@pytest.fixture
+def published(monkeypatch):
+    """Redis 발행 대신 발행된 메시지를 기록"""
+    batches = []
+
+    async def _publish(messages):
+        batches.append(messages)
+        return len(messages)
+
+    monkeypatch.setattr(notification_service, "publish_messages", _publish)
+    return batches
+
+
+@pytest.fixture
+def commits(db):
+    """데이터베이스 커밋(DBAPI COMMIT) 횟수 기록 (SAVEPOINT 해제는 제외)"""
+    counter = {"commits": 0}
+
+    def _count(conn):
+        counter["commits"] += 1
+
+    engine = db.get_bind()
+    event.listen(engine, "commit", _count)
+    yield counter
+    event.remove(engine, "commit", _count)
+
+
+def _seed(db):
+    db.add_all(User(id=i, username=f"user{i}") for i in range(1, 7))
+    db.add(PDFFile(id=1, filename="doc.pdf", file_path="/tmp/doc.pdf", owner_id=1))
+    db.commit()
+
+
+def test_commits_per_annotation(db, commits, published, record_property):
+    _seed(db)
+    content = "검토 부탁드립니다 #review " + " ".join(f"@{name}" for name in MENTIONED)
+
+    async def scenario():
+        for i in range(ANNOTATIONS):
+            result = await tag_service.create_pdf_annotation(
+                db, pdf_id=1, user_id=1, page=i % 10 + 1, content=content,
+                position={"x1": 0.1, "y1": 0.1, "x2": 0.2, "y2": 0.2}
+            )
+            assert "error" not in result
+        await asyncio.sleep(0)  # 커밋 후처리 작업 실행
+
+    commits["commits"] = 0
+    started = time.perf_counter()
+    asyncio.run(scenario())
+    elapsed = time.perf_counter() - started
+
+    per_annotation = commits["commits"] / ANNOTATIONS
+    record_property("commits_per_annotation", per_annotation)
+    record_property("ms_per_annotation", round(elapsed * 1000 / ANNOTATIONS, 3))
+    print(f"\n주석 {ANNOTATIONS}건 (멘션 {len(MENTIONED)}명): 커밋 {commits['commits']}회, "
+          f"주석당 {per_annotation:.2f}회, {elapsed * 1000 / ANNOTATIONS:.2f}ms")
+
+    # 이전 구조: create_tag 1 + process_mentions 1 + 알림 N = 주석당 2 + N회
+    assert per_annotation == 1
+    assert db.query(Notification).count() == ANNOTATIONS * len(MENTIONED)
+    assert db.query(PDFTagMention).filter(PDFTagMention.notification_sent.is_(True)).count() == (
+        ANNOTATIONS * len(MENTIONED)
+    )
+    # 실시간 알림은 주석당 파이프라인 1회로 발행
+    assert len(published) == ANNOTATIONS
+    assert all(len(batch) == len(MENTIONED) for batch in published)
+
+
+def test_rollback_discards_realtime_notifications(db, published, monkeypatch):
+    _seed(db)
+
+    def _fail():
+        raise RuntimeError("commit failed")
+
+    monkeypatch.setattr(db, "commit", _fail)
+
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            await tag_service.create_pdf_annotation(
+                db, pdf_id=1, user_id=1, page=1, content="@user2 확인",
+                position={"x1": 0.1, "y1": 0.1, "x2": 0.2, "y2": 0.2}
+            )
+        await asyncio.sleep(0)
+
+    asyncio.run(scenario())
+
+    assert published == []
+    assert db.query(Notification).count() == 0
+
+
+def test_post_commit_hooks_wait_for_outer_commit(db):
+    _seed(db)
+    ran = []
+
+    async def _hook():
+        ran.append(True)
+
+    async def scenario():
+        add_post_commit_hook(db, _hook)
+        # SAVEPOINT 해제/롤백은 바깥 트랜잭션 커밋이 아니므로 후처리를 실행하거나 버리지 않음
+        with db.begin_nested():
+            db.add(User(id=7, username="user7"))
+        nested = db.begin_nested()
+        db.add(User(id=8, username="user8"))
+        nested.rollback()
+        await asyncio.sleep(0)
+        before_commit = list(ran)
+
+        db.commit()
+        await asyncio.sleep(0)
+        return before_commit
+
+    assert asyncio.run(scenario()) == []
+    assert ran == [True]
@@ -0,0 +1,80 @@
+# tests/test_annotation_queries.py
+"""주석 목록/검색의 쿼리 수가 주석 개수와 무관하게 일정한지 확인 (N+1 회귀 방지)"""
+import asyncio
+
+import pytest
+
+from app.models.tag import Hashtag, PDFFile, PDFTag, PDFTagMention, TagHashtag
+from app.models.user import User
+from app.services import tag_service
+
+USERS = 20
+OWNER_ID = 1
+MENTIONED_ID = 2
+
+
+def _seed_base(db):
+    db.add_all(User(id=i, username=f"user{i}") for i in range(1, USERS + 1))
+    db.add(PDFFile(id=1, filename="shared.pdf", file_path="/tmp/shared.pdf", owner_id=OWNER_ID))
+    db.add(Hashtag(id=1, name="db"))
+    db.commit()
+
+
+def _add_annotations(db, start: int, count: int):
+    """작성자가 서로 다른 주석 추가 (모두 1페이지, 해시태그 #db, 멘션 @user2)"""
+    for tag_id in range(start, start + count):
+        db.add(PDFTag(
+            id=tag_id,
+            pdf_id=1,
+            user_id=tag_id % USERS + 1,
+            page=1,
+            content=f"note {tag_id} #db @user{MENTIONED_ID}",
+            position={"x1": 0.1, "y1": 0.1, "x2": 0.2, "y2": 0.2},
+            bbox_x1=0.1, bbox_y1=0.1, bbox_x2=0.2, bbox_y2=0.2,
+            mention_names=[f"user{MENTIONED_ID}"],
+            hashtag_names=["db"]
+        ))
+    db.flush()
+    for tag_id in range(start, start + count):
+        db.add(TagHashtag(hashtag_id=1, tag_id=tag_id))
+        db.add(PDFTagMention(tag_id=tag_id, mentioned_user_id=MENTIONED_ID))
+    db.commit()
+
+
+SCENARIOS = {
+    "pdf_annotations": lambda db: tag_service.get_pdf_annotations(db, pdf_id=1, user_id=OWNER_ID),
+    "page_annotations": lambda db: tag_service.get_pdf_annotations(db, pdf_id=1, user_id=OWNER_ID, page=1),
+    "region_annotations": lambda db: tag_service.get_pdf_annotations(
+        db, pdf_id=1, user_id=OWNER_ID, page=1, region={"x1": 0.0, "y1": 0.0, "x2": 0.5, "y2": 0.5}
+    ),
+    "search": lambda db: tag_service.search_annotations(db, user_id=OWNER_ID, query="note", limit=1000),
+    "hashtag": lambda db: tag_service.get_annotations_by_hashtag(db, user_id=OWNER_ID, hashtag="db", limit=1000),
+    "mention": lambda db: tag_service.get_annotations_by_mention(
+        db, user_id=OWNER_ID, mentioned_user_id=MENTIONED_ID, limit=1000
+    ),
+}
+
+
+def _result_size(result) -> int:
+    return len(result["annotations"]) if isinstance(result, dict) else len(result)
+
+
+def _measure(db, count_queries, scenario):
+    db.expunge_all()  # 식별자 맵에 남은 사용자/PDF로 지연 로딩이 가려지지 않도록
+    with count_queries() as queries:
+        result = asyncio.run(SCENARIOS[scenario](db))
+    return len(queries), _result_size(result)
+
+
+@pytest.mark.parametrize("scenario", sorted(SCENARIOS))
+def test_query_count_is_constant(db, count_queries, scenario):
+    _seed_base(db)
+    _add_annotations(db, 1, 5)
+    few_queries, few = _measure(db, count_queries, scenario)
+
+    _add_annotations(db, 6, 495)
+    many_queries, many = _measure(db, count_queries, scenario)
+
+    assert (few, many) == (5, 500)
+    assert many_queries == few_queries
+    assert many_queries <= 4
@@ -0,0 +1,115 @@
+# tests/test_chunk_upload.py
+import asyncio
+import os
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.services.chunk_upload_service import ChunkUploadManager
+from app.services.file_service import FileOperationError
+
+CHUNK = settings.UPLOAD_MIN_CHUNK_SIZE
+
+
+@pytest.fixture
+def uploads(storage_dir, fake_redis):
+    manager = ChunkUploadManager()
+    manager.redis = fake_redis
+    return manager
+
+
+async def _body(data: bytes):
+    yield data
+
+
+async def _upload_all(manager: ChunkUploadManager, data: bytes) -> str:
+    status = await manager.init_session(1, "docs", "report.pdf", len(data), CHUNK)
+    for i in range(status.total_chunks):
+        await manager.write_chunk(1, status.upload_id, i, _body(data[i * CHUNK:(i + 1) * CHUNK]))
+    return status.upload_id
+
+
+def test_finalize_retry_returns_same_result(uploads):
+    data = os.urandom(CHUNK * 2 + 10)
+
+    async def scenario():
+        upload_id = await _upload_all(uploads, data)
+        first = await uploads.finalize(1, upload_id)
+        # 응답 유실 후 재시도: 세션은 이미 정리되었지만 같은 결과를 받아야 함
+        second = await uploads.finalize(1, upload_id)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first == second
+    with open(first["path"], "rb") as f:
+        assert f.read() == data
+
+
+def test_concurrent_finalize_merges_once(uploads):
+    data = os.urandom(CHUNK * 3)
+
+    async def scenario():
+        upload_id = await _upload_all(uploads, data)
+        return await asyncio.gather(
+            uploads.finalize(1, upload_id),
+            uploads.finalize(1, upload_id),
+            return_exceptions=True
+        )
+
+    results = asyncio.run(scenario())
+    succeeded = [r for r in results if isinstance(r, dict)]
+    rejected = [r for r in results if isinstance(r, FileOperationError)]
+    assert len(succeeded) + len(rejected) == 2
+    assert all(r.code == 409 for r in rejected)
+    assert len({r["path"] for r in succeeded}) == 1
+    with open(succeeded[0]["path"], "rb") as f:
+        assert f.read() == data
+
+
+def test_finalize_result_is_private(uploads):
+    data = os.urandom(CHUNK)
+
+    async def scenario():
+        upload_id = await _upload_all(uploads, data)
+        await uploads.finalize(1, upload_id)
+        await uploads.finalize(2, upload_id)
+
+    with pytest.raises(FileOperationError) as exc:
+        asyncio.run(scenario())
+    assert exc.value.code == 403
+
+
+@pytest.mark.parametrize("total_size, chunk_size", [
+    (10 * CHUNK, 1),  # 최소 청크 크기 미만
+    (10 * CHUNK, settings.UPLOAD_MAX_CHUNK_SIZE + 1),  # 최대 청크 크기 초과
+    (settings.UPLOAD_MAX_FILE_SIZE + 1, settings.UPLOAD_MAX_CHUNK_SIZE),  # 최대 파일 크기 초과
+    (CHUNK * (settings.UPLOAD_MAX_CHUNKS + 1), CHUNK),  # 최대 청크 수 초과
+])
+def test_init_session_rejects_out_of_bounds(uploads, total_size, chunk_size):
+    with pytest.raises(FileOperationError) as exc:
+        asyncio.run(uploads.init_session(1, "docs", "big.pdf", total_size, chunk_size))
+    assert exc.value.code == 400
+
+
+def test_purge_keeps_chunks_of_live_sessions(uploads):
+    data = os.urandom(CHUNK * 2)
+
+    async def scenario():
+        upload_id = await _upload_all(uploads, data)
+        # 세션 TTL보다 오래된 청크라도 세션이 살아 있으면 유지
+        old = time.time() - uploads.session_ttl - 60
+        for i in range(2):
+            os.utime(uploads._part_path(upload_id, i), (old, old))
+        removed_alive = await uploads.purge_abandoned()
+
+        await uploads.redis.delete(uploads.SESSION_KEY.format(upload_id=upload_id))
+        in_flight = uploads.CHUNK_DIR / f"{upload_id}_2.abc.part"
+        in_flight.write_bytes(b"x")
+        removed_dead = await uploads.purge_abandoned()
+        return removed_alive, removed_dead, in_flight.exists()
+
+    removed_alive, removed_dead, in_flight_kept = asyncio.run(scenario())
+    assert removed_alive == 0
+    assert removed_dead == 2
+    assert in_flight_kept
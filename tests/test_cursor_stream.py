@@ -0,0 +1,77 @@
+# tests/test_cursor_stream.py
+"""커서 병합 전송: 문서 이동 시 이전 문서의 커서 제거, 잘못된 커서 입력 거부"""
+import asyncio
+
+import pytest
+
+from app.core import redis_helper
+from app.core.websocket_manager import CURSOR_MAX_PAGE, CursorStream
+
+ROOM_ID = "1"
+
+
+class RecordingManager:
+    """방 브로드캐스트를 기록하는 ConnectionManager 대체"""
+    def __init__(self):
+        self.broadcasts = []
+
+    async def broadcast_to_room(self, room_id, message, exclude_user=None):
+        self.broadcasts.append(message)
+
+
+@pytest.fixture
+def stream(fake_redis, monkeypatch):
+    monkeypatch.setattr(redis_helper, "get_redis_client", lambda: fake_redis)
+    return CursorStream(RecordingManager(), tick_hz=20, expiry_seconds=60)
+
+
+def test_switching_documents_removes_cursor_from_previous_document(stream):
+    async def scenario():
+        assert stream.update(ROOM_ID, "7", 10, 1, {"x": 0.1, "y": 0.2})
+        await stream.flush()
+        assert set(await redis_helper.get_all_cursor_positions(ROOM_ID, "10")) == {"7"}
+
+        assert stream.update(ROOM_ID, "7", "20", 3, {"x": 0.5, "y": 0.5})
+        await stream.flush()
+
+        assert await redis_helper.get_all_cursor_positions(ROOM_ID, "10") == {}
+        assert set(await redis_helper.get_all_cursor_positions(ROOM_ID, "20")) == {"7"}
+        assert {"type": "cursor_leave", "pdf_id": "10", "user_id": "7"} in stream.manager.broadcasts
+
+    asyncio.run(scenario())
+
+
+def test_returning_to_document_before_tick_keeps_cursor(stream):
+    async def scenario():
+        stream.update(ROOM_ID, "7", "10", 1, {"x": 0.1, "y": 0.2})
+        await stream.flush()
+
+        stream.update(ROOM_ID, "7", "20", 1, {"x": 0.1, "y": 0.2})
+        stream.update(ROOM_ID, "7", "10", 2, {"x": 0.3, "y": 0.4})
+        await stream.flush()
+
+        assert (await redis_helper.get_all_cursor_positions(ROOM_ID, "10"))["7"]["page"] == 2
+        assert not [m for m in stream.manager.broadcasts if m["type"] == "cursor_leave" and m["pdf_id"] == "10"]
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("pdf_id, page, position", [
+    (None, 1, {"x": 0.1, "y": 0.1}),
+    (True, 1, {"x": 0.1, "y": 0.1}),
+    ("../10", 1, {"x": 0.1, "y": 0.1}),
+    ("1" * 65, 1, {"x": 0.1, "y": 0.1}),
+    ("10", None, {"x": 0.1, "y": 0.1}),
+    ("10", 0, {"x": 0.1, "y": 0.1}),
+    ("10", CURSOR_MAX_PAGE + 1, {"x": 0.1, "y": 0.1}),
+    ("10", "1", {"x": 0.1, "y": 0.1}),
+    ("10", 1, None),
+    ("10", 1, {"x": 0.1}),
+    ("10", 1, {"x": 0.1, "y": 0.1, "payload": "x" * 100000}),
+    ("10", 1, {"x": "0.1", "y": 0.1}),
+    ("10", 1, {"x": float("nan"), "y": 0.1}),
+    ("10", 1, {"x": [0.1], "y": 0.1}),
+])
+def test_invalid_cursor_is_rejected(stream, pdf_id, page, position):
+    assert stream.update(ROOM_ID, "7", pdf_id, page, position) is False
+    assert stream.stats()["pending_documents"] == 0
@@ -0,0 +1,70 @@
+# tests/test_presence.py
+"""팀 접속자 추적: 같은 사용자가 여러 워커에 연결된 경우 마지막 연결이 끊길 때만 퇴장 처리"""
+import asyncio
+import time
+
+import pytest
+
+from app.core import redis_helper
+from app.core.websocket_manager import PresenceTracker
+
+ROOM_ID = "1"
+TTL = 60
+
+
+class RecordingManager:
+    """워커 ID와 방 브로드캐스트만 흉내 내는 ConnectionManager 대체"""
+    def __init__(self, node_id):
+        self.node_id = node_id
+        self.active_connections = {}
+        self.broadcasts = []
+
+    async def broadcast_to_room(self, room_id, message, exclude_user=None):
+        self.broadcasts.append(message)
+
+
+@pytest.fixture
+def nodes(fake_redis, monkeypatch):
+    monkeypatch.setattr(redis_helper, "get_redis_client", lambda: fake_redis)
+    return [PresenceTracker(RecordingManager(f"node-{i}"), interval=15, expiry_seconds=TTL) for i in range(2)]
+
+
+def _events(tracker):
+    return [(m["event"], m["user_ids"]) for m in tracker.manager.broadcasts if m["type"] == "presence"]
+
+
+def test_leaving_one_node_keeps_user_online_on_another(nodes):
+    first, second = nodes
+
+    async def scenario():
+        await first.join(ROOM_ID, "7")
+        await second.join(ROOM_ID, "7")
+        assert await first.online(ROOM_ID) == ["7"]
+
+        await first.leave(ROOM_ID, "7")
+        assert await second.online(ROOM_ID) == ["7"]
+
+        await second.leave(ROOM_ID, "7")
+        assert await second.online(ROOM_ID) == []
+
+    asyncio.run(scenario())
+    assert _events(first) == [("join", ["7"])]
+    assert _events(second) == [("leave", ["7"])]
+
+
+def test_sweep_reports_leave_only_when_no_live_connection_remains(nodes, fake_redis):
+    first, second = nodes
+
+    async def scenario():
+        await first.join(ROOM_ID, "7")
+        await first.join(ROOM_ID, "8")
+        await second.join(ROOM_ID, "7")
+
+        # node-0이 비정상 종료되어 heartbeat가 끊김
+        stale = time.time() - TTL * 2
+        await fake_redis.zadd(redis_helper._presence_key(ROOM_ID), {"7:node-0": stale, "8:node-0": stale})
+
+        assert await redis_helper.sweep_team_presence([ROOM_ID], TTL) == {ROOM_ID: ["8"]}
+        assert await second.online(ROOM_ID) == ["7"]
+
+    asyncio.run(scenario())
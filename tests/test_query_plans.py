@@ -0,0 +1,150 @@
+# tests/test_query_plans.py
+"""
+자주 호출되는 조회 쿼리의 실행 계획에 순차 스캔이 없는지 확인 (인덱스 회귀 방지)
+
+기본은 인메모리 SQLite의 EXPLAIN QUERY PLAN으로 검사하고,
+TEST_POSTGRES_URL이 지정되면 해당 (빈) 데이터베이스에 스키마를 만들어
+enable_seqscan=off 상태의 EXPLAIN에 Seq Scan이 남는지 함께 검사한다.
+"""
+import os
+import re
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+from app.crud import crud_notification, crud_tag, crud_team
+from app.models.notification import Notification
+from app.models.tag import PDFFile, PDFTag
+from app.models.team import Team, TeamMember
+from app.models.user import User
+
+USERS = 30
+TEAMS = 5
+PDFS = 40
+TAGS = 400
+
+# 순차 스캔이 허용되지 않는 테이블 (행 수가 사용자/문서 수에 비례해 늘어나는 테이블)
+HOT_TABLES = {"tags", "pdf_files", "notifications", "team_members", "mentions", "tag_hashtags"}
+
+QUERIES = {
+    "tags_by_pdf": lambda db: crud_tag.get_tags_by_pdf(db, pdf_id=1),
+    "tags_by_pdf_page": lambda db: crud_tag.get_tags_by_pdf_page(db, pdf_id=1, page=1),
+    "tags_in_region": lambda db: crud_tag.get_tags_in_region(db, 1, 1, 0.0, 0.0, 0.5, 0.5),
+    "tags_by_user": lambda db: crud_tag.get_tags_by_user(db, user_id=1),
+    "pdf_files_by_team": lambda db: crud_tag.get_pdf_files_by_team(db, team_id=1),
+    "pdf_files_by_user": lambda db: crud_tag.get_pdf_files_by_user(db, user_id=1),
+    "notifications_by_user": lambda db: crud_notification.get_notifications_by_user(db, user_id=1),
+    "unread_notifications": lambda db: crud_notification.get_notifications_by_user(db, user_id=1, unread_only=True),
+    "unread_notification_count": lambda db: crud_notification.get_unread_notification_count(db, user_id=1),
+    "check_user_in_team": lambda db: crud_team.check_user_in_team(db, team_id=1, user_id=1),
+    "filter_team_member_ids": lambda db: crud_team.filter_team_member_ids(db, team_id=1, user_ids=[1, 2, 3]),
+    "teams_by_user": lambda db: crud_team.get_teams_by_user(db, user_id=1),
+    "team_members": lambda db: crud_team.get_team_members(db, team_id=1),
+}
+
+
+@pytest.fixture(scope="module", params=["sqlite", "postgresql"])
+def plan_db(request):
+    """시드 데이터가 들어간 세션 (PostgreSQL은 TEST_POSTGRES_URL이 있을 때만)"""
+    from app.db.base import Base
+
+    if request.param == "sqlite":
+        engine = create_engine("sqlite://")
+    else:
+        url = os.getenv("TEST_POSTGRES_URL")
+        if not url:
+            pytest.skip("TEST_POSTGRES_URL이 설정되지 않음")
+        engine = create_engine(url)
+
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, autoflush=False)()
+    try:
+        _seed(session)
+        if engine.dialect.name == "postgresql":
+            session.execute(text("ANALYZE"))
+            session.commit()
+        yield session
+    finally:
+        session.close()
+        if engine.dialect.name == "postgresql":
+            Base.metadata.drop_all(engine)
+        engine.dispose()
+
+
+def _seed(db):
+    db.add_all(User(id=i, username=f"user{i}") for i in range(1, USERS + 1))
+    db.add_all(Team(id=i, name=f"team{i}", owner_id=i) for i in range(1, TEAMS + 1))
+    db.flush()
+    db.add_all(
+        TeamMember(team_id=user_id % TEAMS + 1, user_id=user_id, role="editor")
+        for user_id in range(1, USERS + 1)
+    )
+    db.add_all(
+        PDFFile(id=i, filename=f"{i}.pdf", file_path=f"/tmp/{i}.pdf",
+                owner_id=i % USERS + 1, team_id=i % TEAMS + 1)
+        for i in range(1, PDFS + 1)
+    )
+    db.flush()
+    db.add_all(
+        PDFTag(id=i, pdf_id=i % PDFS + 1, user_id=i % USERS + 1, page=i % 10 + 1,
+               content=f"note {i}", position={"x1": 0.1, "y1": 0.1, "x2": 0.2, "y2": 0.2},
+               bbox_x1=0.1, bbox_y1=0.1, bbox_x2=0.2, bbox_y2=0.2)
+        for i in range(1, TAGS + 1)
+    )
+    db.add_all(
+        Notification(user_id=i % USERS + 1, type="mention", message=f"알림 {i}", is_read=bool(i % 2))
+        for i in range(1, TAGS + 1)
+    )
+    db.commit()
+
+
+def _capture(db, query):
+    """조회 함수가 실행한 (SQL, 파라미터) 목록"""
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        query(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+    return statements
+
+
+def _sqlite_seq_scans(connection, statement, parameters):
+    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    scans = []
+    for row in rows:
+        detail = row[-1]
+        match = re.match(r"SCAN (\w+)", detail)
+        # "SCAN t USING INDEX"도 전체 인덱스를 훑으므로 순차 스캔과 같이 취급
+        if match and match.group(1) in HOT_TABLES:
+            scans.append(detail)
+    return scans
+
+
+def _postgres_seq_scans(connection, statement, parameters):
+    connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    rows = connection.exec_driver_sql(f"EXPLAIN {statement}", parameters).fetchall()
+    return [
+        row[0].strip() for row in rows
+        if (match := re.search(r"Seq Scan on (\w+)", row[0])) and match.group(1) in HOT_TABLES
+    ]
+
+
+@pytest.mark.parametrize("name", sorted(QUERIES))
+def test_hot_queries_use_indexes(plan_db, name):
+    statements = _capture(plan_db, QUERIES[name])
+    assert statements
+
+    find_scans = _postgres_seq_scans if plan_db.get_bind().dialect.name == "postgresql" else _sqlite_seq_scans
+    connection = plan_db.connection()
+    try:
+        for statement, parameters in statements:
+            assert find_scans(connection, statement, parameters) == [], statement
+    finally:
+        plan_db.rollback()
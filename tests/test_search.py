@@ -0,0 +1,52 @@
+# tests/test_search.py
+import asyncio
+
+from sqlalchemy.dialects import postgresql
+
+from app.models.tag import PDFFile, PDFPageText, PDFTag
+from app.models.user import User
+from app.services import search_service
+from app.services.search_index import InvertedIndex, make_snippet
+from app.services.search_service import _contains_all, _highlight, search_documents
+
+
+def test_index_matches_korean_words_with_particles():
+    index = InvertedIndex()
+    index.add(1, "데이터베이스를 정규화한다")
+    index.add(2, "네트워크 계층")
+    assert [key for key, _ in index.search("데이터베이스")] == [1]
+    assert [key for key, _ in index.search("베이스 정규")] == [1]
+    assert index.search("데이터베이스 계층") == []
+
+
+def test_snippet_escapes_source_text():
+    snippet = make_snippet('<img src=x onerror="alert(1)"> 데이터베이스를 설계', ["데이터베이스"])
+    assert "<img" not in snippet
+    assert "&lt;img" in snippet
+    assert "<b>데이터베이스를</b>" in snippet
+
+
+def test_headline_highlight_escapes_source_text():
+    raw = f"<script>x</script> {search_service.HIGHLIGHT_START}word{search_service.HIGHLIGHT_STOP}"
+    assert _highlight(raw) == "&lt;script&gt;x&lt;/script&gt; <b>word</b>"
+
+
+def test_postgres_condition_is_escaped_substring_match():
+    compiled = _contains_all(PDFTag.content, ["100_", "데이터"]).compile(dialect=postgresql.dialect())
+    assert str(compiled).count("ILIKE") == 2
+    assert sorted(compiled.params.values()) == ["%100\\_%", "%데이터%"]
+
+
+def test_search_documents_fallback_uses_substring_semantics(db):
+    db.add(User(id=1, username="kim"))
+    db.add(PDFFile(id=1, filename="db.pdf", file_path="/tmp/db.pdf", owner_id=1))
+    db.add(PDFTag(id=1, pdf_id=1, user_id=1, page=2, content="데이터베이스를 <b>정규화</b>"))
+    db.add(PDFPageText(id=1, pdf_id=1, page=3, content="관계형 데이터베이스의 개념"))
+    db.commit()
+
+    result = asyncio.run(search_documents(db, user_id=1, query="데이터베이스"))
+    assert result["total"] == 2
+    assert {hit["type"] for hit in result["hits"]} == {"annotation", "page"}
+    for hit in result["hits"]:
+        assert "<b>데이터베이스" in hit["snippet"]
+        assert "&lt;b&gt;정규화" in hit["snippet"] or hit["type"] == "page"
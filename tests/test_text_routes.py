@@ -0,0 +1,60 @@
+# tests/test_text_routes.py
+"""PDF 텍스트 인덱스 API: 소유자/팀 멤버만 접근 가능"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_current_user, get_db
+from app.api.v1.pdf_manager import text_routes
+from app.models.tag import PDFFile, PDFPageText
+from app.models.team import Team, TeamMember
+from app.models.user import User
+
+OWNER_ID, MEMBER_ID, OUTSIDER_ID = 1, 2, 3
+PERSONAL_PDF, TEAM_PDF = 1, 2
+
+
+@pytest.fixture
+def client(db):
+    db.add_all(User(id=i, username=f"user{i}") for i in (OWNER_ID, MEMBER_ID, OUTSIDER_ID))
+    db.add(Team(id=1, name="team", owner_id=OWNER_ID))
+    db.flush()
+    db.add(TeamMember(team_id=1, user_id=MEMBER_ID, role="viewer"))
+    db.add(PDFFile(id=PERSONAL_PDF, filename="a.pdf", file_path="/tmp/a.pdf", owner_id=OWNER_ID))
+    db.add(PDFFile(id=TEAM_PDF, filename="b.pdf", file_path="/tmp/b.pdf", owner_id=OWNER_ID, team_id=1))
+    db.flush()
+    db.add_all(PDFPageText(pdf_id=pdf_id, page=1, content="secret") for pdf_id in (PERSONAL_PDF, TEAM_PDF))
+    db.commit()
+
+    app = FastAPI()
+    app.include_router(text_routes.router)
+    app.dependency_overrides[get_db] = lambda: db
+    client = TestClient(app)
+
+    def as_user(user_id):
+        app.dependency_overrides[get_current_user] = lambda: db.get(User, user_id)
+        return client
+
+    return as_user
+
+
+@pytest.mark.parametrize("user_id, pdf_id, expected", [
+    (OWNER_ID, PERSONAL_PDF, 200),
+    (MEMBER_ID, PERSONAL_PDF, 403),
+    (OUTSIDER_ID, PERSONAL_PDF, 403),
+    (OWNER_ID, TEAM_PDF, 200),
+    (MEMBER_ID, TEAM_PDF, 200),
+    (OUTSIDER_ID, TEAM_PDF, 403),
+    (OWNER_ID, 99, 404),
+])
+def test_page_text_requires_access(client, user_id, pdf_id, expected):
+    response = client(user_id).get(f"/api/storage/pdfs/{pdf_id}/pages/1/text")
+    assert response.status_code == expected
+    if expected == 200:
+        assert response.json()["content"] == "secret"
+
+
+def test_outsider_cannot_reindex_or_read_progress(client):
+    outsider = client(OUTSIDER_ID)
+    assert outsider.post(f"/api/storage/pdfs/{TEAM_PDF}/text-index").status_code == 403
+    assert outsider.get(f"/api/storage/pdfs/{TEAM_PDF}/text-index").status_code == 403
@@ -0,0 +1,29 @@
+# tests/test_thumbnail_cache.py
+"""썸네일 캐시 사용량 집계: 같은 항목을 덮어써도 사용량이 부풀지 않아야 함"""
+from app.services.thumbnail_service import ThumbnailCache
+
+
+def test_overwriting_entry_keeps_usage_accurate(tmp_path):
+    cache = ThumbnailCache(tmp_path, max_bytes=10_000)
+    first = cache.entry_path("ab" * 32, 1, 0.25, "png")
+    second = cache.entry_path("cd" * 32, 1, 0.25, "png")
+
+    cache.write(first, b"x" * 100)   # 첫 저장은 디스크를 스캔하여 사용량 초기화
+    cache.write(second, b"y" * 300)
+    for _ in range(5):  # 동시 미스로 같은 항목이 여러 번 저장되는 경우
+        cache.write(first, b"z" * 200)
+
+    assert cache._total_bytes == cache.usage()["stored_bytes"] == 500
+
+
+def test_overwrite_does_not_trigger_early_eviction(tmp_path):
+    cache = ThumbnailCache(tmp_path, max_bytes=1_000)
+    entry = cache.entry_path("ab" * 32, 1, 0.25, "png")
+    other = cache.entry_path("cd" * 32, 1, 0.25, "png")
+
+    # 실제 사용량 950 bytes: 상한(1000) 이하이지만 정리 목표(900)는 넘는 상태
+    cache.write(other, b"y" * 475)
+    for _ in range(10):
+        cache.write(entry, b"x" * 475)
+
+    assert other.exists() and entry.exists()
@@ -0,0 +1,130 @@
+# tests/test_websocket_fanout.py
+"""여러 워커(ConnectionManager)가 Redis를 공유할 때 메시지가 워커 수에 비례해서만 오가는지 확인"""
+import asyncio
+import json
+from types import SimpleNamespace
+
+import fakeredis
+import pytest
+
+from app.core import redis_helper
+from app.core.websocket_manager import ConnectionManager
+
+ROOM_ID = "1"
+
+
+class FakeWebSocket:
+    """전송한 메시지를 기록하는 WebSocket 대체"""
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, payload: str):
+        self.sent.append(json.loads(payload))
+
+    async def close(self, code: int = 1000):
+        pass
+
+    def received(self, message_type: str) -> list:
+        return [message for message in self.sent if message.get("type") == message_type]
+
+
+async def _settle(condition, timeout: float = 3.0):
+    """조건을 만족할 때까지 수신 작업/전송 작업이 돌도록 대기"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "메시지 전달 대기 시간 초과"
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.05)  # 추가(중복) 전달이 있다면 드러나도록 잠시 더 대기
+
+
+async def _cluster(nodes: int):
+    """같은 Redis를 공유하는 워커 nodes개, 워커마다 같은 방에 사용자 1명씩 접속"""
+    server = fakeredis.FakeServer()
+    managers, sockets, users = [], [], []
+    for index in range(nodes):
+        manager = ConnectionManager(
+            fakeredis.aioredis.FakeRedis(server=server, decode_responses=True),
+            node_id=f"node-{index}"
+        )
+        user = SimpleNamespace(id=index + 1, username=f"user{index + 1}")
+        websocket = FakeWebSocket()
+        await manager.connect(websocket, ROOM_ID, user)
+        managers.append(manager)
+        sockets.append(websocket)
+        users.append(user)
+
+    # 입장 알림(system)이 모두 전달될 때까지 대기
+    await _settle(lambda: all(len(ws.received("system")) == nodes - i for i, ws in enumerate(sockets)))
+    return server, managers, sockets, users
+
+
+async def _shutdown(managers, sockets, users):
+    for manager, websocket, user in zip(managers, sockets, users):
+        await manager.disconnect(websocket, ROOM_ID, user)
+        await manager.close()
+
+
+def _totals(managers, key: str) -> int:
+    return sum(manager.stats()[key] for manager in managers)
+
+
+@pytest.mark.parametrize("nodes", [2, 4, 8])
+def test_broadcast_is_published_once_and_delivered_once_per_socket(nodes):
+    async def scenario():
+        _, managers, sockets, users = await _cluster(nodes)
+        published, received = _totals(managers, "published"), _totals(managers, "received_from_other_nodes")
+
+        for sender in managers:
+            await sender.broadcast_to_room(ROOM_ID, {"type": "chat", "from": sender.node_id})
+        await _settle(lambda: all(len(ws.received("chat")) == nodes for ws in sockets))
+
+        # 브로드캐스트 1건당 발행 1회, 다른 워커마다 수신 1회 (재발행/에코 없음)
+        assert _totals(managers, "published") - published == nodes
+        assert _totals(managers, "received_from_other_nodes") - received == nodes * (nodes - 1)
+        for websocket in sockets:
+            senders = sorted(message["from"] for message in websocket.received("chat"))
+            assert senders == sorted(manager.node_id for manager in managers)
+
+        await _shutdown(managers, sockets, users)
+
+    asyncio.run(scenario())
+
+
+def test_personal_message_reaches_user_on_another_node():
+    async def scenario():
+        _, managers, sockets, users = await _cluster(3)
+
+        await managers[0].send_personal_message({"type": "direct"}, str(users[2].id))
+        await _settle(lambda: sockets[2].received("direct"))
+
+        assert [len(ws.received("direct")) for ws in sockets] == [0, 0, 1]
+        await _shutdown(managers, sockets, users)
+
+    asyncio.run(scenario())
+
+
+def test_raw_notification_on_user_channel_is_forwarded(monkeypatch):
+    """서비스 계층이 워커 ID 없이 개인 채널에 발행한 알림도 소켓에 전달"""
+    async def scenario():
+        server, managers, sockets, users = await _cluster(3)
+        publisher = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+        monkeypatch.setattr(redis_helper, "get_redis_client", lambda: publisher)
+
+        await redis_helper.publish_messages([
+            (f"user:{users[1].id}", {"type": "notification", "notification_id": 7})
+        ])
+        await redis_helper.publish_message(f"user:{users[2].id}", {"type": "notification", "notification_id": 8})
+        await _settle(lambda: sockets[1].received("notification") and sockets[2].received("notification"))
+
+        assert [ws.received("notification") for ws in sockets] == [
+            [],
+            [{"type": "notification", "notification_id": 7}],
+            [{"type": "notification", "notification_id": 8}],
+        ]
+        await _shutdown(managers, sockets, users)
+
+    asyncio.run(scenario())